@@ -182,7 +182,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # main.py에서 파이프라인 모듈 임포트 (로그 파일 핸들러도 함께 초기화)
-from main import pipeline_state, run_pipeline, setup_logging
+from main import pipeline_state, run_pipeline, setup_logging, set_sink_status, get_sink_statuses, SINK_TIMEOUT_NOTION
+from prayer_record import from_json_shape, to_json_shape, serialize_processed_data
 setup_logging()
 
 # ── FastAPI 앱 생성 ──
@@ -195,6 +196,7 @@ app = FastAPI(
 # ── 비동기 스케줄러 & 스레드 풀 ──
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 # 전역 메모리 캐시 초기값 (기도제목 + 담당자배정 + 공통기도제목 통합)
 prayers_cache: Dict[str, Any] = {
@@ -210,21 +212,59 @@ prayers_cache: Dict[str, Any] = {
 # 스레드 풀: max_workers=2 (Render 무료 플랜 메모리 한도 최소화)
 executor = ThreadPoolExecutor(max_workers=2)
 
+# pandas-free 수집 경로: 시트 원본 값 → 제출자별 구조체로 바로 변환
+# (DataFrame 생성 및 pandas import 비용 제거 → 웹 프로세스 메모리 절약)
+API_PANDAS_FREE = os.getenv('API_PANDAS_FREE', 'false').lower() in ('1', 'true', 'yes')
 
-async def load_prayers_to_cache() -> None:
+
+def _cache_is_cold() -> bool:
+    """웜 스타트도 시트 로드도 아직 끝나지 않아 캐시가 비어 있는지"""
+    return prayers_cache["source"] == "empty"
+
+
+async def warm_start_cache() -> bool:
     """
-    구글 시트에서 기도제목 + 담당자배정 + 공통기도제목을 순차 로드하여 캐시 갱신.
-    ※ 순차 실행(병렬 ❌) → 메모리 최대 사용량 최소화
-    ※ google_sheets.py 싱글톤 서비스 재사용 → 중복 초기화 없음
+    구글 시트를 기다리지 않고 마지막 동기화 결과로 캐시를 먼저 채웁니다.
+    DATABASE_URL이 있으면 prayers / prayer_metadata 테이블에서, 없거나 실패하면 prayers_data.json에서 읽습니다.
+    (Render 배포 직후에는 파일 시스템이 비어 있으므로 DB가 유일한 웜 스타트 소스)
+
+    Returns:
+        bool: 캐시를 채웠는지 여부
     """
     global prayers_cache
+    import storage
 
-    # ─ 1. 빠른 부팅: 로컬 파일 캐시로 선(先)로드 ─
+    # ─ DB 스냅샷 ─
+    if storage.is_configured():
+        try:
+            loop = asyncio.get_running_loop()
+            snapshot = await loop.run_in_executor(executor, storage.load_snapshot)
+            if snapshot and snapshot["prayers_by_requester"]:
+                prayers_cache = {
+                    "source":                "database",
+                    "last_updated":          snapshot["last_updated"],
+                    "prayers_by_requester":  snapshot["prayers_by_requester"],
+                    "assignments":           snapshot["assignments"],
+                    "assignments_source":    "database",
+                    "common_prayers":        snapshot["common_prayers"],
+                    "common_prayers_source": "database",
+                }
+                logger.info(
+                    f"✅ 전역 메모리 캐시 선로드 성공 (DB 기준, 동기화 {snapshot['synced_at']}) — "
+                    f"기도제목: {len(prayers_cache['prayers_by_requester'])}명"
+                )
+                return True
+        except Exception as e:
+            logger.warning(f"DB 캐시 선로드 실패 (로컬 파일로 시도): {e}")
+
+    # ─ 로컬 파일 캐시 ─
     cache_file = 'prayers_data.json'
-    if os.path.exists(cache_file) and prayers_cache["source"] == "empty":
+    if os.path.exists(cache_file):
         try:
             with open(cache_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+            # 캐시에는 슬롯 기반 PrayerRecord로 보관 (JSON 형태는 응답 시에만 변환)
+            data["prayers_by_requester"] = from_json_shape(data.get("prayers_by_requester", {}))
             prayers_cache = {
                 "source":                "local_cache",
                 "assignments":           {},
@@ -234,42 +274,62 @@ async def load_prayers_to_cache() -> None:
                 **data
             }
             logger.info("✅ 전역 메모리 캐시 선로드 성공 (로컬 파일 기준)")
+            return True
         except Exception as e:
             logger.warning(f"로컬 파일 캐시 선로드 실패: {e}")
+    return False
+
 
-    # ─ 2. 구글 시트에서 3종 데이터 순차 로드 ─
+async def load_prayers_to_cache() -> None:
+    """
+    구글 시트에서 기도제목 + 담당자배정 + 공통기도제목을 batchGet 1회로 로드하여 캐시 갱신.
+    ※ 3개 범위를 한 번의 왕복으로 요청 → 지연 시간 및 Sheets 읽기 쿼터 사용량 최소화
+    ※ google_sheets.py 싱글톤 서비스 재사용 → 중복 초기화 없음
+    ※ 응답 스프레드시트가 따로 있거나 개별 로드로 전환되면 소스별 요청을 동시에 실행
+      (SHEETS_FETCH_CONCURRENCY, 소스별 제한 시간 SHEETS_FETCH_TIMEOUT)
+    ※ DB/로컬 파일 선로드(warm_start_cache)는 startup_event에서 한 번만 수행
+    """
+    global prayers_cache
+
+    # ─ 구글 시트에서 3종 데이터 일괄 로드 ─
     try:
-        from google_sheets import get_prayer_requests, get_assignments_from_sheet, get_common_prayers
-        from data_processor import process_prayer_requests
+        from google_sheets import get_all_sheet_data
+        from data_processor import process_prayer_requests, process_prayer_values
 
         loop = asyncio.get_running_loop()
+        process = process_prayer_values if API_PANDAS_FREE else process_prayer_requests
 
-        # 순차 ①: 기도제목 응답
         try:
-            df = await loop.run_in_executor(executor, get_prayer_requests)
-            processed_data: Dict[str, Any] = {}
-            if df is not None:
-                processed_data = await loop.run_in_executor(executor, process_prayer_requests, df) or {}
+            responses, common_prayers_result, assignments_result = await loop.run_in_executor(
+                executor, lambda: get_all_sheet_data(as_dataframe=not API_PANDAS_FREE)
+            )
         except Exception as e:
-            logger.error(f"기도제목 로드 오류: {e}")
-            processed_data = {}
-
-        # 순차 ②: 담당자 배정
-        try:
-            assignments_result = await loop.run_in_executor(executor, get_assignments_from_sheet)
-        except Exception as e:
-            logger.error(f"담당자 배정 로드 오류: {e}")
+            logger.error(f"구글 시트 일괄 로드 오류: {e}")
+            responses = None
             assignments_result = {"data": prayers_cache.get("assignments", {}), "source": "cache_fallback"}
+            common_prayers_result = {"data": prayers_cache.get("common_prayers", []), "source": "cache_fallback"}
 
-        # 순차 ③: 공통 기도제목
+        # 기도제목 응답 처리
         try:
-            common_prayers_result = await loop.run_in_executor(executor, get_common_prayers)
+            processed_data: Dict[str, Any] = {}
+            if responses is not None:
+                processed_data = await loop.run_in_executor(executor, process, responses) or {}
         except Exception as e:
-            logger.error(f"공통기도제목 로드 오류: {e}")
-            common_prayers_result = {"data": prayers_cache.get("common_prayers", []), "source": "cache_fallback"}
+            logger.error(f"기도제목 로드 오류: {e}")
+            processed_data = {}
+
+        # 시트를 못 읽었으면 선로드(DB/로컬 파일)한 기도제목을 빈 결과로 덮어쓰지 않고 유지
+        source = "memory_sync"
+        if not processed_data and prayers_cache.get("prayers_by_requester"):
+            logger.warning(f"구글 시트 기도제목을 가져오지 못해 기존 캐시({prayers_cache['source']})를 유지합니다.")
+            source = prayers_cache["source"]
+            processed_data = {
+                "last_updated":         prayers_cache.get("last_updated"),
+                "prayers_by_requester": prayers_cache["prayers_by_requester"],
+            }
 
         prayers_cache = {
-            "source":                "memory_sync",
+            "source":                source,
             "last_updated":          processed_data.get("last_updated"),
             "prayers_by_requester":  processed_data.get("prayers_by_requester", {}),
             "assignments":           assignments_result.get("data", {}),
@@ -288,6 +348,43 @@ async def load_prayers_to_cache() -> None:
         logger.error(f"구글 시트 캐시 동기화 실패: {e}")
 
 
+async def publish_cache_to_notion() -> None:
+    """
+    현재 캐시(기도제목 + 담당자배정 + 공통기도제목)를 Notion에 비동기로 게시합니다.
+    AsyncClient 기반이라 게시 동안 스레드 풀 워커를 점유하지 않으며, 파이프라인의 Notion 싱크와
+    같은 제한 시간(SINK_TIMEOUT_NOTION)을 넘기면 게시를 취소합니다 (다음 게시가 저널로 이어서 진행).
+    """
+    from config import config
+    if not config.notion.is_configured:
+        logger.info("Notion 설정이 없어 Notion 게시를 건너뜁니다.")
+        set_sink_status("notion", "SKIPPED")
+        return
+    # 처리에 실패해 비어 있는 캐시로 Notion 페이지를 덮어쓰지 않도록 보호
+    if not prayers_cache.get("last_updated") or not prayers_cache.get("prayers_by_requester"):
+        logger.warning("기도제목 캐시가 비어 있어 Notion 게시를 건너뜁니다.")
+        set_sink_status("notion", "SKIPPED", error="기도제목 캐시가 비어 있음")
+        return
+
+    from notion_publisher import publish_to_notion_async
+    started = time.monotonic()
+    set_sink_status("notion", "RUNNING", attempts=1)
+    try:
+        stats = await asyncio.wait_for(publish_to_notion_async(
+            prayers_cache,
+            common_prayers=prayers_cache.get("common_prayers") or None,
+            assignments=prayers_cache.get("assignments") or None,
+        ), SINK_TIMEOUT_NOTION if SINK_TIMEOUT_NOTION > 0 else None)
+        set_sink_status("notion", "SUCCESS", error=None, duration_sec=round(time.monotonic() - started, 2))
+        logger.info(f"Notion 비동기 게시 완료 ({stats.get('mode')}, API 호출 {stats.get('calls')}회)")
+    except asyncio.TimeoutError:
+        set_sink_status("notion", "TIMEOUT", error=f"{SINK_TIMEOUT_NOTION:g}초 제한 시간 초과",
+                        duration_sec=round(time.monotonic() - started, 2))
+        logger.warning(f"Notion 게시가 제한 시간({SINK_TIMEOUT_NOTION:g}초)을 넘어 취소되었습니다.")
+    except Exception as e:
+        set_sink_status("notion", "ERROR", error=str(e), duration_sec=round(time.monotonic() - started, 2))
+        logger.warning(f"Notion 업데이트 실패 (진행은 계속됩니다): {e}")
+
+
 async def refresh_cache_periodically() -> None:
     """15분마다 캐시를 자동 갱신하는 백그라운드 태스크"""
     while True:
@@ -301,11 +398,19 @@ async def refresh_cache_periodically() -> None:
 
 @app.on_event("startup")
 async def startup_event() -> None:
-    """서버 기동 시 캐시 초기 로드 + 주기적 갱신 루프 시작"""
+    """서버 기동 시 DB/로컬 파일로 캐시를 먼저 채우고, 구글 시트 동기화와 주기적 갱신 루프는 백그라운드로 시작"""
+    await warm_start_cache()
     asyncio.create_task(load_prayers_to_cache())
     asyncio.create_task(refresh_cache_periodically())
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """서버 종료 시 DB 연결 풀 정리"""
+    import storage
+    storage.close_pool()
+
+
 # ── CORS 설정 (프론트엔드 연동) ──
 app.add_middleware(
     CORSMiddleware,
@@ -378,6 +483,7 @@ async def get_status():
         last_run:            마지막 실행 시각 (ISO 형식)
         unmapped_requesters: 담당자 미지정 제출자 목록
         config_source:       설정 데이터 소스
+        sinks:               출력 싱크(json / postgres / notion)별 상태
         notion_page_id:      노션 페이지 ID
         timestamp:           현재 시각
     """
@@ -386,6 +492,7 @@ async def get_status():
         "last_run":            pipeline_state.get("last_run"),
         "unmapped_requesters": pipeline_state.get("unmapped_requesters", []),
         "config_source":       pipeline_state.get("config_source", "unknown"),
+        "sinks":               get_sink_statuses(),
         "notion_page_id":      os.getenv('NOTION_PAGE_ID', '1c50f7e0cd5f8025bb78c5c839f205f0'),
         "timestamp":           datetime.now().isoformat()
     }
@@ -417,15 +524,18 @@ async def trigger_pipeline(
             detail="파이프라인이 이미 실행 중입니다. 잠시 후 다시 시도해주세요."
         )
 
-    loop = asyncio.get_running_loop()
-
-    def _run_and_release():
-        """파이프라인 실행 후 Lock 해제 및 캐시 갱신"""
+    async def _run_and_release():
+        """파이프라인 실행(스레드) → 캐시 갱신 → Notion 비동기 게시 → Lock 해제"""
+        loop = asyncio.get_running_loop()
         try:
             logger.info("백그라운드 파이프라인 실행 시작")
-            success = run_pipeline()
+            # 시트 수집/처리/저장은 동기 코드이므로 스레드에서, Notion 게시는 이벤트 루프에서 진행
+            success = await loop.run_in_executor(
+                executor, partial(run_pipeline, pandas_free=API_PANDAS_FREE, publish_notion=False)
+            )
             if success:
-                asyncio.run_coroutine_threadsafe(load_prayers_to_cache(), loop)
+                await load_prayers_to_cache()
+                await publish_cache_to_notion()
         except Exception as e:
             logger.error(f"백그라운드 파이프라인 실행 오류: {e}")
         finally:
@@ -452,7 +562,119 @@ async def get_prayers(
     캐시는 서버 시작 시 및 15분마다 자동 갱신됩니다.
     /api/refresh 호출로 즉시 갱신할 수 있습니다. (관리자 전용)
     """
-    return prayers_cache
+    return serialize_processed_data(prayers_cache)
+
+
+# ══════════════════════════════════════════════════════════
+#  엔드포인트: GET /api/prayers/changes  ← ROLE_USER 이상 필요
+# ══════════════════════════════════════════════════════════
+@app.get("/api/prayers/changes")
+async def get_prayer_changes(
+    since: str,
+    _current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    since(ISO 형식 시각) 이후 DB 동기화에서 추가/변경된 기도제목을 반환합니다.
+    prayers.updated_at 인덱스로 조회하며, 삭제된 기도제목은 포함되지 않습니다. (DATABASE_URL 필요)
+    """
+    import storage
+    if not storage.is_configured():
+        raise HTTPException(status_code=503, detail="데이터베이스가 설정되지 않았습니다.")
+    try:
+        since_dt = datetime.fromisoformat(since)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="since는 ISO 형식 시각이어야 합니다. (예: 2024-01-01T00:00:00)")
+
+    loop = asyncio.get_running_loop()
+    prayers = await loop.run_in_executor(executor, storage.fetch_changed_since, since_dt)
+    return {
+        "since":   since_dt.isoformat(),
+        "count":   len(prayers),
+        "prayers": prayers,
+    }
+
+
+# ══════════════════════════════════════════════════════════
+#  엔드포인트: GET /api/prayers/requester/{requester}  ← ROLE_USER 이상 필요
+# ══════════════════════════════════════════════════════════
+@app.get("/api/prayers/requester/{requester}")
+async def get_requester_prayers(
+    requester: str,
+    _current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    제출자 한 명의 기도제목을 반환합니다.
+    메모리 캐시에서 찾고, 캐시가 아직 비어 있을 때(콜드 스타트)만 DATABASE_URL의 prayers(name) 인덱스로 조회합니다.
+    DB 조회가 실패하면 500 대신 캐시 기준으로 응답합니다.
+    """
+    prayers, source = None, None
+    if _cache_is_cold():
+        import storage
+        if storage.is_configured():
+            try:
+                loop = asyncio.get_running_loop()
+                prayers = await loop.run_in_executor(executor, storage.fetch_requester_prayers, requester)
+                source = "database"
+            except Exception as e:
+                logger.warning(f"제출자 '{requester}' DB 조회 실패 (캐시로 응답): {e}")
+
+    if source is None:
+        prayers = prayers_cache.get("prayers_by_requester", {}).get(requester, [])
+        source = prayers_cache.get("source", "empty")
+
+    return {
+        "requester": requester,
+        "source":    source,
+        "prayers":   to_json_shape({requester: prayers})[requester],
+    }
+
+
+# ══════════════════════════════════════════════════════════
+#  엔드포인트: GET /api/prayers/manager/{manager}  ← ROLE_USER 이상 필요
+# ══════════════════════════════════════════════════════════
+@app.get("/api/prayers/manager/{manager}")
+async def get_manager_prayers(
+    manager: str,
+    _current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    담당자 한 명이 맡은 제출자들의 기도제목을 담당 순서대로 반환합니다.
+    메모리 캐시의 담당자 배정과 기도제목으로 응답하고, 캐시가 아직 비어 있을 때(콜드 스타트)만
+    DATABASE_URL에서 마지막 동기화의 배정과 기도제목(prayers(name) 인덱스)을 조회합니다.
+    DB 조회가 실패하면 500 대신 캐시 기준으로 응답합니다.
+    """
+    assignees, prayers_by_requester, source = None, None, None
+    if _cache_is_cold():
+        import storage
+        if storage.is_configured():
+            try:
+                loop = asyncio.get_running_loop()
+                assignments = await loop.run_in_executor(executor, storage.fetch_assignments) or {}
+                assignees = assignments.get(manager)
+                if assignees is not None:
+                    prayers_by_requester = await loop.run_in_executor(
+                        executor, storage.fetch_prayers_for_requesters, list(assignees)
+                    )
+                source = "database"
+            except Exception as e:
+                logger.warning(f"담당자 '{manager}' DB 조회 실패 (캐시로 응답): {e}")
+                assignees = None
+
+    if source is None:
+        assignees = prayers_cache.get("assignments", {}).get(manager)
+        if assignees is not None:
+            cached = prayers_cache.get("prayers_by_requester", {})
+            prayers_by_requester = {requester: cached.get(requester, []) for requester in assignees}
+        source = prayers_cache.get("source", "empty")
+
+    if assignees is None:
+        raise HTTPException(status_code=404, detail=f"담당자 '{manager}'의 배정 정보가 없습니다.")
+
+    return {
+        "manager":              manager,
+        "source":               source,
+        "prayers_by_requester": to_json_shape(prayers_by_requester),
+    }
 
 
 # ══════════════════════════════════════════════════════════
@@ -477,6 +699,29 @@ async def force_refresh_cache(
     }
 
 
+# ══════════════════════════════════════════════════════════
+#  엔드포인트: GET /api/notion/plan  ← ROLE_ADMIN 필요
+# ══════════════════════════════════════════════════════════
+@app.get("/api/notion/plan")
+async def get_notion_publish_plan(
+    _current_admin: Dict[str, Any] = Depends(get_admin_user)
+):
+    """
+    현재 캐시를 지금 게시하면 필요한 Notion API 요청 수, 페이로드 크기, 예상 시간을 반환합니다.
+    Notion을 호출하거나 게시 상태를 바꾸지 않습니다. (관리자 전용)
+    """
+    if not prayers_cache.get("last_updated") or not prayers_cache.get("prayers_by_requester"):
+        raise HTTPException(status_code=503, detail="기도제목 캐시가 비어 있습니다.")
+
+    from notion_publisher import plan_publish_async
+    plan = await plan_publish_async(
+        prayers_cache,
+        common_prayers=prayers_cache.get("common_prayers") or None,
+        assignments=prayers_cache.get("assignments") or None,
+    )
+    return {**plan, "planned_at": datetime.now().isoformat()}
+
+
 # ══════════════════════════════════════════════════════════
 #  엔드포인트: GET /api/config  ← ROLE_USER 이상 필요
 # ══════════════════════════════════════════════════════════
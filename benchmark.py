@@ -0,0 +1,122 @@
+"""
+CBF 기도제목 자동화 V2 - 로컬 벤치마크 스크립트
+서비스 계정 없이 LocalSheetsBackend(합성 데이터)로 수집 → 처리 → API 직렬화 경로를 측정합니다.
+
+사용법:
+    python benchmark.py pipeline --rows 10000 100000 1000000
+    python benchmark.py sanitize --rows 100000
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+
+from sheets_backend import LocalSheetsBackend, set_sheets_backend
+from prayer_record import serialize_processed_data
+
+
+def _timed(func, *args, **kwargs):
+    """함수를 실행하고 (결과, 소요 시간(초))를 반환합니다."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def _print_row(label: str, rows: int, seconds: float):
+    rate = rows / seconds if seconds > 0 else float('inf')
+    print(f"  {label:<24} {seconds * 1000:>10.1f} ms   {rate:>14,.0f} rows/s")
+
+
+def bench_pipeline(row_counts: list, seed: int):
+    """수집(get_all_sheet_data) → 처리(process_prayer_requests) → API 직렬화 단계를 행 수별로 측정합니다."""
+    import google_sheets
+    from data_processor import process_prayer_requests
+
+    for n_rows in row_counts:
+        backend = LocalSheetsBackend.default()
+        title = google_sheets.RANGE_NAME.rpartition('!')[0].strip("'")
+        backend.load_synthetic_responses(title, n_rows, seed=seed)
+        set_sheets_backend(backend)
+
+        print(f"\n▶ {n_rows:,} rows")
+        (df, common_prayers_result, assignments_result), t_ingest = _timed(
+            google_sheets.get_all_sheet_data, incremental=False
+        )
+        _print_row("ingest (batch read)", n_rows, t_ingest)
+
+        processed_data, t_process = _timed(process_prayer_requests, df)
+        _print_row("process", n_rows, t_process)
+
+        cache = {
+            "source":                "memory_sync",
+            "last_updated":          processed_data.get("last_updated"),
+            "prayers_by_requester":  processed_data.get("prayers_by_requester", {}),
+            "assignments":           assignments_result["data"],
+            "common_prayers":        common_prayers_result["data"],
+        }
+        _, t_serialize = _timed(lambda: json.dumps(serialize_processed_data(cache), ensure_ascii=False))
+        _print_row("api serialize (json)", n_rows, t_serialize)
+        _print_row("total", n_rows, t_ingest + t_process + t_serialize)
+
+    set_sheets_backend(None)
+
+
+def bench_sanitize(row_counts: list, seed: int):
+    """필드별 정제 함수를 행마다 호출하는 방식(이전)과 sanitize_many 컬럼 일괄 정제(이후)를 비교합니다."""
+    from sheets_backend import generate_synthetic_responses
+    from utils import sanitize_many, sanitize_name, sanitize_text, sanitize_prayer_content
+
+    # (열 인덱스, 기존 함수, sanitize_many 모드) - 응답 시트 열 순서 기준
+    fields = [
+        (1, sanitize_name, 'name'),
+        (2, sanitize_text, 'text'),
+        (3, sanitize_name, 'name'),
+        (4, sanitize_text, 'text'),
+        (5, sanitize_text, 'text'),
+        (6, sanitize_text, 'text'),
+        (7, sanitize_prayer_content, 'prayer'),
+    ]
+
+    for n_rows in row_counts:
+        rows = generate_synthetic_responses(n_rows, seed=seed)[1:]
+        columns = [[row[idx] if idx < len(row) else '' for row in rows] for idx, _, _ in fields]
+
+        def per_field():
+            return [[func(val) for val in column] for column, (_, func, _) in zip(columns, fields)]
+
+        def batched():
+            return [sanitize_many(column, mode) for column, (_, _, mode) in zip(columns, fields)]
+
+        print(f"\n▶ {n_rows:,} rows × {len(fields)} fields")
+        before, t_before = _timed(per_field)
+        _print_row("before (per field)", n_rows, t_before)
+        after, t_after = _timed(batched)
+        _print_row("after (sanitize_many)", n_rows, t_after)
+        print(f"  {'identical output':<24} {before == after}   (x{t_before / t_after:.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CBF 기도제목 파이프라인 로컬 벤치마크")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    pipeline_parser = subparsers.add_parser('pipeline', help="수집 → 처리 → API 직렬화 경로 측정")
+    pipeline_parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000])
+    pipeline_parser.add_argument('--seed', type=int, default=0)
+
+    sanitize_parser = subparsers.add_parser('sanitize', help="정제 함수 마이크로 벤치마크 (이전/이후 비교)")
+    sanitize_parser.add_argument('--rows', type=int, nargs='+', default=[100000])
+    sanitize_parser.add_argument('--seed', type=int, default=0)
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.command == 'pipeline':
+        bench_pipeline(args.rows, args.seed)
+    elif args.command == 'sanitize':
+        bench_sanitize(args.rows, args.seed)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
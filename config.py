@@ -19,6 +19,7 @@ class GoogleSheetsConfig:
     responses_spreadsheet_id: str
     range_name: str
     service_account_file: str
+    backend: str  # google | local (sheets_backend.py)
     
     @classmethod
     def from_env(cls):
@@ -27,7 +28,8 @@ class GoogleSheetsConfig:
             spreadsheet_id=os.getenv('SPREADSHEET_ID', '1gYaj_juZ2TBU-aXOOwiHkl5N0vrF1CeaNLE29aftvlg'),
             responses_spreadsheet_id=os.getenv('RESPONSES_SPREADSHEET_ID', '1gYaj_juZ2TBU-aXOOwiHkl5N0vrF1CeaNLE29aftvlg'),
             range_name=os.getenv('RANGE_NAME', "'설문지 응답 시트1'!A:Z"),
-            service_account_file=os.getenv('SERVICE_ACCOUNT_FILE', 'cbf-praylist-11bbf27f1baa.json')
+            service_account_file=os.getenv('SERVICE_ACCOUNT_FILE', 'cbf-praylist-11bbf27f1baa.json'),
+            backend=os.getenv('SHEETS_BACKEND', 'google').lower()
         )
 
 @dataclass  
@@ -164,7 +166,8 @@ class AppConfig:
             if not self.notion.page_id:
                 errors.append("NOTION_PAGE_ID가 설정되지 않았습니다")
         
-        if not os.path.exists(self.google_sheets.service_account_file):
+        # 로컬 백엔드는 서비스 계정 없이 동작
+        if self.google_sheets.backend == 'google' and not os.path.exists(self.google_sheets.service_account_file):
             errors.append(f"서비스 계정 파일을 찾을 수 없습니다: {self.google_sheets.service_account_file}")
         
         if errors:
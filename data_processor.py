@@ -1,35 +1,64 @@
-import pandas as pd
+import os
+import json
+import hashlib
+import logging
+import threading
 from datetime import datetime
-from utils import sanitize_name, sanitize_prayer_content, sanitize_text
+from utils import sanitize_many
+from prayer_record import PrayerRecord
 
-def process_prayer_requests(df):
-    if df is None:
-        return None
-    
-    # 타임스탬프 문자열을 datetime으로 변환
-    def parse_korean_timestamp(ts):
-        try:
-            # "2025. 3. 28 오후 11:24:19" 형식의 문자열을 처리
-            date_part, time_part = ts.split(' 오')
-            year, month, day = map(int, date_part.replace(' ', '').rstrip('.').split('.'))
-            
-            if '후' in time_part:
-                time_str = time_part.replace('후 ', '')
-                hour, minute, second = map(int, time_str.split(':'))
-                hour = hour + 12 if hour != 12 else hour
-            else:  # '오전'
-                time_str = time_part.replace('전 ', '')
-                hour, minute, second = map(int, time_str.split(':'))
-                hour = hour if hour != 12 else 0
-                
-            return pd.Timestamp(year, month, day, hour, minute, second)
-        except Exception as e:
-            print(f"타임스탬프 파싱 오류: {e} - 입력값: {ts}")
-            return pd.NaT
-            
-    # ── 컬럼 매핑 표준화 (KeyError 원천 차단) ──
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# "2025. 3. 28 오후 11:24:19" 형식의 구글 폼 타임스탬프
+_KOREAN_TIMESTAMP_PATTERN = (
+    r'^\s*(?P<year>\d{4})\s*\.\s*(?P<month>\d{1,2})\s*\.\s*(?P<day>\d{1,2})\s*\.?'
+    r'\s+오(?P<meridiem>[전후])\s*(?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2})\s*$'
+)
+
+def parse_korean_timestamps(series):
+    """
+    한국어 타임스탬프 컬럼 전체를 한 번에 datetime으로 변환합니다.
+    (정규식 추출 + 단일 to_datetime 변환, 행별 apply 없음)
+
+    오전 12시는 0시, 오후 12시는 12시, 그 외 오후는 +12시간으로 변환합니다.
+    형식이 맞지 않거나 존재하지 않는 날짜/시각은 NaT가 됩니다.
+
+    Returns:
+        tuple: (datetime64 Series, 형식 오류로 NaT가 된 비어 있지 않은 값의 개수)
+    """
+    import pandas as pd
+
+    text = series.astype(str)
+    parts = text.str.extract(_KOREAN_TIMESTAMP_PATTERN)
+
+    components = parts[['year', 'month', 'day', 'hour', 'minute', 'second']].apply(
+        pd.to_numeric, errors='coerce'
+    )
+    is_pm = parts['meridiem'] == '후'
+    hour = components['hour']
+    components['hour'] = hour.mask(is_pm & (hour != 12), hour + 12).mask(~is_pm & (hour == 12), 0)
+
+    # 범위를 벗어난 시/분/초는 다음 날로 넘어가지 않도록 무효 처리
+    out_of_range = (components['hour'] > 23) | (components['minute'] > 59) | (components['second'] > 59)
+    components = components.mask(out_of_range)
+
+    parsed = pd.to_datetime(components, errors='coerce')
+    parsed.index = series.index
+
+    non_blank = series.notna() & (text.str.strip() != '')
+    failed_count = int((parsed.isna() & non_blank).sum())
+    return parsed, failed_count
+
+def _map_columns(columns) -> dict:
+    """
+    시트 헤더를 표준 필드명으로 매핑합니다 (설문 문항 문구가 조금 바뀌어도 KeyError 없이 동작).
+
+    Returns:
+        dict: {표준 필드명: 원본 컬럼명}
+    """
     col_mapping = {}
-    for col in df.columns:
+    for col in columns:
         col_str = str(col).strip()
         if '타임스탬프' in col_str:
             col_mapping['timestamp'] = col
@@ -47,58 +76,312 @@ def process_prayer_requests(df):
             col_mapping['prayer_content'] = col
         elif '교회' in col_str:
             col_mapping['church'] = col
+    return col_mapping
+
+def _empty_result() -> dict:
+    """'이름' 컬럼이 없을 때 반환하는 빈 구조체"""
+    return {
+        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'prayers_by_requester': {}
+    }
+
+def _sanitize_records(names: list, column_values) -> list:
+    """
+    컬럼별 원본 문자열 목록을 필드별 정제 함수로 한 번에 정제하여 행 순서대로 PrayerRecord 목록을 만듭니다.
+
+    Args:
+        names: 제출자 이름 원본 목록 (행 순서)
+        column_values: 표준 필드명을 받아 해당 컬럼의 원본 문자열 목록을 돌려주는 함수
+    """
+    names = sanitize_many(names, 'name')
+    target_names = sanitize_many(column_values('target_name'), 'name')
+    genders = sanitize_many(column_values('gender'), 'text')
+    ages = sanitize_many(column_values('age'), 'text')
+    relationships = sanitize_many(column_values('relationship'), 'text')
+    contents = sanitize_many(column_values('prayer_content'), 'prayer')
+    churches = sanitize_many(column_values('church'), 'text')
+    
+    return [
+        PrayerRecord(
+            names[idx], target_names[idx], genders[idx], ages[idx],
+            relationships[idx], contents[idx], churches[idx]
+        )
+        for idx in range(len(names))
+    ]
+
+def _group_by_requester(prayers: list) -> dict:
+    """행 순서의 기도제목 목록을 제출자 이름 오름차순(groupby와 동일)의 구조체로 묶습니다."""
+    # 작성자(이름)별 기도제목 (시트 순서 유지)
+    prayers_by_requester = {}
+    for prayer in prayers:
+        prayers_by_requester.setdefault(prayer.name, []).append(prayer)
+    
+    # 노션 페이지에 맞는 형식으로 데이터 변환
+    return {
+        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'prayers_by_requester': {
+            requester: prayers_by_requester[requester]
+            for requester in sorted(prayers_by_requester)
+        }
+    }
+
+def _build_prayers_by_requester(names: list, column_values) -> dict:
+    """컬럼 단위로 정제한 뒤 제출자별 구조체를 만듭니다."""
+    return _group_by_requester(_sanitize_records(names, column_values))
+
+def _dataframe_values(df) -> list:
+    """DataFrame → 헤더 포함 시트 원본 값 (NaN은 빈 문자열, 나머지는 문자열)"""
+    import pandas as pd
+
+    rows = [['' if pd.isna(val) else str(val) for val in row] for row in df.values.tolist()]
+    return [list(df.columns)] + rows
+
+def process_prayer_requests(df, incremental=None):
+    """
+    DataFrame(get_prayer_requests 결과)을 제출자별 기도제목 구조체로 변환합니다.
+
+    Args:
+        df: get_prayer_requests 결과 (타임스탬프 컬럼은 datetime으로 변환됩니다)
+        incremental: True이면 프로세스 공용 IncrementalPrayerProcessor로 변경된 행만 처리합니다.
+                     None이면 환경변수 INCREMENTAL_PROCESSING 설정을 따릅니다.
+    """
+    import pandas as pd
+
+    if df is None:
+        return None
+    if incremental is None:
+        incremental = INCREMENTAL_PROCESSING
+    # 타임스탬프 변환 전의 원본 값으로 증분 처리 (process_prayer_values와 같은 행 지문)
+    values = _dataframe_values(df) if incremental else None
+    
+    # ── 컬럼 매핑 표준화 (KeyError 원천 차단) ──
+    col_mapping = _map_columns(df.columns)
 
     # 타임스탬프 변환
     ts_col = col_mapping.get('timestamp', '타임스탬프')
     if ts_col in df.columns:
-        df[ts_col] = df[ts_col].apply(parse_korean_timestamp)
+        df[ts_col], failed_count = parse_korean_timestamps(df[ts_col])
+        if failed_count:
+            logger.warning(f"타임스탬프 파싱 실패: {failed_count}개 값을 NaT로 처리했습니다.")
+
+    if incremental:
+        return get_incremental_processor().process_values(values)
     
-    # 이름 정제 (공백 제거)
+    # 이름 컬럼 확인
     name_col = col_mapping.get('name', '이름')
-    if name_col in df.columns:
-        df[name_col] = df[name_col].apply(lambda x: sanitize_name(str(x)) if pd.notna(x) else '')
-    else:
+    if name_col not in df.columns:
         # 방어 코드: '이름' 컬럼이 없으면 빈 구조체 반환
-        return {
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M'),
-            'prayers_by_requester': {}
-        }
-    
-    # 작성자(이름)별로 그룹화
-    grouped_prayers = df.groupby(name_col)
+        return _empty_result()
     
-    # 노션 페이지에 맞는 형식으로 데이터 변환
-    processed_data = {
-        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M'),
-        'prayers_by_requester': {}
-    }
-    
-    # 안전하게 행 값을 꺼내오는 헬퍼 함수
-    def get_val(row, key, default=''):
-        col_name = col_mapping.get(key)
-        if col_name and col_name in row:
-            val = row[col_name]
-            return str(val) if pd.notna(val) else default
-        return default
+    # 컬럼 단위로 값을 꺼내 필드별 정제 함수를 한 번에 적용 (행별 Series 생성 없음)
+    def column_values(key, col_name=None):
+        col_name = col_name or col_mapping.get(key)
+        if col_name is None or col_name not in df.columns:
+            return [''] * len(df)
+        return ['' if pd.isna(val) else str(val) for val in df[col_name].tolist()]
     
-    for requester, group in grouped_prayers:
-        prayers = []
-        for _, row in group.iterrows():
-            # 기본 데이터 구성 - 필드별로 적절한 정제 함수 사용
-            prayer = {
-                'name': sanitize_name(str(requester)),  # 제출자 이름 정제
-                'target_name': sanitize_name(get_val(row, 'target_name')),
-                'gender': sanitize_text(get_val(row, 'gender')),
-                'age': sanitize_text(get_val(row, 'age')),
-                'relationship': sanitize_text(get_val(row, 'relationship')),
-                'prayer_content': sanitize_prayer_content(get_val(row, 'prayer_content')),
-                'church': sanitize_text(get_val(row, 'church'))
+    return _build_prayers_by_requester(column_values('name', name_col), column_values)
+
+def _values_column_getter(headers: list, rows: list):
+    """
+    시트 원본 값에서 표준 필드별 원본 문자열 목록을 꺼내는 함수를 만듭니다.
+    '이름' 컬럼을 찾지 못하면 None을 반환합니다.
+    """
+    col_index = {key: headers.index(col) for key, col in _map_columns(headers).items()}
+    if 'name' not in col_index:
+        if '이름' not in headers:
+            return None
+        col_index['name'] = headers.index('이름')
+
+    # 헤더 길이보다 짧은 행은 빈 문자열로 채운 것과 동일하게 처리
+    def column_values(key):
+        idx = col_index.get(key)
+        if idx is None:
+            return [''] * len(rows)
+        return [row[idx] if idx < len(row) else '' for row in rows]
+
+    return column_values
+
+def process_prayer_values(values, incremental=None):
+    """
+    pandas 없이 시트 원본 값(헤더 포함 2차원 리스트)을 바로 제출자별 구조체로 변환합니다.
+    컬럼 매핑과 정제 규칙은 process_prayer_requests와 같고 결과도 동일합니다.
+    (타임스탬프는 결과에 포함되지 않으므로 변환하지 않습니다.)
+
+    API 서버가 이 경로를 사용하면 웹 프로세스에서 pandas를 import하지 않아도 됩니다.
+
+    Args:
+        values: 헤더 포함 시트 원본 값
+        incremental: True이면 프로세스 공용 IncrementalPrayerProcessor로 변경된 행만 처리합니다.
+                     None이면 환경변수 INCREMENTAL_PROCESSING 설정을 따릅니다.
+    """
+    if incremental is None:
+        incremental = INCREMENTAL_PROCESSING
+    if incremental:
+        return get_incremental_processor().process_values(values)
+
+    if not values:
+        return None
+
+    rows = values[1:]
+    column_values = _values_column_getter(values[0], rows)
+    # 방어 코드: '이름' 컬럼이 없으면 빈 구조체 반환
+    if column_values is None:
+        return _empty_result()
+
+    return _build_prayers_by_requester(column_values('name'), column_values)
+
+
+# ============================================================
+# 행 지문 기반 증분 처리
+# ============================================================
+INCREMENTAL_PROCESSING = os.getenv('INCREMENTAL_PROCESSING', 'false').lower() in ('1', 'true', 'yes')
+PROCESSOR_STATE_FILE = os.getenv('PROCESSOR_STATE_FILE', '')
+
+def _row_fingerprint(row: list) -> str:
+    """응답 행 원본 셀 내용의 지문 (행 끝 빈 셀 유무와 무관하도록 정규화)"""
+    cells = list(row)
+    while cells and cells[-1] == '':
+        cells.pop()
+    return hashlib.blake2b('\x1f'.join(map(str, cells)).encode('utf-8'), digest_size=16).hexdigest()
+
+class IncrementalPrayerProcessor:
+    """
+    응답 행을 내용 지문으로 식별하여, 이전 실행 이후 새로 추가되거나 바뀐 행만 정제하고
+    사라진 행은 제거한 뒤 기존 prayers_by_requester 구조에 병합하는 처리기입니다.
+
+    - 같은 내용의 행이 여러 개면 "지문:등장순번"으로 구분합니다.
+    - 헤더(설문 문항)가 바뀌면 컬럼 매핑이 달라지므로 전체를 다시 처리합니다.
+    - 변경이 없는 제출자의 기도제목 목록은 이전 결과 객체를 그대로 재사용합니다.
+    결과는 process_prayer_values와 동일합니다 (last_updated 제외).
+    """
+
+    def __init__(self, state_file: str = ''):
+        self.state_file = state_file
+        self._lock = threading.Lock()
+        self._header_fingerprint = None
+        self._records = {}         # 행 키 → 정제된 PrayerRecord
+        self._requester_keys = {}  # 제출자 → 행 키 목록 (시트 순서)
+        self._prayers_by_requester = {}
+        self.last_stats = {}
+        if state_file:
+            self._load_state()
+
+    def reset(self):
+        """보관 중인 처리 결과를 모두 버립니다 (다음 실행은 전체 처리)."""
+        self._header_fingerprint = None
+        self._records = {}
+        self._requester_keys = {}
+        self._prayers_by_requester = {}
+
+    def process_values(self, values) -> dict:
+        """시트 원본 값(헤더 포함)을 증분 처리하여 processed_data 구조를 반환합니다."""
+        if not values:
+            return None
+
+        with self._lock:
+            headers, rows = values[0], values[1:]
+            header_fingerprint = _row_fingerprint(headers)
+            if header_fingerprint != self._header_fingerprint:
+                self.reset()
+                self._header_fingerprint = header_fingerprint
+
+            column_values = _values_column_getter(headers, rows)
+            if column_values is None:
+                self.reset()
+                return _empty_result()
+
+            # 1. 행 키 계산 (지문 + 같은 지문 내 등장순번)
+            keys = []
+            occurrences = {}
+            for row in rows:
+                fingerprint = _row_fingerprint(row)
+                occurrences[fingerprint] = occurrences.get(fingerprint, 0) + 1
+                keys.append(f"{fingerprint}:{occurrences[fingerprint]}")
+
+            # 2. 새로 추가/변경된 행만 정제
+            new_positions = [pos for pos, key in enumerate(keys) if key not in self._records]
+            if new_positions:
+                new_rows = [rows[pos] for pos in new_positions]
+                new_column_values = _values_column_getter(headers, new_rows)
+                new_prayers = _sanitize_records(new_column_values('name'), new_column_values)
+                for pos, prayer in zip(new_positions, new_prayers):
+                    self._records[keys[pos]] = prayer
+
+            # 3. 사라진 행 제거
+            current_keys = set(keys)
+            removed_keys = [key for key in self._records if key not in current_keys]
+            for key in removed_keys:
+                del self._records[key]
+
+            # 4. 제출자별 행 키 목록이 바뀐 제출자만 다시 구성하여 병합
+            requester_keys = {}
+            for key in keys:
+                requester_keys.setdefault(self._records[key].name, []).append(key)
+
+            prayers_by_requester = {}
+            rebuilt = 0
+            for requester in sorted(requester_keys):
+                requester_row_keys = requester_keys[requester]
+                if (requester in self._prayers_by_requester
+                        and self._requester_keys.get(requester) == requester_row_keys):
+                    prayers_by_requester[requester] = self._prayers_by_requester[requester]
+                else:
+                    prayers_by_requester[requester] = [self._records[key] for key in requester_row_keys]
+                    rebuilt += 1
+
+            self._requester_keys = requester_keys
+            self._prayers_by_requester = prayers_by_requester
+            self.last_stats = {
+                'total_rows': len(keys),
+                'processed_rows': len(new_positions),
+                'removed_rows': len(removed_keys),
+                'rebuilt_requesters': rebuilt
             }
-            
-            prayers.append(prayer)
-        
-        # 정제된 이름으로 저장
-        clean_requester = sanitize_name(str(requester))
-        processed_data['prayers_by_requester'][clean_requester] = prayers
-    
-    return processed_data 
\ No newline at end of file
+            logger.info(
+                f"증분 처리: 전체 {len(keys)}개 행 중 신규/변경 {len(new_positions)}개, "
+                f"삭제 {len(removed_keys)}개, 재구성 제출자 {rebuilt}명"
+            )
+
+            if self.state_file and (new_positions or removed_keys):
+                self._save_state()
+
+            return {
+                'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M'),
+                'prayers_by_requester': dict(prayers_by_requester)
+            }
+
+    # ── 상태 저장/복원 (선택 사항) ──
+    def _save_state(self):
+        tmp_file = f"{self.state_file}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'header_fingerprint': self._header_fingerprint,
+                    'records': {key: record.to_dict() for key, record in self._records.items()}
+                }, f, ensure_ascii=False)
+            os.replace(tmp_file, self.state_file)
+        except Exception as e:
+            logger.warning(f"증분 처리 상태 저장 실패: {e}")
+
+    def _load_state(self):
+        if not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self._header_fingerprint = state['header_fingerprint']
+            self._records = {key: PrayerRecord.from_dict(record) for key, record in state['records'].items()}
+            logger.info(f"증분 처리 상태 복원: {len(self._records)}개 행")
+        except Exception as e:
+            logger.warning(f"증분 처리 상태 복원 실패 (전체 처리로 전환): {e}")
+            self.reset()
+
+_incremental_processor = None
+
+def get_incremental_processor() -> IncrementalPrayerProcessor:
+    """프로세스 공용 증분 처리기를 싱글톤으로 반환합니다 (PROCESSOR_STATE_FILE 설정 시 상태 파일 사용)."""
+    global _incremental_processor
+    if _incremental_processor is None:
+        _incremental_processor = IncrementalPrayerProcessor(state_file=PROCESSOR_STATE_FILE)
+    return _incremental_processor
@@ -1,10 +1,17 @@
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-import pandas as pd
 from dotenv import load_dotenv
 import os
+import re
+import json
+import hashlib
+import time
 import logging
-from typing import Dict, List
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from concurrent.futures import CancelledError, ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from sheets_backend import get_sheets_backend
 
 load_dotenv()
 
@@ -18,12 +25,30 @@ RANGE_NAME = os.getenv('RANGE_NAME', "'설문지 응답 시트1'!A:Z")
 # 설정 시트명 상수 (config.py와 동기화)
 COMMON_PRAYERS_SHEET = '설정_공통기도제목'
 ASSIGNMENTS_SHEET = '설정_담당자배정'
+COMMON_PRAYERS_RANGE = f"'{COMMON_PRAYERS_SHEET}'!A:D"
+ASSIGNMENTS_RANGE = f"'{ASSIGNMENTS_SHEET}'!A:B"
+
+# 증분(tail) 수집 설정
+# 구글 폼 응답은 행이 뒤에 추가되기만 하므로, 이미 가져온 행은 로컬 행 저장소에 보관하고
+# 이후 실행에서는 새로 추가된 꼬리(tail) 범위만 요청합니다.
+INCREMENTAL_FETCH = os.getenv('SHEETS_INCREMENTAL_FETCH', 'false').lower() in ('1', 'true', 'yes')
+ROW_STORE_FILE = os.getenv('RESPONSES_ROW_STORE', 'responses_row_store.json')
+# 꼬리 범위와 첫 열(타임스탬프) 검사로 잡히지 않는 기존 행 수정까지 반영하기 위해
+# 마지막 전체 수집 후 N시간이 지나면 전체를 다시 수집 (0이면 주기적 전체 수집 안 함)
+SHEETS_FULL_REFETCH_HOURS = float(os.getenv('SHEETS_FULL_REFETCH_HOURS', '24'))
+
+# 수집 단계 동시 실행 설정
+# 서로 독립적인 읽기(설정/응답 스프레드시트, 개별 로더 fallback)를 최대 N개까지 동시에 요청 (1이면 순서대로)
+SHEETS_FETCH_CONCURRENCY = int(os.getenv('SHEETS_FETCH_CONCURRENCY', '3'))
+# 소스별 제한 시간(초). 넘기면 해당 소스만 실패로 보고 fallback 사용 (0이면 제한 없음)
+SHEETS_FETCH_TIMEOUT = float(os.getenv('SHEETS_FETCH_TIMEOUT', '30'))
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 # ── 싱글톤 서비스 캐시 (메모리 절약 핵심) ──
 _service_instance = None
+_credentials_instance = None
 
 def get_google_sheets_service():
     """
@@ -31,7 +56,7 @@ def get_google_sheets_service():
     최초 1회만 초기화하고 이후 재사용하여 메모리를 절약합니다.
     cache_discovery=False 로 discovery JSON 캐시 파일 생성을 방지합니다.
     """
-    global _service_instance
+    global _service_instance, _credentials_instance
     if _service_instance is not None:
         return _service_instance
 
@@ -47,54 +72,363 @@ def get_google_sheets_service():
         
         # cache_discovery=False: 디스크/메모리 discovery 캐시 비활성화 → 메모리 절약
         _service_instance = build('sheets', 'v4', credentials=credentials, cache_discovery=False)
+        _credentials_instance = credentials
         logger.info("Google Sheets 서비스 초기화 성공 (싱글톤)")
         return _service_instance
     except Exception as e:
         logger.error(f"Google Sheets 서비스 초기화 실패: {str(e)}")
         raise
 
-def get_prayer_requests():
-    """Google Sheets에서 기도제목 데이터를 가져옵니다."""
+def get_google_credentials():
+    """서비스 계정 인증 정보 (스레드별 연결을 만들 때 사용, 서비스 초기화 포함)"""
+    get_google_sheets_service()
+    return _credentials_instance
+
+# 수집 단계 공용 스레드 풀 (프로세스 전체에서 재사용)
+# GoogleSheetsBackend는 스레드마다 인증된 HTTP 연결을 만들어 재사용하므로, 작업 스레드를 계속 살려 두어야
+# 매 수집마다 새 연결(TLS 핸드셰이크)을 맺지 않습니다.
+_fetch_pool = None
+_fetch_pool_lock = threading.Lock()
+
+def _get_fetch_pool() -> ThreadPoolExecutor:
+    global _fetch_pool
+    with _fetch_pool_lock:
+        if _fetch_pool is None:
+            _fetch_pool = ThreadPoolExecutor(
+                max_workers=max(1, SHEETS_FETCH_CONCURRENCY), thread_name_prefix='sheets-fetch'
+            )
+        return _fetch_pool
+
+def _run_fetch_stage(fetches: Dict[str, Callable], fallbacks: Optional[Dict[str, Callable]] = None,
+                     concurrency: Optional[int] = None, timeout: Optional[float] = None) -> dict:
+    """
+    서로 독립적인 수집 함수를 공용 스레드 풀에서 최대 concurrency개까지 동시에 실행하고 {이름: 결과}를 반환합니다.
+    
+    - concurrency가 1이면 넣은 순서대로 하나씩 실행합니다 (기존 순차 동작).
+    - 소스마다 실행을 시작한 시점부터 timeout초 안에 끝나지 않거나 예외가 나면
+      fallbacks[이름]()의 결과를 쓰고, fallback이 없는 소스는 예외를 그대로 올립니다.
+      (제한 시간을 넘긴 요청의 결과는 버리며, 요청 자체는 HTTP 소켓 제한 시간 안에 끝납니다)
+    """
+    concurrency = max(1, SHEETS_FETCH_CONCURRENCY if concurrency is None else concurrency)
+    timeout = SHEETS_FETCH_TIMEOUT if timeout is None else timeout
+    fallbacks = fallbacks or {}
+    started = {}
+    # 넣은 순서대로 시작하되 동시에 실행 중인 수집은 concurrency개까지
+    turn = threading.Condition()
+    progress = {'next': 0, 'running': 0, 'aborted': False}
+    
+    def run(index: int, name: str, fetch: Callable):
+        with turn:
+            turn.wait_for(lambda: progress['aborted']
+                          or (progress['next'] == index and progress['running'] < concurrency))
+            if progress['aborted']:
+                raise CancelledError()
+            progress['next'] += 1
+            progress['running'] += 1
+            started[name] = time.monotonic()
+            turn.notify_all()
+        try:
+            return fetch()
+        finally:
+            with turn:
+                progress['running'] -= 1
+                turn.notify_all()
+    
+    pool = _get_fetch_pool()
+    futures = {name: pool.submit(run, index, name, fetch) for index, (name, fetch) in enumerate(fetches.items())}
     try:
-        service = get_google_sheets_service()
-        sheet = service.spreadsheets()
-        result = sheet.values().get(
-            spreadsheetId=RESPONSES_SPREADSHEET_ID,
-            range=RANGE_NAME
-        ).execute()
-        
-        values = result.get('values', [])
+        results = {}
+        for name, future in futures.items():
+            try:
+                while True:
+                    try:
+                        remaining = None
+                        if timeout > 0:
+                            start = started.get(name)
+                            remaining = timeout if start is None else max(0.0, start + timeout - time.monotonic())
+                        results[name] = future.result(timeout=remaining)
+                        break
+                    except FuturesTimeout:
+                        # 대기열에서 차례를 기다리던 시간은 제한 시간에 넣지 않음 (시작 시점부터 다시 계산)
+                        if name in started and time.monotonic() >= started[name] + timeout:
+                            raise TimeoutError(f"{timeout:g}초 안에 끝나지 않았습니다")
+            except Exception as e:
+                if name not in fallbacks:
+                    raise
+                logger.warning(f"{name} 수집 실패 (fallback 사용): {str(e)}")
+                results[name] = fallbacks[name]()
+        return results
+    finally:
+        # 예외로 빠져나가면 아직 시작하지 않은 수집은 취소 (차례를 기다리던 수집은 요청 없이 종료)
+        with turn:
+            progress['aborted'] = True
+            turn.notify_all()
+        for future in futures.values():
+            future.cancel()
+
+def _split_a1_range(range_name: str) -> Optional[tuple]:
+    """
+    "'시트명'!A:Z" 형식의 범위를 (시트 접두사, 시작 열, 끝 열)로 분리합니다.
+    열 전체 범위가 아니면 None을 반환합니다 (증분 수집 불가).
+    """
+    match = re.match(r"^(?P<sheet>.+!)?(?P<start>[A-Z]+)\d*:(?P<end>[A-Z]+)$", range_name.strip())
+    if not match:
+        return None
+    return match.group('sheet') or '', match.group('start'), match.group('end')
+
+def _header_fingerprint(headers: list) -> str:
+    """헤더 행의 지문(SHA-256)을 계산합니다. 설문 문항이 바뀌면 값이 달라집니다."""
+    return hashlib.sha256(json.dumps(headers, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def _load_row_store() -> Optional[dict]:
+    """로컬 행 저장소를 읽습니다. 대상 시트가 다르거나 손상된 경우 None을 반환합니다."""
+    if not os.path.exists(ROW_STORE_FILE):
+        return None
+    try:
+        with open(ROW_STORE_FILE, 'r', encoding='utf-8') as f:
+            store = json.load(f)
+    except Exception as e:
+        logger.warning(f"행 저장소 읽기 실패 (전체 수집으로 전환): {e}")
+        return None
+
+    if (store.get('spreadsheet_id') != RESPONSES_SPREADSHEET_ID
+            or store.get('range') != RANGE_NAME
+            or not store.get('values')
+            or store.get('row_count') != len(store['values'])):
+        return None
+    return store
+
+def _save_row_store(values: list, full_fetched_at: Optional[str] = None) -> None:
+    """
+    가져온 전체 행을 로컬 행 저장소에 원자적으로 저장합니다.
+
+    Args:
+        full_fetched_at: 마지막 전체 수집 시각 (None이면 지금 = 전체 수집 결과 저장)
+    """
+    store = {
+        'spreadsheet_id': RESPONSES_SPREADSHEET_ID,
+        'range': RANGE_NAME,
+        'header_fingerprint': _header_fingerprint(values[0]),
+        'row_count': len(values),
+        'updated_at': datetime.now().isoformat(),
+        'full_fetched_at': full_fetched_at or datetime.now().isoformat(),
+        'values': values
+    }
+    tmp_file = f"{ROW_STORE_FILE}.tmp"
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(store, f, ensure_ascii=False)
+        os.replace(tmp_file, ROW_STORE_FILE)
+    except Exception as e:
+        logger.warning(f"행 저장소 저장 실패: {e}")
+
+def _full_refetch_due(store: dict) -> bool:
+    """마지막 전체 수집 후 SHEETS_FULL_REFETCH_HOURS가 지났는지 (기록이 없으면 True)"""
+    if SHEETS_FULL_REFETCH_HOURS <= 0:
+        return False
+    try:
+        full_fetched_at = datetime.fromisoformat(store['full_fetched_at'])
+    except (KeyError, TypeError, ValueError):
+        return True
+    return (datetime.now() - full_fetched_at).total_seconds() >= SHEETS_FULL_REFETCH_HOURS * 3600
+
+def _first_column(rows: list) -> list:
+    """행 목록의 첫 열 값 (API 응답처럼 끝의 빈 값은 제외)"""
+    column = [row[0] if row else '' for row in rows]
+    while column and column[-1] == '':
+        column.pop()
+    return column
+
+def _tail_ranges(store: dict) -> Optional[list]:
+    """
+    증분 수집 요청 범위 목록(헤더 행, 꼬리 범위, 기존 행의 첫 열)을 만듭니다.
+
+    마지막으로 알고 있는 행을 겹쳐서 다시 요청하므로 (1) 요청 범위가 시트 크기를
+    벗어나지 않고 (2) 겹친 행이 저장소와 다르면 행 삭제/수정을 감지할 수 있습니다.
+    기존 행의 첫 열(타임스탬프, 폼에서 응답을 고치면 갱신됨)을 함께 받아
+    마지막 행이 그대로인 중간 행 삭제/수정도 감지합니다.
+    """
+    parts = _split_a1_range(RANGE_NAME)
+    if parts is None:
+        return None
+    sheet_prefix, start_col, end_col = parts
+    return [
+        f"{sheet_prefix}{start_col}1:{end_col}1",
+        f"{sheet_prefix}{start_col}{store['row_count']}:{end_col}",
+        f"{sheet_prefix}{start_col}1:{start_col}{store['row_count']}"
+    ]
+
+def _merge_tail(store: dict, range_values: list) -> Optional[list]:
+    """
+    _tail_ranges() 요청 결과(범위별 값 목록)를 저장소 행과 합쳐 전체 행 목록을 재구성합니다.
+    헤더 지문, 겹친 행, 기존 행의 첫 열 중 하나라도 일치하지 않으면 None을 반환합니다 (전체 수집 필요).
+    """
+    if len(range_values) != 3:
+        return None
+
+    header_rows = range_values[0]
+    if not header_rows or _header_fingerprint(header_rows[0]) != store['header_fingerprint']:
+        logger.info("응답 시트 헤더가 변경되어 전체 수집으로 전환합니다.")
+        return None
+
+    tail = range_values[1]
+    if not tail or tail[0] != store['values'][-1]:
+        logger.info("기존 행이 변경/삭제되어 전체 수집으로 전환합니다.")
+        return None
+
+    if _first_column(range_values[2]) != _first_column(store['values']):
+        logger.info("기존 행의 타임스탬프가 달라져(중간 행 변경/삭제) 전체 수집으로 전환합니다.")
+        return None
+
+    logger.info(f"증분 수집: 기존 {store['row_count'] - 1}개 행 + 신규 {len(tail) - 1}개 행")
+    values = store['values'] + tail[1:]
+    if len(values) != store['row_count']:
+        _save_row_store(values, full_fetched_at=store.get('full_fetched_at'))
+    return values
+
+def _fetch_full_response_values(save_store: bool) -> list:
+    """응답 시트 전체 범위를 가져오고, 필요하면 행 저장소를 갱신합니다."""
+    values = get_sheets_backend().read_range(RESPONSES_SPREADSHEET_ID, RANGE_NAME)
+
+    if save_store and values:
+        _save_row_store(values)
+    return values
+
+def fetch_response_values(incremental: Optional[bool] = None) -> list:
+    """
+    응답 시트의 원본 값(헤더 포함 2차원 리스트)을 가져옵니다.
+
+    Args:
+        incremental: True이면 로컬 행 저장소를 이용해 새로 추가된 행만 요청합니다.
+                     None이면 환경변수 SHEETS_INCREMENTAL_FETCH 설정을 따릅니다.
+    """
+    if incremental is None:
+        incremental = INCREMENTAL_FETCH
+
+    if incremental:
+        store = _load_row_store()
+        if store is not None and _full_refetch_due(store):
+            logger.info(f"마지막 전체 수집 후 {SHEETS_FULL_REFETCH_HOURS:g}시간이 지나 전체 수집합니다.")
+            store = None
+        ranges = _tail_ranges(store) if store is not None else None
+        if ranges is not None:
+            try:
+                range_values = get_sheets_backend().batch_read(RESPONSES_SPREADSHEET_ID, ranges)
+                values = _merge_tail(store, range_values)
+                if values is not None:
+                    return values
+            except Exception as e:
+                logger.warning(f"증분 수집 실패 (전체 수집으로 전환): {e}")
+
+    return _fetch_full_response_values(save_store=incremental)
+
+def _values_to_dataframe(values: list):
+    """헤더 포함 원본 값을 DataFrame으로 변환합니다."""
+    # pandas는 DataFrame 경로에서만 로드 (pandas-free 경로의 메모리 절약)
+    import pandas as pd
+
+    # 첫 번째 행을 헤더로 사용하여 DataFrame 생성
+    headers = values[0]
+    
+    # 빈 셀을 처리하기 위해 모든 행을 같은 길이로 맞춤
+    max_len = len(headers)
+    padded_values = []
+    for row in values[1:]:
+        padded_row = row + [''] * (max_len - len(row))
+        padded_values.append(padded_row)
+    
+    # DataFrame 생성
+    df = pd.DataFrame(padded_values, columns=headers)
+    
+    # 기본 필수 컬럼들 확인
+    required_columns = ['타임스탬프', '이름', '이름(구도자)']
+    for col in required_columns:
+        if col not in df.columns:
+            logger.warning(f"필수 열 '{col}'이(가) 스프레드시트에 존재하지 않습니다.")
+    
+    return df
+
+def get_prayer_values(incremental: Optional[bool] = None):
+    """
+    Google Sheets에서 기도제목 응답 원본 값(헤더 포함 2차원 리스트)을 가져옵니다.
+    DataFrame을 만들지 않으므로 data_processor.process_prayer_values와 함께 쓰면
+    pandas 없이 처리할 수 있습니다.
+
+    Args:
+        incremental: 증분(tail) 수집 여부 (None이면 SHEETS_INCREMENTAL_FETCH 설정 사용)
+    """
+    try:
+        values = fetch_response_values(incremental=incremental)
         if not values:
             logger.warning('스프레드시트에서 데이터를 찾을 수 없습니다.')
             return None
         
         logger.info(f"스프레드시트에서 {len(values)-1}개의 행을 가져왔습니다.")
+        return values
         
-        # 첫 번째 행을 헤더로 사용하여 DataFrame 생성
-        headers = values[0]
-        
-        # 빈 셀을 처리하기 위해 모든 행을 같은 길이로 맞춤
-        max_len = len(headers)
-        padded_values = []
-        for row in values[1:]:
-            padded_row = row + [''] * (max_len - len(row))
-            padded_values.append(padded_row)
-        
-        # DataFrame 생성
-        df = pd.DataFrame(padded_values, columns=headers)
-        
-        # 기본 필수 컬럼들 확인
-        required_columns = ['타임스탬프', '이름', '이름(구도자)']
-        for col in required_columns:
-            if col not in df.columns:
-                logger.warning(f"필수 열 '{col}'이(가) 스프레드시트에 존재하지 않습니다.")
+    except Exception as e:
+        logger.error(f"기도제목 데이터 가져오기 실패: {str(e)}")
+        return None
+
+def get_prayer_requests(incremental: Optional[bool] = None):
+    """
+    Google Sheets에서 기도제목 데이터를 가져옵니다.
+
+    Args:
+        incremental: 증분(tail) 수집 여부 (None이면 SHEETS_INCREMENTAL_FETCH 설정 사용)
+    """
+    try:
+        values = fetch_response_values(incremental=incremental)
+        if not values:
+            logger.warning('스프레드시트에서 데이터를 찾을 수 없습니다.')
+            return None
         
-        return df
+        logger.info(f"스프레드시트에서 {len(values)-1}개의 행을 가져왔습니다.")
+        return _values_to_dataframe(values)
         
     except Exception as e:
         logger.error(f"기도제목 데이터 가져오기 실패: {str(e)}")
         return None
 
+def _parse_common_prayers(values: list) -> dict:
+    """'설정_공통기도제목' 시트 원본 값을 결과 딕셔너리로 변환합니다 (실패 시 fallback)."""
+    if not values or len(values) < 2:
+        logger.warning("설정_공통기도제목 시트가 비어 있습니다. fallback을 사용합니다.")
+        return _get_common_prayers_fallback()
+    
+    headers = values[0]  # [순번, 기도제목, 활성화여부, 비고]
+    
+    # 헤더 인덱스 찾기
+    try:
+        idx_num = headers.index('순번')
+        idx_prayer = headers.index('기도제목')
+        idx_active = headers.index('활성화여부')
+    except ValueError as e:
+        logger.warning(f"설정_공통기도제목 시트 헤더 오류: {e}. fallback을 사용합니다.")
+        return _get_common_prayers_fallback()
+    
+    prayers = []
+    for row in values[1:]:
+        # 행 길이 패딩
+        padded = row + [''] * (len(headers) - len(row))
+        
+        active = padded[idx_active].strip().upper() if idx_active < len(padded) else ''
+        prayer_text = padded[idx_prayer].strip() if idx_prayer < len(padded) else ''
+        
+        # 활성화여부가 'Y'이고 기도제목이 있는 경우만 추가
+        if active == 'Y' and prayer_text:
+            prayers.append(prayer_text)
+    
+    if not prayers:
+        logger.warning("활성화된 공통 기도제목이 없습니다. fallback을 사용합니다.")
+        return _get_common_prayers_fallback()
+    
+    logger.info(f"구글 시트에서 {len(prayers)}개의 공통 기도제목을 로드했습니다.")
+    return {
+        'data': prayers,
+        'source': 'google_sheets'
+    }
+
 def get_common_prayers() -> dict:
     """
     '설정_공통기도제목' 시트에서 활성화된 기도제목을 가져옵니다.
@@ -106,52 +440,10 @@ def get_common_prayers() -> dict:
         }
     """
     try:
-        service = get_google_sheets_service()
-        sheet = service.spreadsheets()
-        
         # 설정_공통기도제목 시트 전체 읽기
-        result = sheet.values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"'{COMMON_PRAYERS_SHEET}'!A:D"
-        ).execute()
-        
-        values = result.get('values', [])
-        if not values or len(values) < 2:
-            logger.warning("설정_공통기도제목 시트가 비어 있습니다. fallback을 사용합니다.")
-            return _get_common_prayers_fallback()
-        
-        headers = values[0]  # [순번, 기도제목, 활성화여부, 비고]
+        values = get_sheets_backend().read_range(SPREADSHEET_ID, COMMON_PRAYERS_RANGE)
         
-        # 헤더 인덱스 찾기
-        try:
-            idx_num = headers.index('순번')
-            idx_prayer = headers.index('기도제목')
-            idx_active = headers.index('활성화여부')
-        except ValueError as e:
-            logger.warning(f"설정_공통기도제목 시트 헤더 오류: {e}. fallback을 사용합니다.")
-            return _get_common_prayers_fallback()
-        
-        prayers = []
-        for row in values[1:]:
-            # 행 길이 패딩
-            padded = row + [''] * (len(headers) - len(row))
-            
-            active = padded[idx_active].strip().upper() if idx_active < len(padded) else ''
-            prayer_text = padded[idx_prayer].strip() if idx_prayer < len(padded) else ''
-            
-            # 활성화여부가 'Y'이고 기도제목이 있는 경우만 추가
-            if active == 'Y' and prayer_text:
-                prayers.append(prayer_text)
-        
-        if not prayers:
-            logger.warning("활성화된 공통 기도제목이 없습니다. fallback을 사용합니다.")
-            return _get_common_prayers_fallback()
-        
-        logger.info(f"구글 시트에서 {len(prayers)}개의 공통 기도제목을 로드했습니다.")
-        return {
-            'data': prayers,
-            'source': 'google_sheets'
-        }
+        return _parse_common_prayers(values)
         
     except Exception as e:
         logger.warning(f"공통 기도제목 로드 실패 (fallback 사용): {str(e)}")
@@ -191,6 +483,50 @@ def _get_common_prayers_fallback() -> dict:
             'source': 'fallback_default'
         }
 
+def _parse_assignments(values: list) -> dict:
+    """'설정_담당자배정' 시트 원본 값을 결과 딕셔너리로 변환합니다 (실패 시 fallback)."""
+    if not values or len(values) < 2:
+        logger.warning("설정_담당자배정 시트가 비어 있습니다. fallback을 사용합니다.")
+        return _get_assignments_fallback()
+    
+    headers = values[0]  # [담당자, 제출자이름]
+    
+    # 헤더 인덱스 찾기
+    try:
+        idx_manager = headers.index('담당자')
+        idx_assignee = headers.index('제출자이름')
+    except ValueError as e:
+        logger.warning(f"설정_담당자배정 시트 헤더 오류: {e}. fallback을 사용합니다.")
+        return _get_assignments_fallback()
+    
+    assignments: Dict[str, List[str]] = {}
+    
+    for row in values[1:]:
+        padded = row + [''] * (len(headers) - len(row))
+        
+        manager = padded[idx_manager].strip() if idx_manager < len(padded) else ''
+        assignee_str = padded[idx_assignee].strip() if idx_assignee < len(padded) else ''
+        
+        if manager:
+            if manager not in assignments:
+                assignments[manager] = []
+            if assignee_str:
+                # 쉼표로 분리 후 양끝 공백 제거 및 빈 값 필터링
+                names = [name.strip() for name in assignee_str.split(',') if name.strip()]
+                for name in names:
+                    if name not in assignments[manager]:
+                        assignments[manager].append(name)
+    
+    if not assignments:
+        logger.warning("담당자 배정 데이터가 없습니다. fallback을 사용합니다.")
+        return _get_assignments_fallback()
+    
+    logger.info(f"구글 시트에서 {len(assignments)}명의 담당자 매핑을 로드했습니다.")
+    return {
+        'data': assignments,
+        'source': 'google_sheets'
+    }
+
 def get_assignments_from_sheet() -> dict:
     """
     '설정_담당자배정' 시트에서 담당자→제출자이름 딕셔너리를 가져옵니다.
@@ -202,57 +538,10 @@ def get_assignments_from_sheet() -> dict:
         }
     """
     try:
-        service = get_google_sheets_service()
-        sheet = service.spreadsheets()
-        
         # 설정_담당자배정 시트 전체 읽기
-        result = sheet.values().get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"'{ASSIGNMENTS_SHEET}'!A:B"
-        ).execute()
+        values = get_sheets_backend().read_range(SPREADSHEET_ID, ASSIGNMENTS_RANGE)
         
-        values = result.get('values', [])
-        if not values or len(values) < 2:
-            logger.warning("설정_담당자배정 시트가 비어 있습니다. fallback을 사용합니다.")
-            return _get_assignments_fallback()
-        
-        headers = values[0]  # [담당자, 제출자이름]
-        
-        # 헤더 인덱스 찾기
-        try:
-            idx_manager = headers.index('담당자')
-            idx_assignee = headers.index('제출자이름')
-        except ValueError as e:
-            logger.warning(f"설정_담당자배정 시트 헤더 오류: {e}. fallback을 사용합니다.")
-            return _get_assignments_fallback()
-        
-        assignments: Dict[str, List[str]] = {}
-        
-        for row in values[1:]:
-            padded = row + [''] * (len(headers) - len(row))
-            
-            manager = padded[idx_manager].strip() if idx_manager < len(padded) else ''
-            assignee_str = padded[idx_assignee].strip() if idx_assignee < len(padded) else ''
-            
-            if manager:
-                if manager not in assignments:
-                    assignments[manager] = []
-                if assignee_str:
-                    # 쉼표로 분리 후 양끝 공백 제거 및 빈 값 필터링
-                    names = [name.strip() for name in assignee_str.split(',') if name.strip()]
-                    for name in names:
-                        if name not in assignments[manager]:
-                            assignments[manager].append(name)
-        
-        if not assignments:
-            logger.warning("담당자 배정 데이터가 없습니다. fallback을 사용합니다.")
-            return _get_assignments_fallback()
-        
-        logger.info(f"구글 시트에서 {len(assignments)}명의 담당자 매핑을 로드했습니다.")
-        return {
-            'data': assignments,
-            'source': 'google_sheets'
-        }
+        return _parse_assignments(values)
         
     except Exception as e:
         logger.warning(f"담당자 배정 로드 실패 (fallback 사용): {str(e)}")
@@ -275,18 +564,100 @@ def _get_assignments_fallback() -> dict:
             'source': 'fallback_default'
         }
 
+def get_all_sheet_data(incremental: Optional[bool] = None, as_dataframe: bool = True) -> tuple:
+    """
+    응답 + 공통 기도제목 + 담당자 배정을 values().batchGet 한 번으로 가져옵니다.
+    (응답 스프레드시트가 설정 스프레드시트와 다르면 스프레드시트별 요청을 동시에 실행)
+
+    반환값은 기존 개별 로더와 같은 형태이며, fallback 의미도 동일합니다.
+    일괄 요청이 실패하거나 제한 시간(SHEETS_FETCH_TIMEOUT)을 넘기면 (예: 설정 시트 누락으로
+    전체 요청 400) 개별 로더를 동시에 실행하여 실패한 소스만 fallback 처리되도록 합니다.
+
+    Args:
+        incremental: 응답 시트 증분(tail) 수집 여부 (None이면 SHEETS_INCREMENTAL_FETCH 설정 사용)
+        as_dataframe: False이면 응답을 DataFrame 대신 원본 값(get_prayer_values 결과)으로 반환
+
+    Returns:
+        tuple: (get_prayer_requests() 결과 DataFrame 또는 None,
+                get_common_prayers() 결과 dict,
+                get_assignments_from_sheet() 결과 dict)
+    """
+    if incremental is None:
+        incremental = INCREMENTAL_FETCH
+
+    try:
+        backend = get_sheets_backend()
+
+        store = _load_row_store() if incremental else None
+        if store is not None and _full_refetch_due(store):
+            logger.info(f"마지막 전체 수집 후 {SHEETS_FULL_REFETCH_HOURS:g}시간이 지나 전체 수집합니다.")
+            store = None
+        tail_ranges = _tail_ranges(store) if store is not None else None
+        response_ranges = tail_ranges or [RANGE_NAME]
+        config_ranges = [COMMON_PRAYERS_RANGE, ASSIGNMENTS_RANGE]
+
+        if RESPONSES_SPREADSHEET_ID == SPREADSHEET_ID:
+            fetched = _run_fetch_stage({
+                'batch': lambda: backend.batch_read(SPREADSHEET_ID, config_ranges + response_ranges)
+            })
+            config_values, response_values = fetched['batch'][:2], fetched['batch'][2:]
+        else:
+            fetched = _run_fetch_stage({
+                'config': lambda: backend.batch_read(SPREADSHEET_ID, config_ranges),
+                'responses': lambda: backend.batch_read(RESPONSES_SPREADSHEET_ID, response_ranges)
+            })
+            config_values, response_values = fetched['config'], fetched['responses']
+    except Exception as e:
+        logger.warning(f"일괄 로드(batchGet) 실패, 개별 로드로 전환: {str(e)}")
+        load_responses = get_prayer_requests if as_dataframe else get_prayer_values
+        fetched = _run_fetch_stage(
+            {
+                'responses': lambda: load_responses(incremental=incremental),
+                'common_prayers': get_common_prayers,
+                'assignments': get_assignments_from_sheet
+            },
+            fallbacks={
+                'responses': lambda: None,
+                'common_prayers': _get_common_prayers_fallback,
+                'assignments': _get_assignments_fallback
+            }
+        )
+        return fetched['responses'], fetched['common_prayers'], fetched['assignments']
+
+    common_prayers_result = _parse_common_prayers(config_values[0])
+    assignments_result = _parse_assignments(config_values[1])
+
+    if tail_ranges:
+        values = _merge_tail(store, response_values)
+        if values is None:
+            # 헤더/겹친 행 불일치 → 응답 시트만 전체 재수집
+            try:
+                values = _fetch_full_response_values(save_store=True)
+            except Exception as e:
+                logger.error(f"기도제목 데이터 가져오기 실패: {str(e)}")
+                return None, common_prayers_result, assignments_result
+    else:
+        values = response_values[0]
+        if incremental and values:
+            _save_row_store(values)
+
+    if not values:
+        logger.warning('스프레드시트에서 데이터를 찾을 수 없습니다.')
+        return None, common_prayers_result, assignments_result
+
+    logger.info(f"일괄 로드 완료: 응답 {len(values)-1}개 행 (batchGet {1 if RESPONSES_SPREADSHEET_ID == SPREADSHEET_ID else 2}회)")
+    responses = _values_to_dataframe(values) if as_dataframe else values
+    return responses, common_prayers_result, assignments_result
+
 def update_assignments_in_sheet(assignments: dict) -> bool:
     """
     구글 시트의 '설정_담당자배정' 시트 내용을 주어진 딕셔너리로 업데이트합니다.
     """
     try:
-        service = get_google_sheets_service()
+        backend = get_sheets_backend()
         
         # 1. 기존 데이터 초기화 (A:B 범위)
-        service.spreadsheets().values().clear(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"'{ASSIGNMENTS_SHEET}'!A:B"
-        ).execute()
+        backend.clear(SPREADSHEET_ID, ASSIGNMENTS_RANGE)
         
         # 2. 업데이트할 행 데이터 만들기
         rows = [["담당자", "제출자이름"]]
@@ -295,12 +666,7 @@ def update_assignments_in_sheet(assignments: dict) -> bool:
             rows.append([manager, assignees_str])
             
         # 3. 데이터 쓰기
-        service.spreadsheets().values().update(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"'{ASSIGNMENTS_SHEET}'!A1",
-            valueInputOption="RAW",
-            body={"values": rows}
-        ).execute()
+        backend.write_range(SPREADSHEET_ID, f"'{ASSIGNMENTS_SHEET}'!A1", rows)
         
         logger.info(f"구글 시트의 '설정_담당자배정' 시트 업데이트 완료 ({len(assignments)}개 담당자)")
         return True
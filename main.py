@@ -1,14 +1,23 @@
-from google_sheets import get_prayer_requests, get_common_prayers, get_assignments_from_sheet
-from data_processor import process_prayer_requests
-from notion_publisher import publish_to_notion
+from google_sheets import get_prayer_requests, get_prayer_values, get_all_sheet_data
+from data_processor import process_prayer_requests, process_prayer_values
+from notion_publisher import publish_to_notion, plan_publish
 from utils import retry_on_failure, PipelineError, APIConnectionError
+from prayer_record import serialize_processed_data
 from config import config, PrayerAssignments
+import storage
 import logging
 import logging.handlers
 import os
+import argparse
 import traceback
 import sys
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Callable, Dict
 from filelock import FileLock, Timeout
 from dotenv import load_dotenv
 load_dotenv()
@@ -20,7 +29,8 @@ pipeline_state = {
     'status': 'IDLE',              # IDLE, RUNNING, ERROR, SUCCESS
     'last_run': None,              # 마지막 실행 시각 (ISO 형식 문자열)
     'unmapped_requesters': [],     # 담당자 미지정 제출자 목록
-    'config_source': 'unknown'    # 설정 데이터 소스 (google_sheets / fallback_default)
+    'config_source': 'unknown',   # 설정 데이터 소스 (google_sheets / fallback_default)
+    'sinks': {}                    # 출력 싱크별 상태 {이름: {status, attempts, duration_sec, error, updated_at}}
 }
 
 # 파이프라인 Lock 파일 경로
@@ -61,36 +71,31 @@ def setup_logging():
     root_logger.addHandler(file_handler)
 
 @retry_on_failure(max_retries=3, delay=2.0)
-def fetch_data_with_retry():
-    """재시도 로직이 적용된 데이터 수집"""
+def fetch_data_with_retry(pandas_free=False):
+    """
+    재시도 로직이 적용된 데이터 수집
+    
+    Args:
+        pandas_free: True이면 DataFrame 대신 원본 값(헤더 포함 2차원 리스트)을 반환
+    """
     logger = logging.getLogger(__name__)
     logger.info("구글 스프레드시트에서 데이터 수집 시작")
     
     try:
-        df = get_prayer_requests()
-        if df is None:
+        responses = get_prayer_values() if pandas_free else get_prayer_requests()
+        if responses is None:
             raise APIConnectionError("구글 스프레드시트에서 데이터를 가져올 수 없습니다")
         
-        logger.info(f"데이터 수집 완료: {len(df)}개 행")
-        return df
+        logger.info(f"데이터 수집 완료: {count_response_rows(responses)}개 행")
+        return responses
         
     except Exception as e:
         logger.error(f"데이터 수집 실패: {str(e)}")
         raise APIConnectionError(f"데이터 수집 실패: {str(e)}")
 
-@retry_on_failure(max_retries=2, delay=3.0)  
-def publish_with_retry(processed_data, common_prayers=None, assignments=None):
-    """재시도 로직이 적용된 Notion 게시"""
-    logger = logging.getLogger(__name__)
-    logger.info("Notion에 데이터 게시 시작")
-    
-    try:
-        publish_to_notion(processed_data, common_prayers=common_prayers, assignments=assignments)
-        logger.info("Notion 게시 완료")
-        
-    except Exception as e:
-        logger.error(f"Notion 게시 실패: {str(e)}")
-        raise APIConnectionError(f"Notion 게시 실패: {str(e)}")
+def count_response_rows(responses):
+    """응답 데이터(DataFrame 또는 헤더 포함 원본 값)의 데이터 행 수"""
+    return len(responses) - 1 if isinstance(responses, list) else len(responses)
 
 def generate_pipeline_report(processed_data, execution_time, assignments):
     """파이프라인 실행 보고서 생성"""
@@ -168,101 +173,222 @@ def validate_environment_for_pipeline(require_notion=False):
 import json
 
 def save_prayers_to_local_cache(processed_data):
-    """로컬 json 파일로 기도제목 데이터를 저장합니다."""
+    """
+    로컬 json 파일로 기도제목 데이터를 저장합니다.
+    API 서버가 같은 파일을 읽을 수 있으므로 임시 파일에 쓴 뒤 교체합니다. (실패 시 예외 발생)
+    """
     logger = logging.getLogger(__name__)
     cache_file = 'prayers_data.json'
-    try:
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(processed_data, f, ensure_ascii=False, indent=2)
-        logger.info(f"로컬 JSON 캐시 저장 성공: {cache_file}")
-    except Exception as e:
-        logger.error(f"로컬 JSON 캐시 저장 실패: {str(e)}")
+    tmp_file = f"{cache_file}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(serialize_processed_data(processed_data), f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, cache_file)
+    logger.info(f"로컬 JSON 캐시 저장 성공: {cache_file}")
         
-def save_prayers_to_db(processed_data, common_prayers, assignments):
-    """PostgreSQL 데이터베이스가 설정되어 있을 때 데이터를 저장하고 캐싱합니다."""
+def save_prayers_to_db(processed_data, common_prayers, assignments, timeout=None):
+    """
+    PostgreSQL 데이터베이스가 설정되어 있을 때 storage 모듈(연결 풀)로 증분 동기화합니다. (실패 시 예외 발생)
+    timeout(초)을 넘기면 동기화를 취소하고 TimeoutError를 던집니다.
+    
+    Returns:
+        dict: rows, inserted, updated, deleted, unchanged, seconds, rows_per_sec
+              (DATABASE_URL이 없으면 None)
+    """
     logger = logging.getLogger(__name__)
-    db_url = os.getenv('DATABASE_URL')
-    if not db_url:
+    if not storage.is_configured():
         logger.info("DATABASE_URL이 설정되지 않아 데이터베이스 저장을 생략합니다.")
-        return
-    
-    # Render postgresql scheme 대응
-    if db_url.startswith("postgres://"):
-        db_url = db_url.replace("postgres://", "postgresql://", 1)
-        
+        return None
+    return storage.sync_prayers(processed_data, common_prayers=common_prayers, assignments=assignments,
+                                timeout=timeout)
+
+# ============================================================
+# 출력 싱크 (처리 결과를 JSON 캐시 / DB / Notion 등에 내보내는 대상)
+# ============================================================
+# 싱크끼리는 서로 독립적이므로 스레드 풀에서 동시에 실행합니다.
+# 싱크마다 제한 시간·재시도 정책·상태(pipeline_state['sinks'])를 따로 두어
+# 느린 Notion 게시가 JSON 캐시 저장을 늦추거나, 한 싱크의 실패가 다른 싱크에 번지지 않게 합니다.
+# 제한 시간은 write가 직접 지키고(Notion: 게시 취소, DB: 문장 취소), run_sinks는 모든 싱크가
+# 끝날 때까지 기다리므로 호출자가 잡은 파이프라인 Lock은 싱크가 상태/저널을 쓰는 동안 유지됩니다.
+SINK_TIMEOUT_JSON = float(os.getenv('SINK_TIMEOUT_JSON', '30'))
+SINK_TIMEOUT_POSTGRES = float(os.getenv('SINK_TIMEOUT_POSTGRES', '120'))
+SINK_TIMEOUT_NOTION = float(os.getenv('SINK_TIMEOUT_NOTION', '900'))
+# 실패(ERROR/TIMEOUT)하면 파이프라인도 실패로 끝나는 싱크 (쉼표 구분)
+SINKS_REQUIRED = {name.strip() for name in os.getenv('SINKS_REQUIRED', 'json').split(',') if name.strip()}
+
+@dataclass
+class Sink:
+    """
+    processed_data를 내보내는 출력 대상 하나
+
+    write(processed_data, common_prayers, assignments, timeout)를 호출하며 실패하면 예외를 던져야 합니다.
+    timeout은 재시도를 포함한 전체 제한 시간(초, 0이면 제한 없음)이고, write에는 남은 시간(없으면 None)을
+    넘기므로 write는 그 안에 끝나거나 TimeoutError(asyncio.TimeoutError 포함)를 던져야 합니다.
+    enabled()가 False이면 이번 실행에서 건너뛰고, required이면 실패 시 파이프라인도 실패합니다.
+    """
+    name: str
+    write: Callable
+    timeout: float = 60.0
+    max_retries: int = 0
+    retry_delay: float = 1.0
+    backoff: float = 2.0
+    enabled: Callable = lambda: True
+    required: bool = False
+    # 같은 싱크를 겹쳐 돌리지 않음 (Lock 없이 run_sinks를 호출하는 경우 대비)
+    _busy: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+SINKS: Dict[str, Sink] = {}
+_sink_state_lock = threading.Lock()
+
+def register_sink(sink: Sink) -> Sink:
+    """싱크를 등록합니다. (같은 이름이면 교체, 등록 순서대로 실행)"""
+    SINKS[sink.name] = sink
+    return sink
+
+def set_sink_status(name: str, status: str, **fields):
+    """
+    pipeline_state['sinks'][name] 상태를 갱신합니다.
+    status: PENDING | RUNNING | SUCCESS | ERROR | TIMEOUT | SKIPPED | BUSY | DEFERRED
+    (API 서버가 이벤트 루프에서 직접 진행하는 Notion 게시도 이 함수로 상태를 남깁니다)
+    """
+    with _sink_state_lock:
+        entry = pipeline_state.setdefault('sinks', {}).setdefault(name, {})
+        entry.update(fields, status=status, updated_at=datetime.now().isoformat())
+
+def get_sink_statuses() -> dict:
+    """싱크 상태 사본 (스레드가 갱신하는 중에도 안전하게 직렬화할 수 있도록)"""
+    with _sink_state_lock:
+        return {name: dict(entry) for name, entry in pipeline_state.get('sinks', {}).items()}
+
+def _run_sink(sink: Sink, processed_data, common_prayers, assignments) -> str:
+    """
+    싱크 1개 실행 (스레드 풀 워커). 재시도 정책대로 write를 반복하고 최종 상태를 기록·반환합니다.
+    제한 시간을 넘기면(TimeoutError) 재시도하지 않고 TIMEOUT으로 끝냅니다.
+    """
+    logger = logging.getLogger(__name__)
+    started = time.monotonic()
+    delay = sink.retry_delay
     try:
-        import psycopg2
-        from psycopg2.extras import Json
-        conn = psycopg2.connect(db_url)
-        cur = conn.cursor()
-        
-        # 1. 테이블 DDL 자동 생성
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS prayers (
-                id SERIAL PRIMARY KEY,
-                name VARCHAR(100),
-                target_name VARCHAR(100),
-                gender VARCHAR(20),
-                age VARCHAR(50),
-                relationship VARCHAR(100),
-                prayer_content TEXT,
-                church VARCHAR(100),
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS prayer_metadata (
-                key VARCHAR(50) PRIMARY KEY,
-                value JSONB,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        conn.commit()
-        
-        # 2. 기존 개별 기도제목 데이터 제거 및 신규 삽입
-        cur.execute("TRUNCATE TABLE prayers;")
-        
-        count = 0
-        for requester, items in processed_data.get('prayers_by_requester', {}).items():
-            for item in items:
-                cur.execute("""
-                    INSERT INTO prayers (name, target_name, gender, age, relationship, prayer_content, church)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s);
-                """, (
-                    item.get('name', ''),
-                    item.get('target_name', ''),
-                    item.get('gender', ''),
-                    item.get('age', ''),
-                    item.get('relationship', ''),
-                    item.get('prayer_content', ''),
-                    item.get('church', '')
-                ))
-                count += 1
-                
-        # 3. 메타데이터 저장 (공통기도제목, 담당자 매핑, 마지막 동기화 등)
-        metadata = {
-            'last_updated': processed_data.get('last_updated'),
-            'common_prayers': common_prayers,
-            'assignments': assignments
-        }
-        cur.execute("""
-            INSERT INTO prayer_metadata (key, value, updated_at)
-            VALUES ('sync_info', %s, CURRENT_TIMESTAMP)
-            ON CONFLICT (key) DO UPDATE 
-            SET value = EXCLUDED.value, updated_at = CURRENT_TIMESTAMP;
-        """, (Json(metadata),))
+        for attempt in range(1, sink.max_retries + 2):
+            set_sink_status(sink.name, 'RUNNING', attempts=attempt)
+            remaining = sink.timeout - (time.monotonic() - started) if sink.timeout > 0 else None
+            try:
+                sink.write(processed_data, common_prayers, assignments, timeout=remaining)
+                break
+            except (TimeoutError, asyncio.TimeoutError):
+                raise
+            except Exception as e:
+                out_of_time = sink.timeout > 0 and time.monotonic() - started + delay >= sink.timeout
+                if attempt > sink.max_retries or out_of_time:
+                    raise
+                logger.warning(f"싱크 '{sink.name}' 실패 (시도 {attempt}/{sink.max_retries + 1}): {str(e)}. {delay}초 후 재시도...")
+                time.sleep(delay)
+                delay *= sink.backoff
         
-        conn.commit()
-        cur.close()
-        conn.close()
-        logger.info(f"데이터베이스 저장 완료: 총 {count}개 기도제목 삽입됨.")
+        set_sink_status(sink.name, 'SUCCESS', error=None,
+                        duration_sec=round(time.monotonic() - started, 2))
+        return 'SUCCESS'
+    except (TimeoutError, asyncio.TimeoutError):
+        set_sink_status(sink.name, 'TIMEOUT', error=f"{sink.timeout:g}초 제한 시간 초과",
+                        duration_sec=round(time.monotonic() - started, 2))
+        return 'TIMEOUT'
     except Exception as e:
-        logger.error(f"데이터베이스 저장 중 오류 발생: {str(e)}")
+        set_sink_status(sink.name, 'ERROR', error=str(e),
+                        duration_sec=round(time.monotonic() - started, 2))
+        logger.warning(f"   싱크 '{sink.name}' 실패: {str(e)}")
+        return 'ERROR'
+    finally:
+        sink._busy.release()
+
+def run_sinks(processed_data, common_prayers=None, assignments=None, deferred=()) -> Dict[str, str]:
+    """
+    등록된 싱크를 동시에 실행하고 모두 끝나면 {싱크 이름: 최종 상태}를 반환합니다.
+    싱크의 실패/시간 초과는 로그와 상태로만 남기고 예외를 던지지 않습니다.
+    (필수 싱크의 실패 여부는 호출자가 failed_required_sinks로 판단)
+    
+    Args:
+        deferred: 호출자가 따로 실행할 싱크 이름 (상태만 DEFERRED로 기록)
+    """
+    logger = logging.getLogger(__name__)
+    results = {}
+    running = []
+    
+    pool = ThreadPoolExecutor(max_workers=max(1, len(SINKS)), thread_name_prefix='sink')
+    try:
+        for sink in SINKS.values():
+            if sink.name in deferred:
+                set_sink_status(sink.name, 'DEFERRED')
+                results[sink.name] = 'DEFERRED'
+            elif not sink.enabled():
+                set_sink_status(sink.name, 'SKIPPED')
+                results[sink.name] = 'SKIPPED'
+            elif not sink._busy.acquire(blocking=False):
+                logger.warning(f"싱크 '{sink.name}': 이전 실행이 아직 진행 중이라 이번 실행을 건너뜁니다.")
+                set_sink_status(sink.name, 'BUSY')
+                results[sink.name] = 'BUSY'
+            else:
+                set_sink_status(sink.name, 'PENDING', attempts=0, error=None)
+                future = pool.submit(_run_sink, sink, processed_data, common_prayers, assignments)
+                running.append((sink, future))
+        
+        # 제한 시간은 write가 지키므로 끝날 때까지 기다림 (동시에 시작하므로 순서대로 기다려도 됨)
+        for sink, future in running:
+            results[sink.name] = future.result()
+            if results[sink.name] == 'SUCCESS':
+                logger.info(f"   싱크 '{sink.name}' 완료")
+            elif results[sink.name] == 'TIMEOUT':
+                logger.warning(f"   싱크 '{sink.name}' 제한 시간({sink.timeout:g}초) 초과로 취소")
+    finally:
+        pool.shutdown(wait=True)
+    
+    return {name: results[name] for name in SINKS if name in results}
+
+def failed_required_sinks(sink_results: Dict[str, str]) -> list:
+    """run_sinks 결과 중 실패(ERROR/TIMEOUT)한 필수 싱크 이름"""
+    return [
+        name for name, status in sink_results.items()
+        if status in ('ERROR', 'TIMEOUT') and name in SINKS and SINKS[name].required
+    ]
+
+# ── 기본 싱크 ──
+# Notion 게시는 재시도 시 게시 저널을 재생해 직전 시도에서 끝난 작업을 건너뛰고 이어서 게시합니다.
+register_sink(Sink(
+    name='json',
+    write=lambda processed_data, common_prayers, assignments, timeout: save_prayers_to_local_cache(processed_data),
+    timeout=SINK_TIMEOUT_JSON,
+    max_retries=1,
+    required='json' in SINKS_REQUIRED
+))
+register_sink(Sink(
+    name='postgres',
+    write=save_prayers_to_db,
+    timeout=SINK_TIMEOUT_POSTGRES,
+    max_retries=2,
+    retry_delay=2.0,
+    enabled=storage.is_configured,
+    required='postgres' in SINKS_REQUIRED
+))
+register_sink(Sink(
+    name='notion',
+    write=lambda processed_data, common_prayers, assignments, timeout: publish_to_notion(
+        processed_data, common_prayers=common_prayers, assignments=assignments, timeout=timeout
+    ),
+    timeout=SINK_TIMEOUT_NOTION,
+    max_retries=2,
+    retry_delay=3.0,
+    enabled=lambda: config.notion.is_configured,
+    required='notion' in SINKS_REQUIRED
+))
 
-def run_pipeline():
+def run_pipeline(pandas_free=False, publish_notion=True):
     """
     메인 파이프라인 실행 함수
     전역 pipeline_state를 업데이트하며 중복 실행 방지를 위해 FileLock 사용
+    
+    Args:
+        pandas_free: True이면 DataFrame을 만들지 않고 원본 값에서 바로 처리
+                     (API 서버 프로세스에서 pandas import를 피하기 위함)
+        publish_notion: False이면 Notion 싱크를 실행하지 않고 DEFERRED로 표시
+                        (API 서버는 이벤트 루프에서 publish_to_notion_async를 직접 await)
     """
     global pipeline_state
     logger = logging.getLogger(__name__)
@@ -279,19 +405,18 @@ def run_pipeline():
         
         # 1. 설정 검증 (Notion 필수 해제)
         logger.info("1️⃣ 설정 및 환경변수 검증")
-        has_notion = config.notion.is_configured
         config.validate(require_notion=False)
         validate_environment_for_pipeline(require_notion=False)
         
-        # 2. 동적 설정 로드 (구글 시트에서)
-        logger.info("2️⃣ 구글 시트에서 설정 데이터 로드")
+        # 2. 동적 설정 + 응답 일괄 로드 (batchGet 1회)
+        logger.info("2️⃣ 구글 시트에서 설정 및 응답 데이터 일괄 로드")
+        
+        responses, common_prayers_result, assignments_result = get_all_sheet_data(as_dataframe=not pandas_free)
         
-        common_prayers_result = get_common_prayers()
         common_prayers = common_prayers_result['data']
         common_prayers_source = common_prayers_result['source']
         logger.info(f"   공통 기도제목: {len(common_prayers)}개 ({common_prayers_source})")
         
-        assignments_result = get_assignments_from_sheet()
         assignments = assignments_result['data']
         assignments_source = assignments_result['source']
         logger.info(f"   담당자 배정: {len(assignments)}명 ({assignments_source})")
@@ -302,30 +427,32 @@ def run_pipeline():
         else:
             pipeline_state['config_source'] = f"mixed ({common_prayers_source}/{assignments_source})"
         
-        # 3. 데이터 수집
+        # 3. 데이터 수집 (일괄 로드에서 응답을 못 가져온 경우에만 재시도 수집)
         logger.info("3️⃣ 구글 스프레드시트 데이터 수집")
-        df = fetch_data_with_retry()
+        if responses is None:
+            responses = fetch_data_with_retry(pandas_free=pandas_free)
+        else:
+            logger.info(f"데이터 수집 완료: {count_response_rows(responses)}개 행")
         
         # 4. 데이터 처리
         logger.info("4️⃣ 데이터 처리 및 변환")
-        processed_data = process_prayer_requests(df)
+        if pandas_free:
+            processed_data = process_prayer_values(responses)
+        else:
+            processed_data = process_prayer_requests(responses)
         if processed_data is None:
             raise PipelineError("데이터 처리 중 오류가 발생했습니다")
         
-        # 5. Notion 게시 (설정된 경우에만 진행)
-        if has_notion:
-            logger.info("5️⃣ Notion 페이지 업데이트")
-            try:
-                publish_with_retry(processed_data, common_prayers=common_prayers, assignments=assignments)
-            except Exception as notion_err:
-                logger.warning(f"Notion 업데이트 실패 (진행은 계속됩니다): {str(notion_err)}")
-        else:
-            logger.info("5️⃣ Notion 설정이 없어 Notion 업데이트 단계를 건너뜁니다.")
-            
-        # 5-2. 로컬 캐시 및 데이터베이스 저장
-        logger.info("5️⃣-2 로컬 캐시 및 데이터베이스 동기화 저장")
-        save_prayers_to_local_cache(processed_data)
-        save_prayers_to_db(processed_data, common_prayers, assignments)
+        # 5. 출력 싱크 (JSON 캐시 / DB / Notion) 동시 실행
+        logger.info("5️⃣ 출력 싱크 동시 실행 (JSON 캐시 / 데이터베이스 / Notion)")
+        if not publish_notion:
+            logger.info("   Notion 게시는 호출자(API 서버)가 비동기로 진행합니다.")
+        sink_results = run_sinks(
+            processed_data, common_prayers, assignments,
+            deferred=() if publish_notion else ('notion',)
+        )
+        logger.info(f"   싱크 결과: {sink_results}")
+        failed_sinks = failed_required_sinks(sink_results)
         
         # 6. 실행 보고서
         execution_time = (datetime.now() - start_time).total_seconds()
@@ -333,10 +460,15 @@ def run_pipeline():
         
         logger.info("6️⃣ 실행 완료")
         logger.info(report)
+        pipeline_state['unmapped_requesters'] = unmapped
+        
+        if failed_sinks:
+            logger.error(f"필수 출력 싱크 실패: {', '.join(failed_sinks)}")
+            pipeline_state['status'] = 'ERROR'
+            return False
         
         # ── 파이프라인 상태: SUCCESS 설정 ──
         pipeline_state['status'] = 'SUCCESS'
-        pipeline_state['unmapped_requesters'] = unmapped
         
         return True
         
@@ -361,13 +493,45 @@ def run_pipeline():
         execution_time = (datetime.now() - start_time).total_seconds()
         logger.info(f"파이프라인 종료 (실행시간: {execution_time:.2f}초)")
 
+def plan_notion_publish(pandas_free=False):
+    """
+    Notion dry-run: 시트 데이터를 수집·처리한 뒤 게시 계획(요청 수, 페이로드 크기, 예상 시간)만 계산합니다.
+    Notion 호출, 게시 상태 파일, 로컬 캐시, DB에는 아무것도 쓰지 않습니다.
+    """
+    responses, common_prayers_result, assignments_result = get_all_sheet_data(as_dataframe=not pandas_free)
+    if responses is None:
+        responses = fetch_data_with_retry(pandas_free=pandas_free)
+    
+    processed_data = process_prayer_values(responses) if pandas_free else process_prayer_requests(responses)
+    if processed_data is None:
+        raise PipelineError("데이터 처리 중 오류가 발생했습니다")
+    
+    return plan_publish(
+        processed_data,
+        common_prayers=common_prayers_result['data'],
+        assignments=assignments_result['data']
+    )
 
 def main():
     """메인 함수 (CLI 직접 실행용)"""
+    parser = argparse.ArgumentParser(description="CBF 기도제목 자동화 파이프라인")
+    parser.add_argument('--notion-dry-run', action='store_true',
+                        help="Notion에 게시하지 않고 게시 계획(API 호출 수, 예상 시간)만 출력")
+    args = parser.parse_args()
+    
     # 로깅 설정
     setup_logging()
     logger = logging.getLogger(__name__)
     
+    if args.notion_dry_run:
+        try:
+            plan = plan_notion_publish()
+            print(json.dumps(plan, ensure_ascii=False, indent=2))
+            sys.exit(0)
+        except Exception as e:
+            logger.error(f"Notion 게시 계획 계산 실패: {str(e)}")
+            sys.exit(1)
+    
     try:
         # FileLock으로 중복 실행 방지
         lock = FileLock(LOCK_FILE, timeout=0)
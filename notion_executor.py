@@ -0,0 +1,174 @@
+"""
+CBF 기도제목 자동화 V2 - Notion API 호출 실행기
+
+Notion API는 통합(integration)당 평균 초당 3회 요청으로 제한됩니다.
+이 모듈은 notion_client.AsyncClient 호출을 다음 규칙으로 실행합니다.
+  - 토큰 버킷으로 평균 호출 속도를 NOTION_RATE_LIMIT(기본 3회/초)에 맞춤
+  - 동시에 진행 중인 요청 수를 NOTION_MAX_CONCURRENCY로 제한
+  - 429(rate_limited) 응답은 Retry-After만큼 모든 작업을 쉬었다가 재시도, 5xx/타임아웃은 지수 백오프 재시도
+    (블록 추가/페이지 생성처럼 멱등하지 않은 요청은 5xx/타임아웃이면 반영 여부를 알 수 없으므로
+     재시도하지 않고 올려 보냄 → 게시 저널의 이어서 하기가 처리)
+  - 게시 1회의 호출 수, 재시도 수, 소요 시간, 초당 호출 수를 집계
+
+모든 대기는 asyncio로 이뤄지므로 FastAPI 이벤트 루프에서 스레드를 점유하지 않습니다.
+"""
+
+import os
+import time
+import asyncio
+import logging
+
+import httpx
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+logger = logging.getLogger(__name__)
+
+NOTION_RATE_LIMIT = float(os.getenv('NOTION_RATE_LIMIT', '3'))
+NOTION_RATE_BURST = int(os.getenv('NOTION_RATE_BURST', '3'))
+NOTION_MAX_CONCURRENCY = int(os.getenv('NOTION_MAX_CONCURRENCY', '3'))
+NOTION_MAX_RETRIES = int(os.getenv('NOTION_MAX_RETRIES', '5'))
+
+# 재시도할 HTTP 상태 (429: rate limit, 5xx: 일시적 서버 오류)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """asyncio 토큰 버킷 (rate: 초당 보충 토큰 수, capacity: 최대 버스트)"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기합니다."""
+        if self.rate <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                wait = self._paused_until - now
+            else:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """429 응답 시 모든 호출을 seconds 동안 멈추고 버킷을 비웁니다."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._updated = self._paused_until
+
+
+class NotionExecutor:
+    """
+    Notion AsyncClient 호출을 속도 제한 / 동시성 제한 / 재시도와 함께 실행합니다.
+
+    사용 예:
+        executor = NotionExecutor(AsyncClient(auth=token))
+        await executor.call(executor.client.blocks.update, block_id=..., callout={...})
+        await executor.run_all([coro1, coro2])
+        executor.summary()
+    """
+
+    def __init__(self, client, rate: float = None, burst: int = None,
+                 max_concurrency: int = None, max_retries: int = None):
+        self.client = client
+        self.max_concurrency = max(1, max_concurrency or NOTION_MAX_CONCURRENCY)
+        self.max_retries = NOTION_MAX_RETRIES if max_retries is None else max_retries
+        self._bucket = TokenBucket(
+            NOTION_RATE_LIMIT if rate is None else rate,
+            NOTION_RATE_BURST if burst is None else burst
+        )
+        self._in_flight = asyncio.Semaphore(self.max_concurrency)
+        self._started = time.perf_counter()
+        self.calls = 0
+        self.retries = 0
+        self.rate_limited = 0
+
+    async def call(self, func, idempotent: bool = True, **kwargs):
+        """
+        Notion API 함수 1회 호출 (속도 제한 + 재시도)
+
+        Args:
+            idempotent: False면(blocks.children.append, pages.create) 요청 전에 거부되는 429만 재시도합니다.
+                        5xx/타임아웃은 요청이 이미 반영됐을 수 있어 다시 보내면 블록/페이지가 중복됩니다.
+        """
+        attempt = 0
+        while True:
+            await self._bucket.acquire()
+            try:
+                async with self._in_flight:
+                    self.calls += 1
+                    return await func(**kwargs)
+            except (HTTPResponseError, RequestTimeoutError) as e:
+                status = getattr(e, 'status', None)
+                if isinstance(e, HTTPResponseError) and status not in RETRYABLE_STATUSES:
+                    raise
+                if status != 429 and not idempotent:
+                    raise
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                self.retries += 1
+
+                if status == 429:
+                    self.rate_limited += 1
+                    wait = _retry_after_seconds(e)
+                    self._bucket.pause(wait)
+                    logger.warning(f"Notion rate limit (429), {wait:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+                else:
+                    wait = min(2 ** (attempt - 1), 30)
+                    logger.warning(f"Notion 일시 오류 ({status or 'timeout'}), {wait}초 후 재시도 ({attempt}/{self.max_retries})")
+                    await asyncio.sleep(wait)
+
+    async def run_all(self, coroutines) -> list:
+        """
+        서로 독립적인 작업(코루틴)을 동시에 실행하고 입력 순서대로 결과를 반환합니다.
+        실제 동시 요청 수는 call()의 세마포어가 제한하고, 하나라도 실패하면 나머지를 취소합니다.
+        """
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        if not tasks:
+            return []
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def summary(self) -> dict:
+        """실행기 생성 이후 호출 통계"""
+        wall_time = time.perf_counter() - self._started
+        return {
+            'calls': self.calls,
+            'retries': self.retries,
+            'rate_limited': self.rate_limited,
+            'wall_time_sec': round(wall_time, 2),
+            'calls_per_sec': round(self.calls / wall_time, 2) if wall_time > 0 else 0.0
+        }
+
+
+def is_transient_error(error: Exception) -> bool:
+    """재시도하면 성공할 수 있는 오류인지 (타임아웃, 429/5xx, 연결 오류)"""
+    if isinstance(error, RequestTimeoutError):
+        return True
+    if isinstance(error, HTTPResponseError):
+        return getattr(error, 'status', None) in RETRYABLE_STATUSES
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+
+def _retry_after_seconds(error: Exception, default: float = 1.0) -> float:
+    """429 응답의 Retry-After 헤더(초)를 읽습니다."""
+    headers = getattr(error, 'headers', None) or {}
+    try:
+        return max(float(headers.get('retry-after') or headers.get('Retry-After') or default), 0.0)
+    except (TypeError, ValueError):
+        return default
@@ -1,11 +1,20 @@
-from notion_client import Client
+from notion_client import Client, AsyncClient
 from dotenv import load_dotenv
 import os
+import json
+import hashlib
+import asyncio
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from types import SimpleNamespace
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from config import config, PrayerAssignments
+from notion_client.errors import HTTPResponseError
+import notion_executor
+from notion_executor import NotionExecutor, is_transient_error
 
 load_dotenv()
 
@@ -17,6 +26,29 @@ PAGE_ID = os.getenv('NOTION_PAGE_ID', '1c50f7e0cd5f8025bb78c5c839f205f0')
 SPREADSHEET_ID = os.getenv('SPREADSHEET_ID', '1gYaj_juZ2TBU-aXOOwiHkl5N0vrF1CeaNLE29aftvlg')
 SHEET_RANGE = "'설문지 응답 시트1'!A:Z"
 
+# 게시 방식: diff (바뀐 토글만 수정, 기본값) | full (섹션 전체 삭제 후 재추가)
+NOTION_PUBLISH_MODE = os.getenv('NOTION_PUBLISH_MODE', 'diff')
+# diff 게시용 상태 파일 (지문 → 블록 ID). 비우면 매번 전체 재구성
+NOTION_STATE_FILE = os.getenv('NOTION_STATE_FILE', 'notion_publish_state.json')
+PUBLISH_STATE_VERSION = 1
+# 게시 도중 끝난 Notion 작업 저널 (실패 후 재시도/다음 실행이 이어서 게시). 비우면 저널 없이 게시
+NOTION_JOURNAL_FILE = os.getenv('NOTION_JOURNAL_FILE', 'notion_publish_journal.jsonl')
+# 페이지 구성: single (한 페이지에 담당자 토글, 기본값) | sharded (담당자별 하위 페이지 + 루트에는 공통 기도제목과 링크)
+NOTION_LAYOUT = os.getenv('NOTION_LAYOUT', 'single').lower()
+
+# Notion rich_text 한도: 요소 100개, 요소당 2000자 / 기도제목 인코딩 캐시 크기
+RICH_TEXT_MAX_ELEMENTS = 100
+RICH_TEXT_MAX_LENGTH = 2000
+RICH_TEXT_CACHE_SIZE = int(os.getenv('NOTION_RICH_TEXT_CACHE_SIZE', '20000'))
+
+# Notion append 요청 한도: 자식 블록 100개, 한 요청 안의 중첩 2단계, 요청당 블록 1000개
+APPEND_MAX_CHILDREN = 100
+APPEND_MAX_NESTING = 2
+APPEND_MAX_BLOCKS = 1000
+
+# dry-run 계획에서 경고할 삭제 블록 수
+PLAN_WARN_DELETES = int(os.getenv('NOTION_PLAN_WARN_DELETES', '500'))
+
 # ============================================================
 # 공통 기도제목 상수 (구글 시트 로드 실패 시 fallback으로 사용)
 # ============================================================
@@ -81,27 +113,113 @@ def create_notion_client():
         raise ValueError("NOTION_TOKEN이 설정되지 않았습니다. .env 파일을 확인하세요.")
     return Client(auth=NOTION_TOKEN)
 
-def create_prayer_content_rich_text(prayer):
-    """기도제목 내용을 Notion rich_text 형식으로 변환 (줄바꿈 보존)"""
-    content_parts = []
+def create_async_notion_client():
+    """게시용 Notion 비동기 클라이언트를 초기화합니다."""
+    if not NOTION_TOKEN:
+        raise ValueError("NOTION_TOKEN이 설정되지 않았습니다. .env 파일을 확인하세요.")
+    return AsyncClient(auth=NOTION_TOKEN)
+
+def _utf16_length(text: str) -> int:
+    """Notion 글자 수 한도 기준 길이 (UTF-16 코드 유닛, 이모지 등은 2)"""
+    return len(text.encode('utf-16-le')) // 2
+
+def _split_text(text: str, limit: int = None) -> list:
+    """text를 limit(UTF-16 기준, 기본 2000) 이하 조각으로 나눕니다. 한도 이내면 그대로 1조각"""
+    limit = limit or RICH_TEXT_MAX_LENGTH
+    if len(text) * 2 <= limit or _utf16_length(text) <= limit:
+        return [text]
+    chunks, start, size = [], 0, 0
+    for index, char in enumerate(text):
+        width = 2 if ord(char) > 0xFFFF else 1
+        if size + width > limit:
+            chunks.append(text[start:index])
+            start, size = index, 0
+        size += width
+    chunks.append(text[start:])
+    return chunks
+
+def _compact_rich_text(segments) -> list:
+    """
+    (문자열, annotations) 조각 목록을 Notion rich_text 배열로 만듭니다.
     
-    # 기본 정보 추가
-    content_parts.append({"type": "text", "text": {"content": f"👤 제출자: {prayer['name']}\n"}})
-    content_parts.append({"type": "text", "text": {"content": f"🙏 구도자: {prayer['target_name']} ({prayer['gender']}, {prayer['age']})\n"}})
-    content_parts.append({"type": "text", "text": {"content": f"👥 관계: {prayer['relationship']}\n"}})
-    content_parts.append({"type": "text", "text": {"content": "📝 기도제목:\n"}, "annotations": {"bold": True}})
+    - 서식(annotations)이 같은 인접 조각은 하나의 요소로 합침
+    - 2000자 한도를 넘는 요소만 한도 경계에서 나눔
+    - 요소 100개 한도를 넘으면 뒷부분을 잘라냄 (경고 로그)
+    """
+    merged = []
+    for text, annotations in segments:
+        if not text:
+            continue
+        if merged and merged[-1][1] == annotations:
+            merged[-1][0].append(text)
+        else:
+            merged.append(([text], annotations))
+    
+    rich_text = []
+    for parts, annotations in merged:
+        for chunk in _split_text(''.join(parts)):
+            element = {"type": "text", "text": {"content": chunk}}
+            if annotations:
+                element["annotations"] = annotations
+            rich_text.append(element)
+    
+    if len(rich_text) > RICH_TEXT_MAX_ELEMENTS:
+        logger.warning(f"rich_text 요소가 {len(rich_text)}개로 한도({RICH_TEXT_MAX_ELEMENTS})를 넘어 뒷부분을 잘라냅니다.")
+        rich_text = rich_text[:RICH_TEXT_MAX_ELEMENTS]
+    return rich_text
+
+# 기도제목 내용 지문 → 불변 rich_text 요소 튜플 ((문자열, annotations 항목 튜플), ...) LRU 캐시
+# 응답마다 새 dict를 만들어 주므로 게시 payload를 고쳐도 캐시된 값은 바뀌지 않음
+_rich_text_cache = OrderedDict()
+_rich_text_cache_lock = threading.Lock()
+
+def _prayer_content_key(prayer) -> str:
+    """rich_text 인코딩에 쓰이는 6개 필드의 내용 지문"""
+    fields = (prayer['name'], prayer['target_name'], prayer['gender'], prayer['age'],
+              prayer['relationship'], prayer['prayer_content'])
+    return hashlib.blake2b('\x1f'.join(fields).encode('utf-8'), digest_size=16).hexdigest()
+
+def _encode_prayer_rich_text(prayer) -> tuple:
+    """기도제목 한 건의 rich_text 인코딩 (캐시용 불변 형태)"""
+    segments = [
+        (f"👤 제출자: {prayer['name']}\n"
+         f"🙏 구도자: {prayer['target_name']} ({prayer['gender']}, {prayer['age']})\n"
+         f"👥 관계: {prayer['relationship']}\n", None),
+        ("📝 기도제목:\n", {"bold": True}),
+    ]
     
-    # 기도제목 내용 처리 (줄바꿈 보존)
+    # 기도제목 내용 처리 (줄바꿈 보존, 공백뿐인 줄은 줄바꿈만 남김)
     prayer_content = prayer['prayer_content']
     if prayer_content:
         lines = prayer_content.split('\n')
-        for i, line in enumerate(lines):
-            if line.strip():  # 빈 줄이 아닌 경우
-                content_parts.append({"type": "text", "text": {"content": line}})
-            if i < len(lines) - 1:  # 마지막 줄이 아니면 줄바꿈 추가
-                content_parts.append({"type": "text", "text": {"content": "\n"}})
+        segments.append(('\n'.join(line if line.strip() else '' for line in lines), None))
+    
+    return tuple(
+        (element["text"]["content"], tuple(element["annotations"].items()) if "annotations" in element else None)
+        for element in _compact_rich_text(segments)
+    )
+
+def create_prayer_content_rich_text(prayer):
+    """기도제목 내용을 Notion rich_text 형식으로 변환 (줄바꿈 보존, 같은 내용은 캐시된 인코딩 재사용)"""
+    key = _prayer_content_key(prayer)
+    with _rich_text_cache_lock:
+        encoded = _rich_text_cache.get(key)
+        if encoded is not None:
+            _rich_text_cache.move_to_end(key)
+    if encoded is None:
+        encoded = _encode_prayer_rich_text(prayer)
+        with _rich_text_cache_lock:
+            _rich_text_cache[key] = encoded
+            while len(_rich_text_cache) > RICH_TEXT_CACHE_SIZE:
+                _rich_text_cache.popitem(last=False)
     
-    return content_parts
+    rich_text = []
+    for content, annotations in encoded:
+        element = {"type": "text", "text": {"content": content}}
+        if annotations:
+            element["annotations"] = dict(annotations)
+        rich_text.append(element)
+    return rich_text
 
 def create_prayer_content(prayer):
     """기본 기도제목 텍스트 생성 (백업용)"""
@@ -138,7 +256,7 @@ def _build_common_prayers_blocks(prayers_list: list) -> list:
                     "object": "block",
                     "type": "bulleted_list_item",
                     "bulleted_list_item": {
-                        "rich_text": [{"type": "text", "text": {"content": sub_stripped}}],
+                        "rich_text": _compact_rich_text([(sub_stripped, None)]),
                         "color": "default"
                     }
                 })
@@ -147,7 +265,7 @@ def _build_common_prayers_blocks(prayers_list: list) -> list:
             "object": "block",
             "type": "bulleted_list_item",
             "bulleted_list_item": {
-                "rich_text": [{"type": "text", "text": {"content": first_line}}],
+                "rich_text": _compact_rich_text([(first_line, None)]),
                 "color": "default"
             }
         }
@@ -159,17 +277,1073 @@ def _build_common_prayers_blocks(prayers_list: list) -> list:
     
     return blocks
 
-def publish_to_notion(processed_data, common_prayers=None, assignments=None):
+# ============================================================
+# 담당자별 기도제목 블록 빌더
+# ============================================================
+
+def _split_assignee_prayers(manager: str, assignee: str, assignee_prayers: list) -> list:
+    """SPLIT_ASSIGNMENTS에 따라 한 제출자의 기도제목 중 해당 담당자 몫만 잘라 반환합니다."""
+    if hasattr(PrayerAssignments, 'SPLIT_ASSIGNMENTS') and assignee in PrayerAssignments.SPLIT_ASSIGNMENTS:
+        split_managers = PrayerAssignments.SPLIT_ASSIGNMENTS[assignee]
+        if manager in split_managers:
+            total_items = len(assignee_prayers)
+            num_splits = len(split_managers)
+            split_index = split_managers.index(manager)
+            
+            # 균등 분할 (나머지는 앞쪽 담당자가 가져감)
+            base_chunk = total_items // num_splits
+            remainder = total_items % num_splits
+            
+            start_idx = split_index * base_chunk + min(split_index, remainder)
+            end_idx = start_idx + base_chunk + (1 if split_index < remainder else 0)
+            
+            return assignee_prayers[start_idx:end_idx]
+    return assignee_prayers
+
+def _build_assignee_toggle(assignee: str, assignee_prayers: list) -> dict:
+    """제출자 한 명의 기도제목 토글 블록 (기도제목마다 callout 1개)"""
+    return {
+        "object": "block",
+        "type": "toggle",
+        "toggle": {
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": f"🙏 {assignee}님의 기도제목"
+                    },
+                    "annotations": {
+                        "bold": True,
+                        "color": "green"
+                    }
+                }
+            ],
+            "children": [
+                {
+                    "object": "block",
+                    "type": "callout",
+                    "callout": {
+                        "rich_text": create_prayer_content_rich_text(prayer),
+                        "icon": {
+                            "type": "emoji",
+                            "emoji": "✨"
+                        },
+                        "color": "gray_background"
+                    }
+                }
+                for prayer in assignee_prayers
+            ]
+        }
+    }
+
+def _build_manager_toggle(manager: str, assignee_blocks: list) -> dict:
+    """담당자 한 명의 토글 블록 (자식: 제출자별 토글)"""
+    return {
+        "object": "block",
+        "type": "toggle",
+        "toggle": {
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": f"📌 {manager}"
+                    },
+                    "annotations": {
+                        "bold": True
+                    }
+                }
+            ],
+            "children": assignee_blocks
+        }
+    }
+
+def _block_fingerprint(block: dict) -> str:
+    """블록(하위 트리 포함)의 내용 지문"""
+    payload = json.dumps(block, ensure_ascii=False, sort_keys=True)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+def _build_manager_entries(assignments: dict, prayers_by_requester: dict) -> list:
+    """
+    담당자 배정 순서대로 담당자/제출자 토글 블록과 지문을 만듭니다.
+    
+    Returns:
+        list: [{'manager', 'fingerprint', 'block', 'assignees': [{'assignee', 'fingerprint', 'block'}]}]
+    """
+    entries = []
+    for manager, assignees in assignments.items():
+        assignee_entries = []
+        for assignee in assignees:
+            if assignee not in prayers_by_requester:
+                continue
+            assignee_prayers = _split_assignee_prayers(manager, assignee, prayers_by_requester[assignee])
+            assignee_block = _build_assignee_toggle(assignee, assignee_prayers)
+            assignee_entries.append({
+                'assignee': assignee,
+                'fingerprint': _block_fingerprint(assignee_block),
+                'block': assignee_block
+            })
+        
+        manager_block = _build_manager_toggle(manager, [entry['block'] for entry in assignee_entries])
+        entries.append({
+            'manager': manager,
+            'fingerprint': _block_fingerprint(manager_block),
+            'block': manager_block,
+            'assignees': assignee_entries
+        })
+    return entries
+
+# ============================================================
+# 게시 상태 저장소 (지문 → 블록 ID)
+# ============================================================
+
+def _load_publish_state():
+    """직전 게시 결과(앵커/담당자/제출자 블록 ID와 지문)를 읽습니다. 없거나 다른 페이지 것이면 None"""
+    if not NOTION_STATE_FILE or not os.path.exists(NOTION_STATE_FILE):
+        return None
+    try:
+        with open(NOTION_STATE_FILE, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Notion 게시 상태 파일을 읽지 못했습니다 (전체 재구성으로 진행): {e}")
+        return None
+    
+    if state.get('version') != PUBLISH_STATE_VERSION or state.get('page_id') != PAGE_ID:
+        return None
+    return state
+
+def _save_publish_state(state: dict):
+    if not NOTION_STATE_FILE:
+        return
+    try:
+        tmp_path = f"{NOTION_STATE_FILE}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, NOTION_STATE_FILE)
+    except OSError as e:
+        logger.warning(f"Notion 게시 상태 저장 실패 (다음 실행은 전체 재구성): {e}")
+
+def _anchor_ids(anchors: dict) -> dict:
+    """앵커(callout 블록, 섹션 제목 ID) → 상태 파일에 저장할 블록 ID"""
+    callout = anchors.get('callout')
+    return {
+        'callout': callout['id'] if callout else None,
+        'common_section': anchors.get('common_section'),
+        'prayer_section': anchors.get('prayer_section')
+    }
+
+def _new_publish_state(anchors: dict) -> dict:
+    return {
+        'version': PUBLISH_STATE_VERSION,
+        'page_id': PAGE_ID,
+        'layout': NOTION_LAYOUT,
+        'anchors': _anchor_ids(anchors),
+        'common': None,
+        'managers': []
+    }
+
+def _manager_state(entry: dict, block_id: str) -> dict:
+    # 하위 제출자 토글 ID는 처음 부분 수정이 필요할 때 조회해서 채웁니다
+    return {
+        'manager': entry['manager'],
+        'fingerprint': entry['fingerprint'],
+        'block_id': block_id,
+        'assignees': [
+            {'assignee': a['assignee'], 'fingerprint': a['fingerprint'], 'block_id': None}
+            for a in entry['assignees']
+        ]
+    }
+
+# ============================================================
+# 게시 저널 (중단된 게시 이어서 하기)
+# ============================================================
+
+class _PublishJournal:
+    """
+    게시 도중 끝난 Notion 작업(블록 삭제/추가, 제출자 ID 조회, 부분 수정)을 한 줄씩 남기는 JSONL 저널.
+    
+    게시가 중간에 실패하면 다음 호출(재시도 또는 다음 정기 실행)이 상태 파일 위에 저널을 재생해
+    실제 페이지 상태를 복원하고, 이미 끝난 작업은 건너뛰고 남은 작업만 이어서 게시합니다.
+    게시가 끝나 상태 파일을 저장하면 저널을 지웁니다. read_only면(dry-run) 읽기만 합니다.
+    """
+    
+    def __init__(self, path: str, read_only: bool = False):
+        self.path = path
+        self.read_only = read_only
+        self._file = None
+    
+    def _header(self) -> dict:
+        return {'op': 'begin', 'page_id': PAGE_ID, 'version': PUBLISH_STATE_VERSION, 'layout': NOTION_LAYOUT}
+    
+    def load(self) -> list:
+        """저널의 완료 작업 목록. 없거나 다른 페이지/버전 것이면 빈 목록"""
+        if not self.path or not os.path.exists(self.path):
+            return []
+        entries = []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue  # 기록 도중 끊긴 줄
+        except OSError as e:
+            logger.warning(f"Notion 게시 저널을 읽지 못했습니다 (처음부터 게시): {e}")
+            return []
+        
+        if not entries or entries[0] != self._header():
+            if not self.read_only:
+                self.clear()
+            return []
+        return entries[1:]
+    
+    def record(self, op: str, **fields):
+        if not self.path or self.read_only:
+            return
+        try:
+            if self._file is None:
+                is_new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+                self._file = open(self.path, 'a', encoding='utf-8')
+                if is_new:
+                    self._file.write(json.dumps(self._header()) + '\n')
+                else:
+                    # 기록 도중 끊긴 마지막 줄과 이어 붙지 않도록 줄을 바꿔 둠
+                    self._file.write('\n')
+            self._file.write(json.dumps({'op': op, **fields}, ensure_ascii=False) + '\n')
+            self._file.flush()
+        except OSError as e:
+            logger.warning(f"Notion 게시 저널 기록 실패 (실패 시 처음부터 다시 게시): {e}")
+    
+    def append_hooks(self, target: str, parent_id: str, make_items) -> dict:
+        """
+        append_block_tree에 넘길 on_request / on_created 콜백. target: 'common' | 'managers' | 'assignees'
+        
+        - 요청 전: 'appending' (응답을 못 받고 끊겨도 다음 게시가 만들어졌을지 모를 블록을 찾아 지움)
+        - 생성 후: 'append' + make_items(offset, ids)로 만든 상태 항목. 하위 블록을 아직 다 붙이지 못한
+                   블록(complete=False)은 지문을 비워 다음 게시에서 다시 쓰게 합니다.
+        """
+        def on_request(after, count):
+            self.record('appending', target=target, parent=parent_id, after=after, count=count)
+        
+        def on_created(offset, after, ids, complete):
+            items = make_items(offset, ids)
+            if not complete:
+                items = [_incomplete_state(item) for item in items]
+            self.record('append', target=target, parent=parent_id, after=after, items=items)
+        
+        return {'on_request': on_request, 'on_created': on_created}
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def clear(self):
+        self.close()
+        if self.path and not self.read_only and os.path.exists(self.path):
+            os.remove(self.path)
+
+def _incomplete_state(item: dict) -> dict:
+    item = {**item, 'fingerprint': None}
+    if 'assignees' in item:
+        item['assignees'] = [{**assignee, 'fingerprint': None} for assignee in item['assignees']]
+    return item
+
+def _forget_block(state: dict, block_id: str):
+    """지워진 블록을 상태에서 뺍니다 (공통 섹션 블록이면 섹션 지문도 무효화)"""
+    pending = state.get('pending_deletes')
+    if pending and block_id in pending:
+        pending.remove(block_id)
+    state['managers'] = [m for m in state['managers'] if m['block_id'] != block_id]
+    for manager in state['managers']:
+        manager['assignees'] = [a for a in manager['assignees'] if a.get('block_id') != block_id]
+    common = state.get('common')
+    if common and block_id in common['block_ids']:
+        common['block_ids'] = [i for i in common['block_ids'] if i != block_id]
+        common['fingerprint'] = None
+
+def _apply_append(state: dict, entry: dict):
+    if entry['target'] == 'common':
+        common = state.get('common') or {'fingerprint': None, 'block_ids': []}
+        state['common'] = {
+            'fingerprint': None,
+            'block_ids': common['block_ids'] + [item['block_id'] for item in entry['items']]
+        }
+        return
+    
+    if entry['target'] == 'managers':
+        siblings = state['managers']
+    else:
+        parent = next((m for m in state['managers'] if m['block_id'] == entry['parent']), None)
+        if parent is None:
+            return
+        siblings = parent['assignees']
+    
+    ids = [item.get('block_id') for item in siblings]
+    after = entry['after']
+    for item in entry['items']:
+        if item['block_id'] in ids:
+            # 하위 블록까지 다 붙인 뒤 다시 기록된 블록 → 지문 갱신
+            siblings[ids.index(item['block_id'])] = item
+        else:
+            if after in ids:
+                index = ids.index(after) + 1
+            elif entry['target'] == 'managers' and after and after == state['anchors'].get('prayer_section'):
+                index = 0
+            else:
+                index = len(siblings)
+            siblings.insert(index, item)
+            ids.insert(index, item['block_id'])
+        after = item['block_id']
+
+def _replay_journal(state, entries: list):
     """
-    Notion 페이지에 기도제목 데이터를 게시합니다.
+    직전에 끝까지 저장된 상태(state, 없으면 None) 위에 저널의 완료 작업을 순서대로 적용합니다.
+    
+    - 'full'(전체 재구성 시작)은 상태를 새로 만들고 아직 못 지운 블록을 pending_deletes로 남깁니다.
+    - 시작만 있고 완료가 없는 추가 요청은 uncertain_appends로 남깁니다.
+    """
+    uncertain = []
+    for entry in entries:
+        op = entry['op']
+        if op == 'appending':
+            uncertain.append(entry)
+            continue
+        if op == 'full':
+            state = {**_new_publish_state({}), 'anchors': entry['anchors'],
+                     'pending_deletes': list(entry['delete_ids'])}
+            continue
+        if state is None:
+            continue
+        
+        if op == 'delete':
+            _forget_block(state, entry['block_id'])
+        elif op == 'append':
+            uncertain = [
+                intent for intent in uncertain
+                if (intent['parent'], intent['after']) != (entry['parent'], entry['after'])
+            ]
+            _apply_append(state, entry)
+        elif op == 'common':
+            if state.get('common'):
+                state['common']['fingerprint'] = entry['fingerprint']
+        elif op in ('resolve', 'patched'):
+            manager = next((m for m in state['managers'] if m['block_id'] == entry['block_id']), None)
+            if manager is None:
+                continue
+            if op == 'resolve':
+                for assignee_state, block_id in zip(manager['assignees'], entry['assignee_ids']):
+                    assignee_state['block_id'] = block_id
+            else:
+                manager['fingerprint'] = entry['fingerprint']
+    
+    if state is not None and uncertain:
+        state['uncertain_appends'] = uncertain
+    return state
+
+def _known_block_ids(state: dict) -> set:
+    known = {block_id for block_id in state['anchors'].values() if block_id}
+    known.update((state.get('common') or {}).get('block_ids', []))
+    for manager in state['managers']:
+        known.add(manager['block_id'])
+        known.update(a['block_id'] for a in manager['assignees'] if a.get('block_id'))
+    return known
+
+async def _remove_unjournaled_appends(executor: NotionExecutor, state: dict, journal: '_PublishJournal',
+                                      stats: '_PublishStats'):
+    """
+    응답을 받기 전에 끊긴 추가 요청이 실제로 만든 블록(상태에 없는 블록)을 찾아 지웁니다.
+    요청이 만든 블록은 after 바로 뒤(after가 없으면 부모의 맨 끝)에 최대 count개가 연달아 있습니다.
+    """
+    for intent in state.pop('uncertain_appends', []):
+        known = _known_block_ids(state)
+        after = intent['after']
+        run = []
+        seen_after = after is None
+        async for block in iter_block_children(executor, intent['parent']):
+            if not seen_after:
+                seen_after = block['id'] == after
+                continue
+            if block['id'] not in known:
+                run.append(block['id'])
+                if after and len(run) >= intent['count']:
+                    break
+            elif after:
+                break
+            else:
+                run = []
+        if run:
+            logger.info(f"응답을 받지 못한 Notion 추가 요청이 만든 블록 {len(run)}개를 지웁니다.")
+            await _delete_blocks(executor, run[-intent['count']:], stats, ignore_errors=True, journal=journal)
+
+def _load_resumable_state(journal: _PublishJournal):
+    """상태 파일 + 저널 재생 결과와 재생한 작업 수를 반환합니다."""
+    state = _load_publish_state()
+    entries = journal.load()
+    if not entries:
+        return state, 0
+    return _replay_journal(state, entries), len(entries)
+
+# ============================================================
+# 블록 추가 (Notion 요청 한도에 맞춰 분할)
+# ============================================================
+
+def _block_children(block: dict) -> list:
+    return block[block['type']].get('children') or []
+
+def _shallow_block(block: dict) -> dict:
+    """자식 블록을 뺀 사본 (자식은 생성된 블록 ID 아래에 따로 추가)"""
+    body = {key: value for key, value in block[block['type']].items() if key != 'children'}
+    return {**block, block['type']: body}
+
+def _inline_size(block: dict, depth: int = 0):
+    """
+    block을 자식 포함 그대로 한 요청에 넣을 수 있으면 하위 트리의 블록 수를, 아니면 None을 반환합니다.
+    (중첩 APPEND_MAX_NESTING단계 이하, 단계별 자식 APPEND_MAX_CHILDREN개 이하)
+    """
+    children = _block_children(block)
+    if not children:
+        return 1
+    if depth >= APPEND_MAX_NESTING or len(children) > APPEND_MAX_CHILDREN:
+        return None
+    total = 1
+    for child in children:
+        size = _inline_size(child, depth + 1)
+        if size is None:
+            return None
+        total += size
+    return total
+
+def _iter_append_requests(blocks):
+    """
+    최상위 블록 이터러블을 append 요청 단위로 나눠 (payload, deferred)를 yield합니다.
+    
+    - payload: 최상위 블록 APPEND_MAX_CHILDREN개 이하, 하위 트리 포함 APPEND_MAX_BLOCKS개 이하
+    - deferred: [(payload 인덱스, 자식 목록)] 한도를 넘는 하위 트리는 자식을 떼어내고,
+                생성된 블록 ID 아래에 다음 요청으로 추가
+    """
+    payload, deferred, size = [], [], 0
+    for block in blocks:
+        block_size = _inline_size(block)
+        children = None
+        if block_size is None or block_size > APPEND_MAX_BLOCKS:
+            children = _block_children(block)
+            block, block_size = _shallow_block(block), 1
+        
+        if payload and (len(payload) >= APPEND_MAX_CHILDREN or size + block_size > APPEND_MAX_BLOCKS):
+            yield payload, deferred
+            payload, deferred, size = [], [], 0
+        
+        if children:
+            deferred.append((len(payload), children))
+        payload.append(block)
+        size += block_size
+    
+    if payload:
+        yield payload, deferred
+
+async def append_block_tree(executor: NotionExecutor, parent_id: str, blocks, after: str = None,
+                            on_request=None, on_created=None) -> list:
+    """
+    블록 트리를 parent 아래(after가 있으면 그 블록 뒤)에 순서대로 추가합니다.
+    
+    요청 한도(자식 100개, 중첩 2단계)를 넘는 부분은 요청을 나누고, 더 깊은 단계는
+    응답으로 받은 블록 ID 아래에 이어서 추가합니다. 서로 다른 부모의 하위 트리는 동시에 추가합니다.
     
     Args:
-        processed_data: 처리된 기도제목 데이터
-        common_prayers: 공통 기도제목 목록 (None이면 구글 시트에서 자동 로드)
-        assignments: 담당자 배정 딕셔너리 (None이면 구글 시트에서 자동 로드)
+        blocks: 최상위 블록 이터러블 (제너레이터 가능)
+        on_request / on_created: 게시 저널 기록용 콜백. 최상위 블록 요청 전에 on_request(after, count),
+                    생성 후 on_created(offset, after, ids, complete)로 호출합니다. 하위 블록을 나중에
+                    붙이는 요청은 생성 직후 complete=False로 한 번, 다 붙인 뒤 complete=True로 한 번 더 호출합니다.
+    
+    Returns:
+        list: 생성된 최상위 블록 ID 목록 (입력 순서)
+    """
+    append = executor.client.blocks.children.append
+    created_ids = []
+    for payload, deferred in _iter_append_requests(blocks):
+        kwargs = {'block_id': parent_id, 'children': payload}
+        if after:
+            kwargs['after'] = after
+        if on_request:
+            on_request(after, len(payload))
+        response = await executor.call(append, idempotent=False, **kwargs)
+        
+        ids = [block['id'] for block in response.get('results', [])]
+        if len(ids) != len(payload):
+            raise RuntimeError(f"추가한 블록 수({len(payload)})와 생성된 블록 수({len(ids)})가 다릅니다")
+        offset = len(created_ids)
+        created_ids.extend(ids)
+        if on_created and deferred:
+            on_created(offset, after, ids, False)
+        
+        await executor.run_all([
+            append_block_tree(executor, ids[index], children) for index, children in deferred
+        ])
+        if on_created:
+            on_created(offset, after, ids, True)
+        after = ids[-1]
+    return created_ids
+
+# ============================================================
+# 페이지 앵커 / 공통 섹션
+# ============================================================
+
+def _rich_text_contents(block: dict) -> list:
+    return [text.get('text', {}).get('content', '') for text in block[block['type']].get('rich_text', [])]
+
+async def iter_block_children(executor: NotionExecutor, block_id: str, page_size: int = 100):
+    """
+    블록(또는 페이지)의 자식 블록을 start_cursor/has_more로 한 페이지(최대 100개)씩 가져오며 하나씩 yield합니다.
+    호출자가 중간에 멈추면 남은 페이지는 요청하지 않습니다.
+    """
+    cursor = None
+    while True:
+        kwargs = {'block_id': block_id, 'page_size': page_size}
+        if cursor:
+            kwargs['start_cursor'] = cursor
+        response = await executor.call(executor.client.blocks.children.list, **kwargs)
+        for block in response.get('results', []):
+            yield block
+        cursor = response.get('next_cursor')
+        if not response.get('has_more') or not cursor:
+            return
+
+async def _scan_page(executor: NotionExecutor, collect_stale: bool) -> dict:
+    """
+    페이지 최상위 블록을 스트리밍으로 한 번 훑어 '마지막 업데이트' callout과 두 섹션 제목 블록을 찾습니다.
+    
+    Args:
+        collect_stale: True면 전체 재구성에서 지울 블록 ID(공통 기도제목 섹션 사이 블록,
+                       담당자별 기도제목 섹션 이후 블록)까지 끝까지 모으고,
+                       False면 담당자별 기도제목 제목을 찾는 즉시 중단합니다.
+    
+    Returns:
+        dict: {'anchors': {'callout': 블록, 'common_section': ID, 'prayer_section': ID},
+               'common_sibling_ids': [...], 'trailing_ids': [...]}
+    """
+    anchors = {'callout': None, 'common_section': None, 'prayer_section': None}
+    common_sibling_ids = []
+    trailing_ids = []
+    in_common_section = False
+    
+    async for block in iter_block_children(executor, PAGE_ID):
+        if anchors['prayer_section']:
+            trailing_ids.append(block['id'])
+            continue
+        
+        if block['type'] == 'callout' and anchors['callout'] is None:
+            if any('마지막 업데이트' in content for content in _rich_text_contents(block)):
+                anchors['callout'] = block
+        elif block['type'] == 'heading_1':
+            contents = _rich_text_contents(block)
+            if anchors['common_section'] is None and any('공통 기도제목' in c for c in contents):
+                anchors['common_section'] = block['id']
+                in_common_section = True
+                continue
+            if any('담당자별 기도제목' in c for c in contents):
+                # 공통 기도제목 섹션은 담당자별 기도제목 제목에서 끝남
+                in_common_section = False
+                if any(c == "📖 담당자별 기도제목" for c in contents):
+                    anchors['prayer_section'] = block['id']
+                    if not collect_stale:
+                        break
+                    continue
+        
+        if in_common_section:
+            common_sibling_ids.append(block['id'])
+    
+    return {'anchors': anchors, 'common_sibling_ids': common_sibling_ids, 'trailing_ids': trailing_ids}
+
+async def _retrieve_live_block(executor: NotionExecutor, block_id: str, block_type: str):
+    """blocks.retrieve로 블록이 아직 살아 있고 같은 종류인지 확인합니다. 아니면 None"""
+    try:
+        block = await executor.call(executor.client.blocks.retrieve, block_id=block_id)
+    except HTTPResponseError as e:
+        if e.status in (400, 404):
+            return None
+        raise
+    if block.get('archived') or block.get('in_trash') or block.get('type') != block_type:
+        return None
+    return block
+
+async def _load_stored_anchors(executor: NotionExecutor, state: dict):
+    """
+    상태 파일의 앵커 블록 ID를 blocks.retrieve(동시 실행)로 확인해 페이지 스캔 없이 앵커를 얻습니다.
+    ID가 없거나 하나라도 지워졌거나 문구가 바뀌었으면 None을 반환합니다 (호출자가 페이지 스캔).
+    """
+    stored = state.get('anchors') or {}
+    if 'callout' not in stored or not stored.get('prayer_section'):
+        return None
+    
+    checks = [
+        ('callout', 'callout', lambda contents: any('마지막 업데이트' in c for c in contents)),
+        ('common_section', 'heading_1', lambda contents: any('공통 기도제목' in c for c in contents)),
+        ('prayer_section', 'heading_1', lambda contents: any(c == "📖 담당자별 기도제목" for c in contents)),
+    ]
+    checks = [check for check in checks if stored.get(check[0])]
+    blocks = await executor.run_all([
+        _retrieve_live_block(executor, stored[key], block_type) for key, block_type, _ in checks
+    ])
+    
+    anchors = {'callout': None, 'common_section': None, 'prayer_section': None}
+    for (key, _, matches), block in zip(checks, blocks):
+        if block is None or not matches(_rich_text_contents(block)):
+            logger.info(f"저장된 Notion 앵커({key})가 유효하지 않아 페이지를 다시 훑습니다.")
+            return None
+        anchors[key] = block if key == 'callout' else block['id']
+    return anchors
+
+async def _update_last_updated_callout(executor: NotionExecutor, callout_block: dict, last_updated: str):
+    """'마지막 업데이트' callout 문구를 갱신합니다 (아이콘/색상 유지)."""
+    await executor.call(
+        executor.client.blocks.update,
+        block_id=callout_block['id'],
+        callout={
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": f"마지막 업데이트: {last_updated}"
+                    }
+                }
+            ],
+            "icon": callout_block['callout']['icon'],
+            "color": callout_block['callout']['color']
+        }
+    )
+
+async def _append_common_blocks(executor: NotionExecutor, common_section_id: str, common_blocks: list,
+                                journal: _PublishJournal) -> dict:
+    """공통 기도제목 블록을 섹션 제목 아래에 추가하고 상태({'fingerprint', 'block_ids'})를 반환합니다."""
+    hooks = journal.append_hooks('common', common_section_id, lambda offset, ids: [{'block_id': i} for i in ids])
+    fingerprint = _block_fingerprint(common_blocks)
+    block_ids = await append_block_tree(executor, common_section_id, common_blocks, **hooks)
+    journal.record('common', fingerprint=fingerprint)
+    return {'fingerprint': fingerprint, 'block_ids': block_ids}
+
+# ============================================================
+# 전체 재구성 게시
+# ============================================================
+
+async def _publish_full(executor: NotionExecutor, scan: dict, common_blocks: list, manager_entries: list,
+                  journal: _PublishJournal) -> dict:
+    """기존 방식: 섹션 블록을 모두 지우고 다시 추가합니다. 다음 diff 게시를 위한 상태를 반환합니다."""
+    anchors = scan['anchors']
+    state = _new_publish_state(anchors)
+    common_section_id = anchors['common_section']
+    
+    # ── 지울 블록 모으기: 담당자별 기도제목 섹션 이후 블록 + 공통 기도제목 섹션 사이 블록과
+    #    섹션 제목 아래 블록 (상태 파일이 없어도 페이지에 있는 그대로 지움) ──
+    stale_ids = list(scan['trailing_ids'])
+    if common_section_id and common_blocks:
+        stale_ids.extend(scan['common_sibling_ids'])
+        stale_ids.extend([block['id'] async for block in iter_block_children(executor, common_section_id)])
+    journal.record('full', anchors=state['anchors'], delete_ids=stale_ids)
+    
+    # 서로 독립적인 삭제이므로 동시에 실행
+    await _delete_blocks(executor, stale_ids, journal=journal)
+    
+    # ── 공통 기도제목 섹션 업데이트 ──
+    if common_section_id and common_blocks:
+        state['common'] = await _append_common_blocks(executor, common_section_id, common_blocks, journal)
+    
+    # 새로운 블록 추가 (담당자별 기도제목) - 분할 게시는 담당자별 하위 페이지로
+    if manager_entries and NOTION_LAYOUT == 'sharded':
+        state['managers'] = await _create_shard_pages(executor, manager_entries, journal)
+    # 담당자 토글 단위로 요청을 나눠 스트리밍
+    elif manager_entries:
+        hooks = journal.append_hooks('managers', PAGE_ID, lambda offset, ids: [
+            _manager_state(entry, block_id) for entry, block_id in zip(manager_entries[offset:], ids)
+        ])
+        created_ids = await append_block_tree(
+            executor, PAGE_ID, (entry['block'] for entry in manager_entries), **hooks
+        )
+        state['managers'] = [
+            _manager_state(entry, block_id) for entry, block_id in zip(manager_entries, created_ids)
+        ]
+    
+    return state
+
+# ============================================================
+# diff 게시 (바뀐 하위 트리만 삭제/삽입)
+# ============================================================
+
+class _PublishStats(dict):
+    """diff 게시 집계 (유지/삽입/삭제 블록 수, 부분 수정 담당자 수)"""
+    
+    def __init__(self):
+        super().__init__(kept=0, inserted=0, deleted=0, patched_managers=0)
+    
+    def add(self, key: str, count: int = 1):
+        self[key] += count
+
+def _match_in_order(previous: list, desired: list, key: str) -> dict:
+    """
+    이전 목록과 새 목록을 key(담당자/제출자 이름) 기준으로 순서를 유지하며 짝짓습니다.
+    
+    Returns:
+        dict: {새 목록 인덱스: 이전 목록 인덱스}
+    """
+    positions = {}
+    for i, item in enumerate(previous):
+        positions.setdefault(item[key], []).append(i)
+    
+    matches = {}
+    cursor = 0
+    for j, item in enumerate(desired):
+        for i in positions.get(item[key], ()):
+            if i >= cursor:
+                matches[j] = i
+                cursor = i + 1
+                break
+    return matches
+
+async def _insert_after(executor: NotionExecutor, parent_id: str, after_id, blocks: list, stats: '_PublishStats',
+                        hooks: dict = None) -> list:
+    """parent 아래 after_id 블록 뒤에 blocks를 순서대로 삽입하고 생성된 블록 ID 목록을 반환합니다."""
+    created_ids = await append_block_tree(executor, parent_id, blocks, after=after_id, **(hooks or {}))
+    stats.add('inserted', len(blocks))
+    return created_ids
+
+async def _delete_blocks(executor: NotionExecutor, block_ids: list, stats: '_PublishStats' = None,
+                   ignore_errors: bool = False, journal: _PublishJournal = None):
+    """
+    서로 독립적인 블록 삭제를 동시에 실행합니다. ignore_errors면 이미 지워진 블록 등의 오류를 무시합니다.
+    (일시적 오류는 블록이 남아 있을 수 있으므로 무시하지 않습니다)
+    """
+    delete = executor.client.blocks.delete
+    
+    async def delete_one(block_id):
+        try:
+            await executor.call(delete, block_id=block_id)
+        except Exception as e:
+            # 404: 이미 지워진 블록 (중단된 시도에서 삭제 응답만 받지 못한 경우 등) → 삭제된 것으로 기록
+            if getattr(e, 'status', None) != 404:
+                if not ignore_errors or is_transient_error(e):
+                    raise
+                return 0
+            removed = 0
+        else:
+            removed = 1
+        if journal is not None:
+            journal.record('delete', block_id=block_id)
+        return removed
+    
+    deleted = sum(await executor.run_all([delete_one(block_id) for block_id in block_ids]))
+    if stats is not None:
+        stats.add('deleted', deleted)
+
+async def _sync_children(executor: NotionExecutor, parent_id: str, first_anchor, previous: list, desired: list,
+                   key: str, make_state, stats: '_PublishStats', journal: _PublishJournal, patch=None):
+    """
+    한 부모 아래 자식 토글 목록을 이전 상태(previous)에서 새 목록(desired)으로 맞춥니다.
+    
+    - 지문이 같은 자식은 그대로 둡니다.
+    - 이름이 같고 지문만 다른 자식은 patch(이전 상태, 새 항목)가 True면 제자리 수정된 것으로 보고,
+      아니면 삭제 후 같은 위치에 다시 삽입합니다. 자식끼리 독립적이므로 patch는 동시에 실행합니다.
+    - 연속으로 새로 들어갈 블록은 직전 형제 뒤(after)에 한 번에 삽입합니다.
+    
+    first_anchor가 없으면(토글 내부) 맨 앞에 삽입할 수 없으므로, 남겨둘 자식이 있는데
+    맨 앞 자식을 새로 넣어야 하면 아무것도 하지 않고 None을 반환합니다 (호출자가 부모째 교체).
+    
+    끝난 삭제/삽입은 journal에 key+'s'(managers | assignees) 목록의 변경으로 기록합니다.
+    
+    Returns:
+        list | None: 새 자식 상태 목록
+    """
+    matches = _match_in_order(previous, desired, key)
+    
+    # 그대로 두거나 제자리 수정할 이전 자식 {새 인덱스: 이전 상태}
+    retained = {
+        j: previous[i] for j, i in matches.items()
+        if previous[i]['fingerprint'] == desired[j]['fingerprint']
+    }
+    if first_anchor is None and desired and 0 not in retained and retained:
+        return None
+    if patch is not None:
+        candidates = [(j, i) for j, i in matches.items() if j not in retained]
+        patched = await executor.run_all([patch(previous[i], desired[j]) for j, i in candidates])
+        for (j, i), ok in zip(candidates, patched):
+            if ok:
+                retained[j] = previous[i]
+    
+    retained_ids = {item['block_id'] for item in retained.values()}
+    await _delete_blocks(
+        executor, [item['block_id'] for item in previous if item['block_id'] not in retained_ids], stats,
+        journal=journal
+    )
+    
+    new_states = []
+    pending = []
+    anchor_id = first_anchor
+    
+    async def flush():
+        nonlocal anchor_id
+        if not pending:
+            return
+        batch = list(pending)
+        hooks = journal.append_hooks(f"{key}s", parent_id, lambda offset, ids: [
+            make_state(entry, block_id) for entry, block_id in zip(batch[offset:], ids)
+        ])
+        created_ids = await _insert_after(
+            executor, parent_id, anchor_id, [entry['block'] for entry in batch], stats, hooks
+        )
+        new_states.extend(make_state(entry, block_id) for entry, block_id in zip(pending, created_ids))
+        anchor_id = created_ids[-1]
+        pending.clear()
+    
+    for j, entry in enumerate(desired):
+        if j in retained:
+            await flush()
+            new_states.append(retained[j])
+            anchor_id = retained[j]['block_id']
+            stats.add('kept')
+        else:
+            pending.append(entry)
+    await flush()
+    
+    return new_states
+
+def _assignee_state(entry: dict, block_id: str) -> dict:
+    return {'assignee': entry['assignee'], 'fingerprint': entry['fingerprint'], 'block_id': block_id}
+
+async def _resolve_assignee_ids(executor: NotionExecutor, manager_state: dict, journal: _PublishJournal) -> bool:
+    """담당자 토글의 제출자 토글 ID를 아직 모르면 한 번 조회해서 채웁니다. 개수가 안 맞으면 False"""
+    assignees = manager_state['assignees']
+    if all(a.get('block_id') for a in assignees):
+        return True
+    
+    children = [child async for child in iter_block_children(executor, manager_state['block_id'])]
+    if len(children) != len(assignees):
+        return False
+    for assignee_state, child in zip(assignees, children):
+        assignee_state['block_id'] = child['id']
+    journal.record('resolve', block_id=manager_state['block_id'], assignee_ids=[child['id'] for child in children])
+    return True
+
+async def _resume_interrupted(executor: NotionExecutor, state: dict, journal: _PublishJournal,
+                             stats: '_PublishStats'):
+    """중단된 게시의 뒷정리: 아직 못 지운 블록, 응답을 받지 못한 추가 요청이 만든 블록을 지웁니다."""
+    # 이미 지워졌으면 무시
+    pending_deletes = state.pop('pending_deletes', None)
+    if pending_deletes:
+        await _delete_blocks(executor, pending_deletes, stats, ignore_errors=True, journal=journal)
+    if state.get('uncertain_appends'):
+        await _remove_unjournaled_appends(executor, state, journal, stats)
+
+async def _reconcile_children(executor: NotionExecutor, parent_id: str, known_ids: list,
+                              stats: '_PublishStats', journal: _PublishJournal, after: str = None) -> list:
+    """
+    부모의 실제 자식 블록을 한 번 훑어 게시 상태와 맞춥니다 (after가 있으면 그 블록 뒤의 자식만).
+    
+    GitHub Actions와 API 서버처럼 상태 파일을 따로 가진 곳에서 번갈아 게시하면 페이지에
+    이 상태가 모르는 블록이 생기고, 이 상태가 아는 블록은 지워져 있을 수 있습니다.
+    모르는 블록은 지우고, 지워진 블록은 저널에 삭제로 기록합니다.
+    
+    Returns:
+        list: 페이지에 남아 있는 known_ids (페이지 순서). 빠진 ID는 호출자가 상태에서 뺍니다.
+    """
+    known = set(known_ids)
+    live_ids, unknown_ids = [], []
+    seen_after = after is None
+    async for block in iter_block_children(executor, parent_id):
+        if not seen_after:
+            seen_after = block['id'] == after
+            continue
+        (live_ids if block['id'] in known else unknown_ids).append(block['id'])
+    
+    if unknown_ids:
+        logger.info(f"게시 상태에 없는 Notion 블록 {len(unknown_ids)}개를 지웁니다 (다른 곳에서 게시한 블록 등).")
+        await _delete_blocks(executor, unknown_ids, stats, journal=journal)
+    live = set(live_ids)
+    for block_id in known_ids:
+        if block_id not in live:
+            journal.record('delete', block_id=block_id)
+    return live_ids
+
+async def _reconcile_page(executor: NotionExecutor, state: dict, common_blocks: list,
+                          journal: _PublishJournal, stats: '_PublishStats'):
+    """담당자별 기도제목 섹션 이후 블록과 공통 기도제목 섹션 제목 아래 블록을 게시 상태와 맞춥니다."""
+    manager_ids = [manager['block_id'] for manager in state['managers']]
+    live_ids = await _reconcile_children(
+        executor, PAGE_ID, manager_ids, stats, journal, after=state['anchors']['prayer_section']
+    )
+    # 블록은 옮길 수 없으므로 남은 블록의 순서는 상태와 같음
+    live = set(live_ids)
+    for block_id in manager_ids:
+        if block_id not in live:
+            _forget_block(state, block_id)
+    
+    common_section_id = state['anchors'].get('common_section')
+    if common_section_id and common_blocks:
+        common_ids = list((state.get('common') or {}).get('block_ids', []))
+        live = set(await _reconcile_children(executor, common_section_id, common_ids, stats, journal))
+        for block_id in common_ids:
+            if block_id not in live:
+                _forget_block(state, block_id)
+
+async def _sync_common_section(executor: NotionExecutor, state: dict, common_blocks: list,
+                               journal: _PublishJournal, stats: '_PublishStats'):
+    """공통 기도제목 섹션: 지문이 바뀐 경우에만 교체합니다."""
+    common_section_id = state['anchors'].get('common_section')
+    if not common_section_id or not common_blocks:
+        return
+    common_fingerprint = _block_fingerprint(common_blocks)
+    previous_common = state.get('common')
+    if not previous_common or previous_common.get('fingerprint') != common_fingerprint:
+        if previous_common:
+            await _delete_blocks(executor, previous_common.get('block_ids', []), stats, journal=journal)
+        state['common'] = await _append_common_blocks(executor, common_section_id, common_blocks, journal)
+        stats.add('inserted', len(common_blocks))
+
+async def _patch_manager(executor: NotionExecutor, manager_state: dict, entry: dict,
+                         stats: '_PublishStats', journal: _PublishJournal) -> bool:
+    """
+    이름이 같고 내용만 바뀐 담당자 토글(분할 게시에서는 담당자 페이지)을 제출자 토글 단위로 수정합니다.
+    제자리 수정이 안 되면 아무것도 하지 않고 False를 반환합니다 (호출자가 통째로 교체).
+    """
+    if all(a.get('block_id') for a in manager_state['assignees']):
+        assignee_ids = [a['block_id'] for a in manager_state['assignees']]
+        live = set(await _reconcile_children(executor, manager_state['block_id'], assignee_ids, stats, journal))
+        manager_state['assignees'] = [a for a in manager_state['assignees'] if a['block_id'] in live]
+    elif not await _resolve_assignee_ids(executor, manager_state, journal):
+        return False
+    assignee_states = await _sync_children(
+        executor, manager_state['block_id'], None,
+        manager_state['assignees'], entry['assignees'], 'assignee', _assignee_state, stats, journal
+    )
+    if assignee_states is None:
+        return False
+    manager_state['assignees'] = assignee_states
+    manager_state['fingerprint'] = entry['fingerprint']
+    journal.record('patched', block_id=manager_state['block_id'], fingerprint=entry['fingerprint'])
+    stats.add('patched_managers')
+    return True
+
+async def _publish_diff(executor: NotionExecutor, state: dict, common_blocks: list, manager_entries: list,
+                        journal: _PublishJournal) -> dict:
+    """
+    저장된 지문/블록 ID와 비교해 바뀐 공통 섹션, 담당자 토글, 제출자 토글만 다시 씁니다.
+    먼저 섹션의 실제 블록을 훑어 상태에 없는 블록(다른 곳에서 게시한 블록)을 지웁니다.
+    """
+    stats = _PublishStats()
+    await _resume_interrupted(executor, state, journal, stats)
+    await _reconcile_page(executor, state, common_blocks, journal, stats)
+    await _sync_common_section(executor, state, common_blocks, journal, stats)
+    
+    # ── 담당자 토글: 이름이 같고 내용만 바뀐 담당자는 제출자 토글 단위로 수정 ──
+    async def patch_manager(manager_state: dict, entry: dict) -> bool:
+        return await _patch_manager(executor, manager_state, entry, stats, journal)
+    
+    manager_states = await _sync_children(
+        executor, PAGE_ID, state['anchors']['prayer_section'],
+        state['managers'], manager_entries, 'manager', _manager_state, stats, journal, patch=patch_manager
+    )
+    state['managers'] = manager_states
+    return stats
+
+# ============================================================
+# 담당자별 페이지 분할 게시 (NOTION_LAYOUT=sharded)
+# ============================================================
+
+def _shard_page_properties(manager: str) -> dict:
+    return {
+        "title": {
+            "title": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": f"{manager} 담당 기도제목"
+                    }
+                }
+            ]
+        }
+    }
+
+async def _create_shard_pages(executor: NotionExecutor, manager_entries: list, journal: _PublishJournal) -> list:
+    """
+    담당자마다 루트 페이지의 하위 페이지를 만들고 제출자 토글을 채운 뒤 담당자 상태 목록을 반환합니다.
+    
+    하위 페이지는 루트 페이지 맨 끝에 링크(child_page 블록)로 붙으므로 배정 순서대로 차례로 만들고,
+    페이지 내용은 동시에 채웁니다. 상태/저널에서 담당자 블록 ID는 페이지 ID입니다.
+    """
+    create = executor.client.pages.create
+    created = []
+    for entry in manager_entries:
+        hooks = journal.append_hooks(
+            'managers', PAGE_ID, lambda offset, ids, entry=entry: [_manager_state(entry, ids[0])]
+        )
+        hooks['on_request'](None, 1)
+        page = await executor.call(
+            create,
+            idempotent=False,
+            parent={"page_id": PAGE_ID},
+            icon={"type": "emoji", "emoji": "📌"},
+            properties=_shard_page_properties(entry['manager'])
+        )
+        hooks['on_created'](0, None, [page['id']], False)
+        created.append((entry, page['id'], hooks))
+    
+    async def fill(entry: dict, page_id: str, hooks: dict) -> dict:
+        if entry['assignees']:
+            await append_block_tree(executor, page_id, [assignee['block'] for assignee in entry['assignees']])
+        hooks['on_created'](0, None, [page_id], True)
+        return _manager_state(entry, page_id)
+    
+    return await executor.run_all([fill(entry, page_id, hooks) for entry, page_id, hooks in created])
+
+async def _publish_sharded(executor: NotionExecutor, state: dict, common_blocks: list, manager_entries: list,
+                           journal: _PublishJournal) -> dict:
+    """
+    분할 게시: 루트 페이지에는 공통 기도제목과 담당자 페이지 링크만 두고,
+    담당자 페이지는 지문이 바뀐 것만 서로 동시에 다시 씁니다.
+    
+    - 지문이 같은 담당자 페이지는 호출 없이 그대로 둡니다.
+    - 바뀐 페이지는 제출자 토글 단위로 고치고, 안 되면 페이지째 다시 만듭니다.
+    - 배정에서 빠진 담당자 페이지는 지우고(보관), 새 담당자 페이지는 맨 끝에 만듭니다.
     """
-    notion = create_notion_client()
+    stats = _PublishStats()
+    await _resume_interrupted(executor, state, journal, stats)
+    await _reconcile_page(executor, state, common_blocks, journal, stats)
+    await _sync_common_section(executor, state, common_blocks, journal, stats)
     
+    previous = {shard['manager']: shard for shard in state['managers']}
+    desired = {entry['manager'] for entry in manager_entries}
+    await _delete_blocks(
+        executor, [shard['block_id'] for shard in state['managers'] if shard['manager'] not in desired], stats,
+        journal=journal
+    )
+    
+    async def update_shard(shard: dict, entry: dict):
+        if shard['fingerprint'] == entry['fingerprint']:
+            stats.add('kept')
+            return shard
+        if await _patch_manager(executor, shard, entry, stats, journal):
+            return shard
+        await _delete_blocks(executor, [shard['block_id']], stats, journal=journal)
+        return None
+    
+    updated = await executor.run_all([
+        update_shard(previous[entry['manager']], entry) for entry in manager_entries if entry['manager'] in previous
+    ])
+    shards = {shard['manager']: shard for shard in updated if shard}
+    
+    new_entries = [entry for entry in manager_entries if entry['manager'] not in shards]
+    for shard in await _create_shard_pages(executor, new_entries, journal):
+        shards[shard['manager']] = shard
+    stats.add('inserted', len(new_entries))
+    
+    state['managers'] = [shards[entry['manager']] for entry in manager_entries]
+    return stats
+
+# ============================================================
+# 게시 진입점
+# ============================================================
+
+def _load_publish_inputs(common_prayers, assignments):
+    """인자로 받지 못한 공통 기도제목 / 담당자 배정을 구글 시트(실패 시 상수)에서 채웁니다."""
     # ── 공통 기도제목 로드 (인자 없으면 구글 시트에서 자동 로드) ──
     if common_prayers is None:
         try:
@@ -192,175 +1366,298 @@ def publish_to_notion(processed_data, common_prayers=None, assignments=None):
             logger.warning(f"담당자 배정 자동 로드 실패, DEFAULT_ASSIGNMENTS 사용: {e}")
             assignments = PrayerAssignments.get_assignments()
     
-    # 기존 블록 가져오기
-    blocks = notion.blocks.children.list(block_id=PAGE_ID)
+    return common_prayers, assignments
+
+async def publish_to_notion_async(processed_data, common_prayers=None, assignments=None, mode=None):
+    """
+    Notion 페이지에 기도제목 데이터를 게시합니다 (AsyncClient 기반, FastAPI 이벤트 루프에서 await).
+    
+    Args:
+        processed_data: 처리된 기도제목 데이터
+        common_prayers: 공통 기도제목 목록 (None이면 구글 시트에서 자동 로드)
+        assignments: 담당자 배정 딕셔너리 (None이면 구글 시트에서 자동 로드)
+        mode: 'diff' (바뀐 토글만 수정) | 'full' (섹션 전체 재구성). None이면 NOTION_PUBLISH_MODE
+    
+    Returns:
+        dict: 게시 방식과 API 호출 통계 (calls, retries, rate_limited, wall_time_sec, calls_per_sec)
+    """
+    if common_prayers is None or assignments is None:
+        # 구글 시트 조회는 동기 I/O이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        common_prayers, assignments = await asyncio.to_thread(_load_publish_inputs, common_prayers, assignments)
+    
+    client = create_async_notion_client()
+    try:
+        executor = NotionExecutor(client)
+        published_mode = await _publish(executor, processed_data, common_prayers, assignments, mode)
+        return _log_executor_summary(executor, published_mode)
+    finally:
+        await client.aclose()
+
+def publish_to_notion(processed_data, common_prayers=None, assignments=None, mode=None, timeout: float = None):
+    """
+    Notion 페이지에 기도제목 데이터를 게시합니다 (main.py 등 동기 코드용 진입점).
+    publish_to_notion_async를 새 이벤트 루프에서 실행하며, 인자와 반환값이 같습니다.
+    이미 이벤트 루프가 도는 곳(FastAPI 핸들러 등)에서는 publish_to_notion_async를 await하세요.
+    
+    timeout(초)을 넘기면 게시를 취소하고 asyncio.TimeoutError를 던집니다.
+    끝난 작업은 게시 저널에 남아 있으므로 다음 게시가 이어서 진행합니다.
+    """
+    return asyncio.run(asyncio.wait_for(publish_to_notion_async(
+        processed_data, common_prayers=common_prayers, assignments=assignments, mode=mode
+    ), timeout))
+
+async def _publish(executor: NotionExecutor, processed_data, common_prayers, assignments, mode,
+                   dry_run: bool = False) -> str:
+    """
+    앵커 확인 → 마지막 업데이트 갱신 → diff 게시(가능하면) 또는 전체 재구성.
+    실제로 사용한 게시 방식('diff' | 'full')을 반환하며, dry_run이면 상태 파일/저널을 건드리지 않습니다.
+    
+    직전 게시가 중간에 실패해 저널이 남아 있으면 저널을 재생한 상태에서 diff로 이어서 게시합니다.
+    """
+    journal = _PublishJournal(NOTION_JOURNAL_FILE, read_only=dry_run)
+    try:
+        return await _publish_journaled(executor, journal, processed_data, common_prayers, assignments,
+                                        mode, dry_run)
+    finally:
+        journal.close()
+
+async def _publish_journaled(executor: NotionExecutor, journal: _PublishJournal, processed_data,
+                             common_prayers, assignments, mode, dry_run: bool) -> str:
+    mode = (mode or NOTION_PUBLISH_MODE).lower()
+    
+    common_blocks = _build_common_prayers_blocks(common_prayers) if common_prayers else []
+    manager_entries = _build_manager_entries(assignments, processed_data['prayers_by_requester'])
+    
+    state, resumed_ops = _load_resumable_state(journal)
+    if state is not None and state.get('layout', 'single') != NOTION_LAYOUT:
+        # 페이지 구성이 바뀌면 전체 재구성
+        if not dry_run:
+            logger.info(f"Notion 페이지 구성이 {NOTION_LAYOUT}(으)로 바뀌어 전체 재구성으로 게시합니다.")
+        state, resumed_ops = None, 0
+    # 저널을 재생한 상태는 실제 페이지와 같으므로 mode와 관계없이 diff로 남은 작업만 진행
+    use_diff = state is not None and (mode == 'diff' or resumed_ops > 0)
+    if resumed_ops and not dry_run:
+        logger.info(f"중단된 이전 Notion 게시를 이어서 진행합니다 (완료된 작업 {resumed_ops}개 재생)")
+    
+    # 앵커 찾기: diff는 저장된 앵커 ID를 blocks.retrieve로 확인하고, 어긋났을 때만 페이지를 훑음
+    # (담당자별 기도제목 제목에서 중단). 전체 재구성은 지울 블록 ID까지 페이지 끝까지 스트리밍
+    anchors = await _load_stored_anchors(executor, state) if use_diff else None
+    scan = None
+    if anchors is None:
+        scan = await _scan_page(executor, collect_stale=not use_diff)
+        anchors = scan['anchors']
     
     # ── 마지막 업데이트 블록 찾아서 업데이트 ──
-    for block in blocks.get('results', []):
-        if (block['type'] == 'callout' and 
-            any('마지막 업데이트' in text.get('text', {}).get('content', '') 
-                for text in block['callout']['rich_text'])):
-            notion.blocks.update(
-                block_id=block['id'],
-                callout={
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {
-                                "content": f"마지막 업데이트: {processed_data['last_updated']}"
-                            }
-                        }
-                    ],
-                    "icon": block['callout']['icon'],
-                    "color": block['callout']['color']
-                }
+    if anchors['callout']:
+        await _update_last_updated_callout(executor, anchors['callout'], processed_data['last_updated'])
+    
+    # ── diff 게시: 저장된 앵커가 현재 페이지와 같을 때만 ──
+    if (use_diff and anchors['prayer_section'] and
+            state['anchors'].get('common_section') == anchors['common_section'] and
+            state['anchors'].get('prayer_section') == anchors['prayer_section']):
+        try:
+            publish_changes = _publish_sharded if NOTION_LAYOUT == 'sharded' else _publish_diff
+            stats = await publish_changes(executor, state, common_blocks, manager_entries, journal)
+            if dry_run:
+                return 'diff'
+            state['anchors'] = _anchor_ids(anchors)
+            _save_publish_state(state)
+            journal.clear()
+            logger.info(
+                f"Notion 페이지 diff 업데이트 완료 (유지 {stats['kept']}, 삽입 {stats['inserted']}, "
+                f"삭제 {stats['deleted']}, 부분 수정 담당자 {stats['patched_managers']})"
             )
-            break
+            return 'diff'
+        except Exception as e:
+            # 네트워크/속도 제한 등 일시적 오류는 저널을 남긴 채 올려 보내 재시도가 이어서 게시하게 함
+            if dry_run or is_transient_error(e):
+                raise
+            # 상태 파일과 실제 페이지가 어긋난 경우 (수동 편집 등) → 최신 블록으로 전체 재구성
+            # 상태 파일은 전체 재구성이 끝난 뒤에 덮어씀. 재구성이 'full'을 저널에 남기기 전에 중단되면
+            # 다음 게시는 직전 상태 + 저널로 페이지를 복원해 이어서 진행 (공통 섹션 블록 ID 유지)
+            logger.warning(f"Notion diff 게시 실패, 전체 재구성으로 전환: {e}")
+            scan = await _scan_page(executor, collect_stale=True)
+    elif use_diff:
+        logger.info("페이지 구조가 저장된 Notion 게시 상태와 달라 전체 재구성으로 게시합니다.")
+        scan = await _scan_page(executor, collect_stale=True)
+    elif mode == 'diff' and not dry_run:
+        logger.info("저장된 Notion 게시 상태가 없어 전체 재구성으로 게시합니다.")
     
-    # ── 공통 기도제목 섹션 업데이트 ──
-    common_section_id = None
-    for block in blocks.get('results', []):
-        if (block['type'] == 'heading_1' and 
-            any('공통 기도제목' in text.get('text', {}).get('content', '') 
-                for text in block['heading_1']['rich_text'])):
-            common_section_id = block['id']
-            break
-    
-    if common_section_id and common_prayers:
-        # 공통 기도제목 섹션 이후, 담당자별 기도제목 섹션 이전 블록 삭제
-        section_found = False
-        prayer_section_reached = False
-        for block in blocks.get('results', []):
-            if block['id'] == common_section_id:
-                section_found = True
-                continue
-            if section_found and not prayer_section_reached:
-                # 담당자별 기도제목 제목을 만나면 중단
-                if (block['type'] == 'heading_1' and 
-                    any('담당자별 기도제목' in text.get('text', {}).get('content', '') 
-                        for text in block['heading_1']['rich_text'])):
-                    prayer_section_reached = True
-                    break
-                notion.blocks.delete(block_id=block['id'])
+    state = await _publish_full(executor, scan, common_blocks, manager_entries, journal)
+    if not dry_run:
+        _save_publish_state(state)
+        journal.clear()
+        logger.info("Notion 페이지 업데이트 완료")
+    return 'full'
+
+def _log_executor_summary(executor: NotionExecutor, mode: str) -> dict:
+    """게시 1회의 API 호출 통계를 로그로 남기고 반환합니다."""
+    summary = {'mode': mode, **executor.summary()}
+    logger.info(
+        f"Notion API 호출 {summary['calls']}회 / {summary['wall_time_sec']}초 "
+        f"({summary['calls_per_sec']} calls/s, 재시도 {summary['retries']}회, 429 {summary['rate_limited']}회)"
+    )
+    return summary
+
+# ============================================================
+# dry-run 게시 계획 (네트워크 호출 없음)
+# ============================================================
+
+class _PlanningClient:
+    """
+    Notion AsyncClient 대신 게시 알고리즘에 끼워 넣는 기록용 클라이언트.
+    
+    페이지 상태는 게시 상태 파일(직전 게시의 앵커/담당자/제출자 블록 ID)을 스냅샷으로 사용하고,
+    호출마다 요청 수 / 페이로드 크기 / 추가·삭제 블록 수만 기록합니다.
+    """
+    
+    def __init__(self, state):
+        self.requests = {'retrieve': 0, 'list': 0, 'update': 0, 'delete': 0, 'append': 0, 'create_page': 0}
+        self.payload_bytes = 0
+        self.blocks_appended = 0
+        self.blocks_deleted = 0
+        self._next_id = 0
+        self._kinds = {}
+        self._children = {PAGE_ID: []}
+        self._load_snapshot(state or {})
         
-        # 새 공통 기도제목 블록 추가
-        if common_prayers:
-            common_blocks = _build_common_prayers_blocks(common_prayers)
-            if common_blocks:
-                notion.blocks.children.append(
-                    block_id=common_section_id,
-                    children=common_blocks
-                )
-    
-    # ── 담당자별 기도제목 섹션 업데이트 ──
-    prayer_section_id = None
-    for block in blocks.get('results', []):
-        if (block['type'] == 'heading_1' and 
-            any(text.get('text', {}).get('content') == "📖 담당자별 기도제목" 
-                for text in block['heading_1']['rich_text'])):
-            prayer_section_id = block['id']
-            break
-    
-    # 담당자별 기도제목 섹션 이후 블록 삭제
-    if prayer_section_id:
-        section_found = False
-        for block in blocks.get('results', []):
-            if section_found:
-                notion.blocks.delete(block_id=block['id'])
-            elif block['id'] == prayer_section_id:
-                section_found = True
-    
-    # 새로운 블록 추가 (담당자별 기도제목)
-    new_blocks = []
-    
-    # 각 담당자별 섹션 생성
-    for manager, assignees in assignments.items():
-        manager_blocks = {
-            "object": "block",
-            "type": "toggle",
-            "toggle": {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {
-                            "content": f"📌 {manager}"
-                        },
-                        "annotations": {
-                            "bold": True
-                        }
-                    }
-                ],
-                "children": []
-            }
+        self.blocks = SimpleNamespace(
+            retrieve=self._retrieve, update=self._update, delete=self._delete,
+            children=SimpleNamespace(list=self._list, append=self._append)
+        )
+        self.pages = SimpleNamespace(create=self._create_page)
+    
+    def _load_snapshot(self, state: dict):
+        anchors = state.get('anchors') or {}
+        page = self._children[PAGE_ID]
+        # 스냅샷이 없으면 앵커만 있는 페이지로 계획하고, 지울 블록 수는 알 수 없음으로 보고 (plan_publish_async)
+        for key, kind in (('callout', 'callout'), ('common_section', 'common_section'),
+                          ('prayer_section', 'prayer_section')):
+            block_id = anchors.get(key) or (None if state else f"snapshot-{key}")
+            if block_id:
+                self._kinds[block_id] = kind
+                page.append(block_id)
+        if anchors.get('common_section'):
+            self._children[anchors['common_section']] = list((state.get('common') or {}).get('block_ids', []))
+        for manager in state.get('managers', []):
+            page.append(manager['block_id'])
+            self._children[manager['block_id']] = [
+                assignee.get('block_id') or self._new_id() for assignee in manager['assignees']
+            ]
+    
+    def _new_id(self) -> str:
+        self._next_id += 1
+        return f"planned-{self._next_id}"
+    
+    def _snapshot_block(self, block_id: str) -> dict:
+        kind = self._kinds.get(block_id)
+        if kind == 'callout':
+            return {'id': block_id, 'type': 'callout', 'callout': {
+                'rich_text': [{'text': {'content': '마지막 업데이트'}}], 'icon': None, 'color': 'default'}}
+        if kind in ('common_section', 'prayer_section'):
+            title = '공통 기도제목' if kind == 'common_section' else "📖 담당자별 기도제목"
+            return {'id': block_id, 'type': 'heading_1', 'heading_1': {'rich_text': [{'text': {'content': title}}]}}
+        return {'id': block_id, 'type': 'toggle', 'toggle': {'rich_text': []}}
+    
+    def _count_payload(self, kwargs: dict):
+        self.payload_bytes += len(json.dumps(kwargs, ensure_ascii=False).encode('utf-8'))
+    
+    async def _retrieve(self, block_id):
+        self.requests['retrieve'] += 1
+        return self._snapshot_block(block_id)
+    
+    async def _update(self, block_id, **kwargs):
+        self.requests['update'] += 1
+        self._count_payload(kwargs)
+        return self._snapshot_block(block_id)
+    
+    async def _delete(self, block_id):
+        self.requests['delete'] += 1
+        self.blocks_deleted += 1
+        return {}
+    
+    async def _list(self, block_id, page_size=100, start_cursor=None):
+        self.requests['list'] += 1
+        children = self._children.get(block_id, [])
+        start = int(start_cursor) if start_cursor else 0
+        end = start + page_size
+        return {
+            'results': [self._snapshot_block(child_id) for child_id in children[start:end]],
+            'has_more': end < len(children),
+            'next_cursor': str(end) if end < len(children) else None
         }
-        
-        for assignee in assignees:
-            if assignee in processed_data['prayers_by_requester']:
-                assignee_prayers = processed_data['prayers_by_requester'][assignee]
-                
-                # 기도제목 분할 로직 (SPLIT_ASSIGNMENTS 확인)
-                if hasattr(PrayerAssignments, 'SPLIT_ASSIGNMENTS') and assignee in PrayerAssignments.SPLIT_ASSIGNMENTS:
-                    split_managers = PrayerAssignments.SPLIT_ASSIGNMENTS[assignee]
-                    if manager in split_managers:
-                        total_items = len(assignee_prayers)
-                        num_splits = len(split_managers)
-                        split_index = split_managers.index(manager)
-                        
-                        # 균등 분할 (나머지는 앞쪽 담당자가 가져감)
-                        base_chunk = total_items // num_splits
-                        remainder = total_items % num_splits
-                        
-                        start_idx = split_index * base_chunk + min(split_index, remainder)
-                        end_idx = start_idx + base_chunk + (1 if split_index < remainder else 0)
-                        
-                        assignee_prayers = assignee_prayers[start_idx:end_idx]
-
-                assignee_toggle = {
-                    "object": "block",
-                    "type": "toggle",
-                    "toggle": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": f"🙏 {assignee}님의 기도제목"
-                                },
-                                "annotations": {
-                                    "bold": True,
-                                    "color": "green"
-                                }
-                            }
-                        ],
-                        "children": []
-                    }
-                }
-                
-                for prayer in assignee_prayers:
-                    assignee_toggle["toggle"]["children"].append({
-                        "object": "block",
-                        "type": "callout",
-                        "callout": {
-                            "rich_text": create_prayer_content_rich_text(prayer),
-                            "icon": {
-                                "type": "emoji",
-                                "emoji": "✨"
-                            },
-                            "color": "gray_background"
-                        }
-                    })
-                
-                manager_blocks["toggle"]["children"].append(assignee_toggle)
-        
-        new_blocks.append(manager_blocks)
     
-    # 블록 추가
-    if new_blocks:
-        notion.blocks.children.append(
-            block_id=PAGE_ID,
-            children=new_blocks
+    async def _create_page(self, **kwargs):
+        self.requests['create_page'] += 1
+        self._count_payload(kwargs)
+        self.blocks_appended += 1
+        return {'id': self._new_id()}
+    
+    async def _append(self, block_id, children, after=None):
+        self.requests['append'] += 1
+        self._count_payload({'children': children})
+        self.blocks_appended += sum(_count_blocks(child) for child in children)
+        return {'results': [{'id': self._new_id()} for _ in children]}
+
+def _count_blocks(block: dict) -> int:
+    return 1 + sum(_count_blocks(child) for child in _block_children(block))
+
+async def plan_publish_async(processed_data, common_prayers=None, assignments=None, mode=None) -> dict:
+    """
+    실제 게시와 같은 알고리즘(diff/전체 재구성, 요청 분할)을 네트워크 없이 실행해 게시 계획을 계산합니다.
+    
+    Returns:
+        dict: mode, requests(종류별 요청 수), total_requests, blocks_to_delete, blocks_to_append,
+              payload_bytes, estimated_seconds(설정된 속도 제한 기준), snapshot, warnings
+              게시 상태 파일(페이지 스냅샷)이 없으면 requests['delete']와 blocks_to_delete는 None입니다.
+    """
+    if common_prayers is None or assignments is None:
+        common_prayers, assignments = await asyncio.to_thread(_load_publish_inputs, common_prayers, assignments)
+    
+    state, resumed_ops = _load_resumable_state(_PublishJournal(NOTION_JOURNAL_FILE, read_only=True))
+    client = _PlanningClient(state)
+    executor = NotionExecutor(client, rate=0)
+    planned_mode = await _publish(executor, processed_data, common_prayers, assignments, mode, dry_run=True)
+    
+    total_requests = sum(client.requests.values())
+    rate = notion_executor.NOTION_RATE_LIMIT
+    burst = notion_executor.NOTION_RATE_BURST
+    estimated_seconds = max(0, total_requests - burst) / rate if rate > 0 else 0.0
+    
+    requests = dict(client.requests)
+    blocks_to_delete = client.blocks_deleted
+    warnings = []
+    if state is None:
+        # 실제 페이지에 남아 있는 블록을 모르므로 0이 아니라 알 수 없음(None)
+        requests['delete'] = blocks_to_delete = None
+        warnings.append(
+            "페이지 스냅샷(게시 상태 파일)이 없어 지울 블록 수를 알 수 없습니다 "
+            "(요청 수와 예상 시간은 삭제를 뺀 최소값)"
         )
+    elif client.blocks_deleted >= PLAN_WARN_DELETES:
+        warnings.append(f"삭제 블록이 {client.blocks_deleted}개입니다 (기준 {PLAN_WARN_DELETES}개)")
+    if resumed_ops:
+        warnings.append(f"중단된 이전 게시를 이어서 진행합니다 (저널의 완료 작업 {resumed_ops}개)")
+    if planned_mode == 'full' and (mode or NOTION_PUBLISH_MODE).lower() == 'diff':
+        warnings.append("게시 상태가 없거나 맞지 않아 전체 재구성으로 게시됩니다")
     
-    logger.info("Notion 페이지 업데이트 완료")
+    return {
+        'mode': planned_mode,
+        'requests': requests,
+        'total_requests': total_requests,
+        'blocks_to_delete': blocks_to_delete,
+        'blocks_to_append': client.blocks_appended,
+        'payload_bytes': client.payload_bytes,
+        'estimated_seconds': round(estimated_seconds, 1),
+        'snapshot': NOTION_STATE_FILE if state else None,
+        'warnings': warnings
+    }
+
+def plan_publish(processed_data, common_prayers=None, assignments=None, mode=None) -> dict:
+    """plan_publish_async의 동기 진입점 (main.py --notion-dry-run)"""
+    return asyncio.run(plan_publish_async(
+        processed_data, common_prayers=common_prayers, assignments=assignments, mode=mode
+    ))
 
 def main():
     """메인 실행 함수"""
@@ -0,0 +1,106 @@
+"""
+CBF 기도제목 자동화 V2 - 기도제목 레코드 타입
+
+처리된 기도제목 한 건을 7개 키 dict 대신 __slots__ 객체로 보관합니다.
+  - 키 문자열/인스턴스 __dict__ 없이 필드 7개만 저장
+  - 교회, 성별, 나이, 관계, 이름처럼 반복되는 값은 sys.intern으로 한 벌만 보관
+
+기존 코드와의 호환을 위해 prayer['name'], prayer.get('church') 형태의 읽기 접근을 지원하며,
+JSON 캐시 / API 응답 / DB 저장 등 직렬화 경계에서만 to_dict()로 기존 dict 형태로 변환합니다.
+"""
+
+import sys
+from typing import Dict, List
+
+
+# JSON 직렬화 시 키 순서 (기존 dict 형태와 동일)
+PRAYER_FIELDS = ('name', 'target_name', 'gender', 'age', 'relationship', 'prayer_content', 'church')
+
+_intern = sys.intern
+
+
+class PrayerRecord:
+    """처리된 기도제목 한 건 (읽기 전용으로 사용)"""
+
+    __slots__ = PRAYER_FIELDS
+
+    def __init__(self, name: str = '', target_name: str = '', gender: str = '', age: str = '',
+                 relationship: str = '', prayer_content: str = '', church: str = ''):
+        # 반복도가 높은 필드는 intern하여 같은 문자열을 공유
+        self.name = _intern(name)
+        self.target_name = _intern(target_name)
+        self.gender = _intern(gender)
+        self.age = _intern(age)
+        self.relationship = _intern(relationship)
+        self.prayer_content = prayer_content
+        self.church = _intern(church)
+
+    # ── dict 호환 읽기 접근 ──
+    def __getitem__(self, key: str) -> str:
+        if key not in PRAYER_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        if key not in PRAYER_FIELDS:
+            return default
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in PRAYER_FIELDS
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PrayerRecord):
+            return all(getattr(self, f) == getattr(other, f) for f in PRAYER_FIELDS)
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PrayerRecord({self.name!r} → {self.target_name!r})"
+
+    # ── 직렬화 경계 변환 ──
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'target_name': self.target_name,
+            'gender': self.gender,
+            'age': self.age,
+            'relationship': self.relationship,
+            'prayer_content': self.prayer_content,
+            'church': self.church
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PrayerRecord':
+        return cls(**{field: data.get(field, '') for field in PRAYER_FIELDS})
+
+
+def to_json_shape(prayers_by_requester: Dict[str, list]) -> Dict[str, List[dict]]:
+    """{제출자: [PrayerRecord]} → 기존 JSON 형태 {제출자: [dict]} (dict가 섞여 있어도 그대로 통과)"""
+    return {
+        requester: [
+            prayer.to_dict() if isinstance(prayer, PrayerRecord) else prayer
+            for prayer in prayers
+        ]
+        for requester, prayers in prayers_by_requester.items()
+    }
+
+def from_json_shape(prayers_by_requester: Dict[str, List[dict]]) -> Dict[str, List[PrayerRecord]]:
+    """기존 JSON 형태 {제출자: [dict]} → {제출자: [PrayerRecord]}"""
+    return {
+        _intern(requester): [
+            prayer if isinstance(prayer, PrayerRecord) else PrayerRecord.from_dict(prayer)
+            for prayer in prayers
+        ]
+        for requester, prayers in prayers_by_requester.items()
+    }
+
+def serialize_processed_data(processed_data: dict) -> dict:
+    """processed_data(또는 API 캐시)의 prayers_by_requester만 JSON 형태로 바꾼 얕은 사본을 반환합니다."""
+    if not processed_data or 'prayers_by_requester' not in processed_data:
+        return processed_data
+    return {
+        **processed_data,
+        'prayers_by_requester': to_json_shape(processed_data['prayers_by_requester'])
+    }
@@ -0,0 +1,359 @@
+"""
+CBF 기도제목 자동화 V2 - 스프레드시트 백엔드
+
+google_sheets.py의 모든 읽기/쓰기는 이 모듈의 백엔드 인터페이스를 거칩니다.
+
+  - GoogleSheetsBackend: 실제 Google Sheets API (values().get / batchGet / update / clear)
+  - LocalSheetsBackend:  인메모리 시트 (examples/ 의 설문 응답 CSV 또는 합성 데이터)
+
+LocalSheetsBackend를 사용하면 서비스 계정 없이도 수집 → 처리 → API 경로 전체를
+노트북에서 프로파일링/부하 테스트할 수 있습니다.
+
+사용법:
+    SHEETS_BACKEND=local python main.py                       # examples CSV 사용
+    SHEETS_BACKEND=local LOCAL_SYNTHETIC_ROWS=100000 python main.py   # 합성 데이터 10만 행
+"""
+
+import os
+import re
+import csv
+import random
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# 설정
+# ============================================================
+SHEETS_BACKEND = os.getenv('SHEETS_BACKEND', 'google').lower()
+LOCAL_RESPONSES_CSV = os.getenv('LOCAL_RESPONSES_CSV', os.path.join('examples', 'playlist.csv'))
+LOCAL_SYNTHETIC_ROWS = int(os.getenv('LOCAL_SYNTHETIC_ROWS', '0'))
+
+# 응답 시트 기본 헤더 (setup_sheets.py의 SURVEY_SHEET_HEADERS와 동일)
+RESPONSE_HEADERS = [
+    "타임스탬프",
+    "이름",
+    "교회",
+    "이름(구도자)",
+    "성별",
+    "나이 (출생연도로 기입 부탁드립니다 ex. 98년생)",
+    "관계 (ex 사촌동생, 학교 친구, 직장 동료, 본인)",
+    "구체적인 기도제목 (가능한 경우 1. 2. 등 번호로 기입)"
+]
+
+
+class SheetsBackend(ABC):
+    """스프레드시트 백엔드 인터페이스 (범위 읽기 / 일괄 읽기 / 범위 쓰기 / 범위 비우기)"""
+
+    name = 'base'
+
+    @abstractmethod
+    def read_range(self, spreadsheet_id: str, range_name: str) -> List[list]:
+        """범위의 값을 2차원 리스트로 반환합니다 (값이 없으면 빈 리스트)."""
+
+    @abstractmethod
+    def batch_read(self, spreadsheet_id: str, ranges: List[str]) -> List[List[list]]:
+        """여러 범위를 한 번에 읽어 범위별 2차원 리스트 목록을 반환합니다."""
+
+    @abstractmethod
+    def write_range(self, spreadsheet_id: str, range_name: str, values: List[list]) -> None:
+        """범위의 왼쪽 위 셀부터 값을 씁니다 (valueInputOption=RAW)."""
+
+    @abstractmethod
+    def clear(self, spreadsheet_id: str, range_name: str) -> None:
+        """범위의 값을 비웁니다."""
+
+
+class GoogleSheetsBackend(SheetsBackend):
+    """Google Sheets API 백엔드 (google_sheets.get_google_sheets_service 싱글톤 사용)"""
+
+    name = 'google'
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _values(self):
+        from google_sheets import get_google_sheets_service
+        return get_google_sheets_service().spreadsheets().values()
+
+    def _execute(self, request) -> dict:
+        """
+        요청을 실행합니다. 서비스 객체의 httplib2 연결은 스레드 안전하지 않으므로
+        (동시 수집 / API 서버 스레드 풀) 스레드마다 인증된 연결을 따로 만들어 재사용합니다.
+        소켓 제한 시간은 SHEETS_FETCH_TIMEOUT으로 맞춰, 제한 시간을 넘겨 결과를 버린 요청도 곧 끝나게 합니다.
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import google_auth_httplib2
+            from googleapiclient.http import build_http
+            from google_sheets import get_google_credentials, SHEETS_FETCH_TIMEOUT
+            base_http = build_http()
+            if SHEETS_FETCH_TIMEOUT > 0:
+                base_http.timeout = SHEETS_FETCH_TIMEOUT
+            http = self._local.http = google_auth_httplib2.AuthorizedHttp(get_google_credentials(), http=base_http)
+        return request.execute(http=http)
+
+    def read_range(self, spreadsheet_id: str, range_name: str) -> List[list]:
+        result = self._execute(self._values().get(
+            spreadsheetId=spreadsheet_id,
+            range=range_name
+        ))
+        return result.get('values', [])
+
+    def batch_read(self, spreadsheet_id: str, ranges: List[str]) -> List[List[list]]:
+        result = self._execute(self._values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges
+        ))
+        value_ranges = result.get('valueRanges', [])
+        if len(value_ranges) != len(ranges):
+            raise ValueError("batchGet 응답의 범위 개수가 요청과 다릅니다")
+        return [value_range.get('values', []) for value_range in value_ranges]
+
+    def write_range(self, spreadsheet_id: str, range_name: str, values: List[list]) -> None:
+        self._execute(self._values().update(
+            spreadsheetId=spreadsheet_id,
+            range=range_name,
+            valueInputOption="RAW",
+            body={"values": values}
+        ))
+
+    def clear(self, spreadsheet_id: str, range_name: str) -> None:
+        self._execute(self._values().clear(
+            spreadsheetId=spreadsheet_id,
+            range=range_name
+        ))
+
+
+def _column_index(letters: str) -> int:
+    """열 문자(A, Z, AA ...)를 0부터 시작하는 인덱스로 변환합니다."""
+    index = 0
+    for ch in letters:
+        index = index * 26 + (ord(ch) - ord('A') + 1)
+    return index - 1
+
+def _parse_a1(range_name: str) -> tuple:
+    """
+    A1 표기 범위를 (시트명, 시작 행, 시작 열, 끝 행, 끝 열)로 분리합니다.
+    행/열 인덱스는 0부터 시작하며, 열린 끝은 None입니다.
+    """
+    sheet_part, _, cells = range_name.rpartition('!')
+    if not sheet_part:
+        raise ValueError(f"시트명이 없는 범위는 지원하지 않습니다: {range_name}")
+    title = sheet_part[1:-1].replace("''", "'") if sheet_part.startswith("'") else sheet_part
+
+    match = re.match(r"^([A-Z]+)(\d*)(?::([A-Z]+)(\d*))?$", cells)
+    if not match:
+        raise ValueError(f"범위를 해석할 수 없습니다: {range_name}")
+    start_col, start_row, end_col, end_row = match.groups()
+
+    r1 = int(start_row) - 1 if start_row else 0
+    c1 = _column_index(start_col)
+    if end_col is None:
+        # 단일 셀 ("A1")
+        return title, r1, c1, (r1 if start_row else None), c1
+    r2 = int(end_row) - 1 if end_row else None
+    return title, r1, c1, r2, _column_index(end_col)
+
+def _trim_row(row: list) -> list:
+    """API와 동일하게 행 끝의 빈 셀을 제거합니다."""
+    end = len(row)
+    while end and row[end - 1] == '':
+        end -= 1
+    return row[:end]
+
+
+class LocalSheetsBackend(SheetsBackend):
+    """
+    인메모리 스프레드시트 백엔드.
+    스프레드시트 ID는 무시하고 시트명 → 행 목록으로만 관리합니다.
+    반환 형태(행 끝 빈 셀/끝 빈 행 제거, 없는 시트는 오류)는 Google API와 맞춥니다.
+    """
+
+    name = 'local'
+
+    def __init__(self, sheets: Optional[Dict[str, List[list]]] = None):
+        self.sheets: Dict[str, List[list]] = sheets if sheets is not None else {}
+
+    # ── 데이터 적재 ──
+    def load_csv(self, title: str, path: str) -> int:
+        """CSV 파일(구글 폼 응답 내보내기)을 시트로 적재하고 데이터 행 수를 반환합니다."""
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            rows = [list(row) for row in csv.reader(f)]
+        self.sheets[title] = rows
+        logger.info(f"로컬 시트 '{title}' 적재: {path} ({max(len(rows) - 1, 0)}개 행)")
+        return max(len(rows) - 1, 0)
+
+    def load_synthetic_responses(self, title: str, n_rows: int, seed: int = 0) -> int:
+        """합성 설문 응답을 시트로 적재하고 데이터 행 수를 반환합니다."""
+        self.sheets[title] = generate_synthetic_responses(n_rows, seed=seed)
+        logger.info(f"로컬 시트 '{title}' 적재: 합성 데이터 {n_rows}개 행")
+        return n_rows
+
+    # ── SheetsBackend 구현 ──
+    def _sheet(self, title: str) -> List[list]:
+        if title not in self.sheets:
+            raise KeyError(f"로컬 시트를 찾을 수 없습니다: {title}")
+        return self.sheets[title]
+
+    def read_range(self, spreadsheet_id: str, range_name: str) -> List[list]:
+        title, r1, c1, r2, c2 = _parse_a1(range_name)
+        rows = self._sheet(title)
+        stop_row = len(rows) if r2 is None else r2 + 1
+        stop_col = None if c2 is None else c2 + 1
+
+        values = [_trim_row(row[c1:stop_col]) for row in rows[r1:stop_row]]
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    def batch_read(self, spreadsheet_id: str, ranges: List[str]) -> List[List[list]]:
+        return [self.read_range(spreadsheet_id, range_name) for range_name in ranges]
+
+    def write_range(self, spreadsheet_id: str, range_name: str, values: List[list]) -> None:
+        title, r1, c1, _, _ = _parse_a1(range_name)
+        rows = self.sheets.setdefault(title, [])
+        for offset, new_row in enumerate(values):
+            row_idx = r1 + offset
+            while len(rows) <= row_idx:
+                rows.append([])
+            row = rows[row_idx]
+            if len(row) < c1 + len(new_row):
+                row.extend([''] * (c1 + len(new_row) - len(row)))
+            row[c1:c1 + len(new_row)] = ['' if v is None else str(v) for v in new_row]
+
+    def clear(self, spreadsheet_id: str, range_name: str) -> None:
+        title, r1, c1, r2, c2 = _parse_a1(range_name)
+        rows = self._sheet(title)
+        stop_row = len(rows) if r2 is None else min(r2 + 1, len(rows))
+        for row in rows[r1:stop_row]:
+            stop_col = len(row) if c2 is None else min(c2 + 1, len(row))
+            for col in range(c1, stop_col):
+                row[col] = ''
+
+    # ── 기본 구성 ──
+    @classmethod
+    def default(cls) -> 'LocalSheetsBackend':
+        """
+        환경변수 설정으로 로컬 백엔드를 구성합니다.
+          - 응답 시트: LOCAL_SYNTHETIC_ROWS > 0 이면 합성 데이터, 아니면 LOCAL_RESPONSES_CSV
+          - 설정 시트: 기본 공통 기도제목 / 기본 담당자 배정 (fallback 상수와 동일)
+        """
+        from google_sheets import (
+            RANGE_NAME, COMMON_PRAYERS_SHEET, ASSIGNMENTS_SHEET, _get_common_prayers_fallback
+        )
+        from config import PrayerAssignments
+
+        backend = cls()
+        responses_title = _parse_a1(RANGE_NAME)[0]
+        if LOCAL_SYNTHETIC_ROWS > 0:
+            backend.load_synthetic_responses(responses_title, LOCAL_SYNTHETIC_ROWS)
+        else:
+            backend.load_csv(responses_title, LOCAL_RESPONSES_CSV)
+
+        common_prayers = _get_common_prayers_fallback()['data']
+        backend.sheets[COMMON_PRAYERS_SHEET] = [["순번", "기도제목", "활성화여부", "비고"]] + [
+            [str(i), prayer, "Y", ""] for i, prayer in enumerate(common_prayers, 1)
+        ]
+        backend.sheets[ASSIGNMENTS_SHEET] = [["담당자", "제출자이름"]] + [
+            [manager, ", ".join(assignees)]
+            for manager, assignees in PrayerAssignments.DEFAULT_ASSIGNMENTS.items()
+        ]
+        return backend
+
+
+# ============================================================
+# 합성 데이터 생성
+# ============================================================
+_SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+_GIVEN_SYLLABLES = "민서지현우준예은하윤도영수아성진가온나경소원찬훈"
+_CHURCHES = ["동대문교회", "광교남부교회", "서울중앙교회", "한빛교회", "새문안교회", "온누리교회"]
+_RELATIONSHIPS = ["학교 친구", "사촌동생", "직장 동료", "본인", "고등학교 친구", "어머니"]
+_PRAYER_LINES = [
+    "가스펠데이에 초청할 수 있도록",
+    "복음을 들을 마음이 열리도록",
+    "  건강을 지켜주시고 학업 가운데 함께하여 주시길 ",
+    "관계 가운데 하나님의 사랑이 드러나도록",
+    "두려움을 이기고 담대히 복음을 전할 수 있도록​",
+    "가족 모두가 교회에 함께 나올 수 있기를",
+]
+
+def _synthetic_name(rng: random.Random) -> str:
+    return rng.choice(_SURNAMES) + rng.choice(_GIVEN_SYLLABLES) + rng.choice(_GIVEN_SYLLABLES)
+
+def _synthetic_timestamp(rng: random.Random) -> str:
+    hour = rng.randint(1, 12)
+    return (f"2025. {rng.randint(1, 12)}. {rng.randint(1, 28)} "
+            f"{rng.choice(['오전', '오후'])} {hour}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}")
+
+def generate_synthetic_responses(n_rows: int, n_requesters: Optional[int] = None, seed: int = 0) -> List[list]:
+    """
+    설문 응답 시트 형태(헤더 포함)의 합성 데이터를 생성합니다.
+    정제 로직이 실제와 같은 경로를 타도록 앞뒤 공백, 줄바꿈(\\r\\n), 폭 없는 공백 등을 섞습니다.
+
+    Args:
+        n_rows: 데이터 행 수
+        n_requesters: 제출자 수 (기본값: 행 수의 1/5, 최소 1명)
+        seed: 난수 시드 (같은 시드 → 같은 데이터)
+    """
+    rng = random.Random(seed)
+    if n_requesters is None:
+        n_requesters = max(1, n_rows // 5)
+    requesters = [_synthetic_name(rng) for _ in range(n_requesters)]
+
+    rows = [list(RESPONSE_HEADERS)]
+    for i in range(n_rows):
+        line_count = rng.randint(1, 4)
+        content = '\r\n'.join(
+            f"{n}. {rng.choice(_PRAYER_LINES)}" for n in range(1, line_count + 1)
+        )
+        row = [
+            _synthetic_timestamp(rng),
+            f" {rng.choice(requesters)} " if i % 7 == 0 else rng.choice(requesters),
+            rng.choice(_CHURCHES),
+            _synthetic_name(rng),
+            rng.choice(["남", "여"]),
+            f"{rng.randint(0, 9):02d}년생",
+            rng.choice(_RELATIONSHIPS),
+            content
+        ]
+        rows.append(_trim_row(row))
+    return rows
+
+
+# ============================================================
+# 백엔드 선택 (싱글톤)
+# ============================================================
+_backend_instance: Optional[SheetsBackend] = None
+
+def get_sheets_backend() -> SheetsBackend:
+    """
+    환경변수 SHEETS_BACKEND에 따라 백엔드를 싱글톤으로 반환합니다.
+      - 'google' (기본값): Google Sheets API
+      - 'local': 인메모리 시트 (examples CSV 또는 합성 데이터)
+    """
+    global _backend_instance
+    if _backend_instance is not None:
+        return _backend_instance
+
+    if SHEETS_BACKEND == 'local':
+        _backend_instance = LocalSheetsBackend.default()
+    elif SHEETS_BACKEND == 'google':
+        _backend_instance = GoogleSheetsBackend()
+    else:
+        raise ValueError(f"알 수 없는 SHEETS_BACKEND 값입니다: {SHEETS_BACKEND}")
+
+    logger.info(f"스프레드시트 백엔드: {_backend_instance.name}")
+    return _backend_instance
+
+def set_sheets_backend(backend: Optional[SheetsBackend]) -> None:
+    """백엔드를 교체합니다 (벤치마크/로컬 실행용). None이면 다음 호출 시 환경변수로 재구성합니다."""
+    global _backend_instance
+    _backend_instance = backend
@@ -0,0 +1,438 @@
+"""
+CBF 기도제목 자동화 V2 - PostgreSQL 저장소
+
+파이프라인(main.py)의 DB 동기화와 API 서버(api_server.py)의 DB 조회가 함께 쓰는 접근 계층입니다.
+  - 프로세스당 하나의 스레드 안전 연결 풀 (동기화마다 새로 연결하지 않음)
+  - 스키마 마이그레이션은 풀을 처음 만들 때 한 번만 실행 (버전 테이블 + advisory lock)
+  - 반복 실행되는 쿼리는 연결별로 PREPARE 해 두고 EXECUTE로 실행
+
+DATABASE_URL이 없으면 is_configured()가 False이며, 다른 함수는 호출하지 않아야 합니다.
+"""
+
+import io
+import os
+import time
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from prayer_record import PrayerRecord
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# 설정
+# ============================================================
+STORAGE_POOL_MIN = int(os.getenv('STORAGE_POOL_MIN', '1'))
+STORAGE_POOL_MAX = int(os.getenv('STORAGE_POOL_MAX', '4'))
+STORAGE_CONNECT_TIMEOUT = int(os.getenv('STORAGE_CONNECT_TIMEOUT', '10'))
+
+# 여러 프로세스(파이프라인 / API 서버)가 동시에 마이그레이션하지 않도록 잡는 advisory lock 키
+_MIGRATION_LOCK_ID = 0x43424650  # 'CBFP'
+
+PRAYER_COLUMNS = ('name', 'target_name', 'gender', 'age', 'relationship', 'prayer_content', 'church')
+_COLUMNS = ', '.join(PRAYER_COLUMNS)
+_UPDATE_COLUMNS = ', '.join(f"{column} = EXCLUDED.{column}" for column in PRAYER_COLUMNS)
+
+# COPY 텍스트 형식에서 이스케이프가 필요한 문자 (NUL은 PostgreSQL 문자열에 저장할 수 없어 제거)
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\x00': None})
+
+
+def database_url() -> str:
+    """DATABASE_URL (Render의 postgres:// 스킴은 postgresql://로 변환)"""
+    db_url = os.getenv('DATABASE_URL', '')
+    if db_url.startswith("postgres://"):
+        db_url = db_url.replace("postgres://", "postgresql://", 1)
+    return db_url
+
+def is_configured() -> bool:
+    return bool(os.getenv('DATABASE_URL'))
+
+
+# ============================================================
+# 스키마 마이그레이션 (버전 순서대로 한 번씩 적용)
+# ============================================================
+# 기존 배포에는 버전 테이블 없이 만들어진 테이블이 있으므로 모든 단계는 IF NOT EXISTS로 멱등하게 작성합니다.
+_MIGRATIONS = [
+    (1, """
+        CREATE TABLE IF NOT EXISTS prayers (
+            id SERIAL PRIMARY KEY,
+            name VARCHAR(100),
+            target_name VARCHAR(100),
+            gender VARCHAR(20),
+            age VARCHAR(50),
+            relationship VARCHAR(100),
+            prayer_content TEXT,
+            church VARCHAR(100),
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE IF NOT EXISTS prayer_metadata (
+            key VARCHAR(50) PRIMARY KEY,
+            value JSONB,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+    """),
+    # 증분 동기화용 컬럼/인덱스 (키가 없는 기존 행은 첫 동기화에서 교체됨)
+    (2, """
+        ALTER TABLE prayers
+            ADD COLUMN IF NOT EXISTS record_key VARCHAR(64),
+            ADD COLUMN IF NOT EXISTS content_hash CHAR(32);
+        CREATE UNIQUE INDEX IF NOT EXISTS prayers_record_key_idx ON prayers (record_key);
+        CREATE INDEX IF NOT EXISTS prayers_updated_at_idx ON prayers (updated_at);
+    """),
+    # 제출자별 / 담당자별(담당 제출자 목록) 조회용
+    (3, """
+        CREATE INDEX IF NOT EXISTS prayers_name_idx ON prayers (name, id);
+    """),
+]
+
+def migrate(conn) -> int:
+    """아직 적용되지 않은 마이그레이션을 한 트랜잭션에서 적용하고 적용한 개수를 반환합니다."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_advisory_xact_lock(%s);", (_MIGRATION_LOCK_ID,))
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS prayer_schema_migrations (
+                version INTEGER PRIMARY KEY,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+        cur.execute("SELECT version FROM prayer_schema_migrations;")
+        applied = {row[0] for row in cur.fetchall()}
+
+        pending = [(version, sql) for version, sql in _MIGRATIONS if version not in applied]
+        for version, sql in pending:
+            cur.execute(sql)
+            cur.execute("INSERT INTO prayer_schema_migrations (version) VALUES (%s);", (version,))
+    conn.commit()
+
+    if pending:
+        logger.info(f"DB 스키마 마이그레이션 적용: {[version for version, _ in pending]}")
+    return len(pending)
+
+
+# ============================================================
+# 연결 풀
+# ============================================================
+_pool = None
+_pool_lock = threading.Lock()
+
+def _connection_factory():
+    """연결마다 PREPARE 한 문장 이름과 세션 준비 여부를 기억하는 connection 서브클래스"""
+    import psycopg2.extensions
+
+    class PooledConnection(psycopg2.extensions.connection):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.prepared = set()
+            self.staging_ready = False
+
+    return PooledConnection
+
+def get_pool():
+    """프로세스 전역 연결 풀 (처음 호출 시 생성 + 스키마 마이그레이션 1회)"""
+    global _pool
+    if _pool is not None:
+        return _pool
+    with _pool_lock:
+        if _pool is None:
+            from psycopg2.pool import ThreadedConnectionPool
+            pool = ThreadedConnectionPool(
+                STORAGE_POOL_MIN, max(STORAGE_POOL_MIN, STORAGE_POOL_MAX),
+                dsn=database_url(),
+                connect_timeout=STORAGE_CONNECT_TIMEOUT,
+                connection_factory=_connection_factory()
+            )
+            conn = pool.getconn()
+            try:
+                migrate(conn)
+            except Exception:
+                pool.putconn(conn, close=True)
+                pool.closeall()
+                raise
+            pool.putconn(conn)
+            _pool = pool
+            logger.info(f"DB 연결 풀 생성 (최소 {STORAGE_POOL_MIN}, 최대 {STORAGE_POOL_MAX})")
+    return _pool
+
+def close_pool():
+    """연결 풀의 모든 연결을 닫습니다. (서버 종료 시)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+@contextmanager
+def connection():
+    """
+    풀에서 연결을 빌려 주고, 정상 종료 시 커밋 후 반납합니다.
+    오류가 나면 롤백 대신 연결을 버립니다. (롤백된 세션의 PREPARE / 임시 테이블 상태를 신뢰할 수 없으므로)
+    """
+    pool = get_pool()
+    conn = pool.getconn()
+    if conn.closed:
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        pool.putconn(conn, close=True)
+        raise
+    pool.putconn(conn)
+
+
+# ============================================================
+# Prepared statements
+# ============================================================
+# 이름 → (파라미터 타입 목록, SQL). 연결별로 처음 사용할 때 PREPARE 합니다.
+_STATEMENTS = {
+    # 스테이징(prayers_staging)의 새 키는 추가, 지문이 바뀐 키만 갱신 (xmax = 0이면 이번에 추가된 행)
+    'prayers_upsert': ((), f"""
+        WITH upserted AS (
+            INSERT INTO prayers (record_key, content_hash, {_COLUMNS})
+            SELECT record_key, content_hash, {_COLUMNS} FROM prayers_staging
+            ON CONFLICT (record_key) DO UPDATE
+            SET content_hash = EXCLUDED.content_hash, {_UPDATE_COLUMNS}, updated_at = CURRENT_TIMESTAMP
+            WHERE prayers.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT COUNT(*) FILTER (WHERE inserted), COUNT(*) FILTER (WHERE NOT inserted) FROM upserted
+    """),
+    # 시트에서 사라진 키(및 키가 없는 이전 버전 행)만 삭제
+    'prayers_delete_missing': ((), """
+        DELETE FROM prayers p
+        WHERE NOT EXISTS (SELECT 1 FROM prayers_staging s WHERE s.record_key = p.record_key)
+    """),
+    'metadata_upsert': (('varchar', 'jsonb'), """
+        INSERT INTO prayer_metadata (key, value, updated_at)
+        VALUES ($1, $2, CURRENT_TIMESTAMP)
+        ON CONFLICT (key) DO UPDATE
+        SET value = EXCLUDED.value, updated_at = CURRENT_TIMESTAMP
+    """),
+    'metadata_get': (('varchar',), """
+        SELECT value, updated_at FROM prayer_metadata WHERE key = $1
+    """),
+    'prayers_all': ((), f"""
+        SELECT {_COLUMNS} FROM prayers ORDER BY id
+    """),
+    'prayers_by_requester': (('varchar',), f"""
+        SELECT {_COLUMNS} FROM prayers WHERE name = $1 ORDER BY id
+    """),
+    'prayers_by_requesters': (('varchar[]',), f"""
+        SELECT {_COLUMNS} FROM prayers WHERE name = ANY($1) ORDER BY id
+    """),
+    'prayers_changed_since': (('timestamp',), f"""
+        SELECT {_COLUMNS}, updated_at FROM prayers
+        WHERE updated_at > $1
+        ORDER BY updated_at, id
+    """),
+}
+
+def _execute(cur, name: str, params: tuple = ()):
+    """이름이 붙은 prepared statement를 실행합니다. (이 연결에서 처음이면 PREPARE 먼저)"""
+    conn = cur.connection
+    if name not in conn.prepared:
+        types, sql = _STATEMENTS[name]
+        signature = f" ({', '.join(types)})" if types else ''
+        cur.execute(f"PREPARE {name}{signature} AS {sql}")
+        conn.prepared.add(name)
+    if params:
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    else:
+        cur.execute(f"EXECUTE {name}")
+
+def _ensure_staging(cur):
+    """연결(세션)마다 한 번 스테이징 임시 테이블 생성 (커밋할 때마다 행만 비워짐)"""
+    if cur.connection.staging_ready:
+        return
+    cur.execute(f"""
+        CREATE TEMP TABLE IF NOT EXISTS prayers_staging ON COMMIT DELETE ROWS AS
+        SELECT record_key, content_hash, {_COLUMNS} FROM prayers WITH NO DATA;
+    """)
+    cur.connection.staging_ready = True
+
+
+# ============================================================
+# 쓰기: 기도제목 증분 동기화
+# ============================================================
+def _prayer_sync_rows(prayers_by_requester):
+    """
+    기도제목마다 (record_key, content_hash, 컬럼 값...) 행을 만듭니다.
+
+    record_key는 제출자 + 대상자 + 같은 (제출자, 대상자) 안에서의 등장순번으로 만든 안정적인 키라서
+    기도 내용이나 관계를 고쳐도 같은 행으로 인식되고, content_hash는 7개 컬럼 전체의 지문입니다.
+    """
+    occurrences = {}
+    for requester, items in prayers_by_requester.items():
+        for item in items:
+            values = [str(item.get(column) or '') for column in PRAYER_COLUMNS]
+            identity = f"{requester}\x1f{item.get('target_name') or ''}"
+            occurrences[identity] = occurrences.get(identity, 0) + 1
+            record_key = hashlib.blake2b(identity.encode('utf-8'), digest_size=16).hexdigest() + f":{occurrences[identity]}"
+            content_hash = hashlib.blake2b('\x1f'.join(values).encode('utf-8'), digest_size=16).hexdigest()
+            yield [record_key, content_hash, *values]
+
+def _prayers_copy_buffer(prayers_by_requester) -> tuple:
+    """기도제목을 COPY FROM STDIN 텍스트 형식(탭 구분, 한 줄에 한 건)으로 직렬화합니다. → (버퍼, 행 수)"""
+    lines = [
+        '\t'.join(value.translate(_COPY_ESCAPES) for value in row)
+        for row in _prayer_sync_rows(prayers_by_requester)
+    ]
+    buffer = io.StringIO('\n'.join(lines) + '\n' if lines else '')
+    return buffer, len(lines)
+
+def _limit_statement(cur, deadline: Optional[float]):
+    """다음 문장의 실행 시간을 deadline(time.monotonic 기준)까지로 제한합니다. (트랜잭션 안에서만 유효)"""
+    if deadline is None:
+        return
+    remaining_ms = int((deadline - time.monotonic()) * 1000)
+    if remaining_ms <= 0:
+        raise TimeoutError("데이터베이스 동기화 제한 시간을 넘었습니다")
+    cur.execute("SET LOCAL statement_timeout = %s", (remaining_ms,))
+
+def sync_prayers(processed_data: dict, common_prayers=None, assignments=None, timeout: float = None) -> dict:
+    """
+    기도제목과 메타데이터(공통기도제목, 담당자 매핑, 마지막 동기화)를 DB에 동기화합니다. (실패 시 예외 발생)
+
+    COPY FROM STDIN으로 스테이징 테이블에 한 번에 적재한 뒤, 같은 트랜잭션에서
+    record_key 기준으로 새 행은 추가, content_hash가 바뀐 행만 갱신, 사라진 행만 삭제합니다.
+    바뀌지 않은 행은 건드리지 않으므로 동기화 비용이 변경량에 비례하고,
+    커밋 전까지 다른 세션은 이전 행을 그대로 봅니다.
+
+    Args:
+        timeout: 전체 제한 시간(초). 넘기면 서버에서 문장을 취소하고(롤백) TimeoutError를 던집니다.
+
+    Returns:
+        dict: rows, inserted, updated, deleted, unchanged, seconds, rows_per_sec
+    """
+    from psycopg2 import errors
+    from psycopg2.extras import Json
+
+    started = time.perf_counter()
+    deadline = time.monotonic() + timeout if timeout else None
+    buffer, count = _prayers_copy_buffer(processed_data.get('prayers_by_requester', {}))
+    metadata = {
+        'last_updated': processed_data.get('last_updated'),
+        'common_prayers': common_prayers,
+        'assignments': assignments
+    }
+
+    try:
+        with connection() as conn, conn.cursor() as cur:
+            _limit_statement(cur, deadline)
+            _ensure_staging(cur)
+            _limit_statement(cur, deadline)
+            cur.copy_expert(f"COPY prayers_staging (record_key, content_hash, {_COLUMNS}) FROM STDIN", buffer)
+            _limit_statement(cur, deadline)
+            _execute(cur, 'prayers_upsert')
+            inserted, updated = cur.fetchone()
+            _limit_statement(cur, deadline)
+            _execute(cur, 'prayers_delete_missing')
+            deleted = cur.rowcount
+            _limit_statement(cur, deadline)
+            _execute(cur, 'metadata_upsert', ('sync_info', Json(metadata)))
+    except errors.QueryCanceled as e:
+        if deadline is None:
+            raise
+        raise TimeoutError(f"데이터베이스 동기화가 제한 시간({timeout:g}초)을 넘어 취소되었습니다") from e
+
+    seconds = time.perf_counter() - started
+    rows_per_sec = count / seconds if seconds > 0 else 0.0
+    stats = {
+        'rows': count,
+        'inserted': inserted,
+        'updated': updated,
+        'deleted': deleted,
+        'unchanged': count - inserted - updated,
+        'seconds': round(seconds, 4),
+        'rows_per_sec': round(rows_per_sec, 1)
+    }
+    logger.info(
+        f"데이터베이스 동기화 완료: 총 {count}개 기도제목 (추가 {inserted}, 변경 {updated}, "
+        f"삭제 {deleted}, 유지 {stats['unchanged']}) ({seconds * 1000:.1f}ms, {rows_per_sec:,.0f} rows/s)"
+    )
+    return stats
+
+
+# ============================================================
+# 읽기
+# ============================================================
+def fetch_changed_since(since) -> List[Dict[str, str]]:
+    """since(datetime) 이후 추가/변경된 기도제목 (updated_at 오름차순, 삭제된 행은 포함되지 않음)"""
+    with connection() as conn, conn.cursor() as cur:
+        _execute(cur, 'prayers_changed_since', (since,))
+        rows = cur.fetchall()
+    return [
+        {**dict(zip(PRAYER_COLUMNS, row[:-1])), 'updated_at': row[-1].isoformat() if row[-1] else None}
+        for row in rows
+    ]
+
+def _group_records(rows) -> Dict[str, List[PrayerRecord]]:
+    """
+    SELECT {PRAYER_COLUMNS} ... ORDER BY id 결과 행 → {제출자: [PrayerRecord]}
+    제출자는 이름 오름차순(data_processor._group_by_requester와 동일)으로 정렬합니다.
+    제출자 안에서는 id(처음 저장된) 순서라서, 기존 행 사이에 나중에 추가된 시트 행은 뒤쪽에 옵니다.
+    """
+    prayers_by_requester = {}
+    for row in rows:
+        record = PrayerRecord(*(value or '' for value in row))
+        prayers_by_requester.setdefault(record.name, []).append(record)
+    return {requester: prayers_by_requester[requester] for requester in sorted(prayers_by_requester)}
+
+def load_snapshot() -> Optional[dict]:
+    """
+    마지막 동기화 결과 전체를 읽습니다. (API 서버 웜 스타트용)
+    동기화 기록(prayer_metadata 'sync_info')이 없으면 None을 반환합니다.
+
+    Returns:
+        dict: last_updated, prayers_by_requester({제출자: [PrayerRecord]}), common_prayers, assignments, synced_at
+    """
+    with connection() as conn, conn.cursor() as cur:
+        _execute(cur, 'metadata_get', ('sync_info',))
+        meta = cur.fetchone()
+        if meta is None:
+            return None
+        _execute(cur, 'prayers_all')
+        rows = cur.fetchall()
+
+    metadata, synced_at = meta[0] or {}, meta[1]
+    return {
+        'last_updated': metadata.get('last_updated'),
+        'prayers_by_requester': _group_records(rows),
+        'common_prayers': metadata.get('common_prayers') or [],
+        'assignments': metadata.get('assignments') or {},
+        'synced_at': synced_at.isoformat() if synced_at else None
+    }
+
+def fetch_assignments() -> Optional[Dict[str, List[str]]]:
+    """마지막 동기화의 담당자 배정 {담당자: [제출자]} (동기화 기록이 없으면 None)"""
+    with connection() as conn, conn.cursor() as cur:
+        _execute(cur, 'metadata_get', ('sync_info',))
+        meta = cur.fetchone()
+    if meta is None:
+        return None
+    return (meta[0] or {}).get('assignments') or {}
+
+def fetch_requester_prayers(requester: str) -> List[PrayerRecord]:
+    """제출자 한 명의 기도제목 (prayers_name_idx 조회)"""
+    with connection() as conn, conn.cursor() as cur:
+        _execute(cur, 'prayers_by_requester', (requester,))
+        rows = cur.fetchall()
+    return _group_records(rows).get(requester, [])
+
+def fetch_prayers_for_requesters(requesters: List[str]) -> Dict[str, List[PrayerRecord]]:
+    """여러 제출자(담당자의 담당 목록)의 기도제목을 한 번에 조회 → 요청 순서의 {제출자: [PrayerRecord]}"""
+    if not requesters:
+        return {}
+    with connection() as conn, conn.cursor() as cur:
+        _execute(cur, 'prayers_by_requesters', (list(requesters),))
+        rows = cur.fetchall()
+    grouped = _group_records(rows)
+    return {requester: grouped.get(requester, []) for requester in requesters}
@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.fixture
+def publisher(tmp_path, monkeypatch):
+    """상태 파일/저널을 임시 디렉터리에 두고 가짜 페이지('page')에 게시하도록 설정한 notion_publisher"""
+    import notion_publisher
+
+    monkeypatch.setattr(notion_publisher, 'PAGE_ID', 'page')
+    monkeypatch.setattr(notion_publisher, 'NOTION_STATE_FILE', str(tmp_path / 'notion_publish_state.json'))
+    monkeypatch.setattr(notion_publisher, 'NOTION_JOURNAL_FILE', str(tmp_path / 'notion_publish_journal.jsonl'))
+    monkeypatch.setattr(notion_publisher, 'NOTION_LAYOUT', 'single')
+    monkeypatch.setattr(notion_publisher, 'NOTION_PUBLISH_MODE', 'diff')
+    return notion_publisher
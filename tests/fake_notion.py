@@ -0,0 +1,222 @@
+"""
+테스트용 Notion AsyncClient 대역
+
+메모리 안의 블록 트리로 게시 알고리즘이 쓰는 API만 흉내 냅니다.
+  - blocks.retrieve / update / delete, blocks.children.list / append, pages.create
+  - append 요청 한도(자식 100개, 중첩 2단계)와 404(지워진 블록), after 검증
+  - crash_at: N번째 쓰기 요청(삭제/수정/추가/페이지 생성)에서 프로세스가 죽은 것처럼 Crash를 던짐.
+              죽은 뒤의 요청은 restart() 전까지 모두 Crash (동시에 돌던 요청도 더 진행되지 않음)
+  - reject_at: N번째 쓰기 요청을 400(일시적이지 않은 오류)으로 거부
+  - fail_at: N번째 쓰기 요청을 반영한 뒤 fail_status(기본 503)로 응답 (반영 여부를 알 수 없는 일시 오류)
+"""
+
+import copy
+import itertools
+from types import SimpleNamespace
+
+import httpx
+from notion_client.errors import APIResponseError
+
+
+class Crash(BaseException):
+    """프로세스 강제 종료 흉내 (게시 코드의 except Exception에 잡히지 않음)"""
+
+
+def api_error(status: int, message: str) -> APIResponseError:
+    return APIResponseError(httpx.Response(status), message, 'object_not_found')
+
+
+def text_block(block_type: str, text: str, **body) -> dict:
+    return {'object': 'block', 'type': block_type,
+            block_type: {'rich_text': [{'type': 'text', 'text': {'content': text}}], **body}}
+
+
+class FakeNotion:
+    """
+    Args:
+        page_id: 루트 페이지 ID
+        crash_at: 몇 번째 쓰기 요청에서 죽을지 (None이면 죽지 않음)
+        crash_after_apply: True면 요청을 반영한 뒤 응답 전에 죽음 (응답 유실)
+        reject_at: 몇 번째 쓰기 요청을 400으로 거부할지 (None이면 거부하지 않음)
+        fail_at / fail_status: 몇 번째 쓰기 요청을 반영한 뒤 어떤 상태로 실패 응답할지
+    """
+
+    def __init__(self, page_id: str = 'page', crash_at: int = None, crash_after_apply: bool = False,
+                 reject_at: int = None, fail_at: int = None, fail_status: int = 503):
+        self.page_id = page_id
+        self.nodes = {page_id: {'id': page_id, 'type': 'child_page', 'child_page': {}, 'children': []}}
+        self.calls = []
+        self.writes = 0
+        self.crash_at = crash_at
+        self.crash_after_apply = crash_after_apply
+        self.reject_at = reject_at
+        self.fail_at = fail_at
+        self.fail_status = fail_status
+        self.crashed = False
+        self._ids = itertools.count(1)
+
+        self.blocks = SimpleNamespace(
+            retrieve=self._retrieve, update=self._update, delete=self._delete,
+            children=SimpleNamespace(list=self._list, append=self._append)
+        )
+        self.pages = SimpleNamespace(create=self._create_page)
+
+    # ── 페이지 준비 / 확인 ──
+    def seed_page(self):
+        """'마지막 업데이트' callout과 두 섹션 제목만 있는 기본 페이지"""
+        self.add(self.page_id, text_block('callout', '마지막 업데이트: -',
+                                          icon={'type': 'emoji', 'emoji': '⏰'}, color='blue_background'))
+        self.add(self.page_id, text_block('heading_1', '🙏 공통 기도제목', is_toggleable=True))
+        self.add(self.page_id, text_block('heading_1', '📖 담당자별 기도제목'))
+        return self
+
+    def add(self, parent_id: str, block: dict) -> str:
+        block_id = self._new_node(block, 0)
+        self.nodes[parent_id]['children'].append(block_id)
+        return block_id
+
+    def restart(self):
+        """중단 이후 다음 실행: 중단/거부 설정을 지움"""
+        self.crash_at = self.reject_at = self.fail_at = None
+        self.crashed = False
+
+    def children(self, block_id: str = None) -> list:
+        return list(self.nodes[block_id or self.page_id]['children'])
+
+    def render(self, block_id: str = None) -> list:
+        """ID를 뺀 (종류, 문구, 자식) 트리 — 두 페이지의 내용 비교용"""
+        rendered = []
+        for child_id in self.nodes[block_id or self.page_id]['children']:
+            node = self.nodes[child_id]
+            body = node[node['type']]
+            if node['type'] == 'child_page':
+                text = body.get('title', '')
+            else:
+                text = ''.join(part['text']['content'] for part in body.get('rich_text', []))
+            rendered.append((node['type'], text, self.render(child_id)))
+        return rendered
+
+    # ── 내부 구현 ──
+    def _new_node(self, block: dict, depth: int) -> str:
+        block = copy.deepcopy(block)
+        block_type = block['type']
+        children = block[block_type].pop('children', None) or []
+        if children and depth >= 2:
+            raise api_error(400, 'body.children should be nested at most two levels')
+        if len(children) > 100:
+            raise api_error(400, 'body.children.length should be ≤ 100')
+        block_id = f"b{next(self._ids)}"
+        self.nodes[block_id] = {'id': block_id, 'type': block_type, block_type: block[block_type], 'children': []}
+        for child in children:
+            self.nodes[block_id]['children'].append(self._new_node(child, depth + 1))
+        return block_id
+
+    def _live(self, block_id: str) -> dict:
+        node = self.nodes.get(block_id)
+        if node is None or node.get('archived'):
+            raise api_error(404, f'Could not find block with ID: {block_id}')
+        return node
+
+    def _archive(self, node: dict):
+        # 부모를 지우면 하위 블록도 함께 지워짐
+        node['archived'] = True
+        for child_id in node['children']:
+            self._archive(self.nodes[child_id])
+
+    def _public(self, block_id: str) -> dict:
+        node = self.nodes[block_id]
+        return {
+            'object': 'block', 'id': block_id, 'type': node['type'], node['type']: node[node['type']],
+            'has_children': bool(node['children']), 'archived': bool(node.get('archived'))
+        }
+
+    def _write(self, kind: str, apply):
+        """쓰기 요청 1건: crash_at 번째면 반영 전/후에 Crash, reject_at 번째면 400, fail_at 번째면 반영 후 fail_status"""
+        self._check_alive()
+        self.writes += 1
+        if self.writes == self.reject_at:
+            raise api_error(400, f'{kind} #{self.writes} rejected')
+        crash = self.crash_at is not None and self.writes == self.crash_at
+        if crash and not self.crash_after_apply:
+            self.crashed = True
+            raise Crash(f"{kind} #{self.writes}")
+        result = apply()
+        if self.writes == self.fail_at:
+            raise api_error(self.fail_status, f'{kind} #{self.writes} failed after apply')
+        if crash:
+            self.crashed = True
+            raise Crash(f"{kind} #{self.writes} (반영 후)")
+        return result
+
+    def _check_alive(self):
+        if self.crashed:
+            raise Crash('이미 중단된 실행')
+
+    async def _retrieve(self, block_id):
+        self.calls.append(('retrieve', block_id))
+        self._check_alive()
+        if block_id not in self.nodes:
+            raise api_error(404, f'Could not find block with ID: {block_id}')
+        return self._public(block_id)
+
+    async def _update(self, block_id, **kwargs):
+        self.calls.append(('update', block_id))
+
+        def apply():
+            node = self._live(block_id)
+            node[node['type']] = {**node[node['type']], **kwargs.get(node['type'], {})}
+            return self._public(block_id)
+        return self._write('update', apply)
+
+    async def _delete(self, block_id):
+        self.calls.append(('delete', block_id))
+
+        def apply():
+            self._archive(self._live(block_id))
+            for node in self.nodes.values():
+                if block_id in node['children']:
+                    node['children'].remove(block_id)
+            return self._public(block_id)
+        return self._write('delete', apply)
+
+    async def _list(self, block_id, page_size=100, start_cursor=None):
+        self.calls.append(('list', block_id))
+        self._check_alive()
+        children = self._live(block_id)['children']
+        start = int(start_cursor) if start_cursor else 0
+        end = start + page_size
+        return {
+            'results': [self._public(child_id) for child_id in children[start:end]],
+            'has_more': end < len(children),
+            'next_cursor': str(end) if end < len(children) else None
+        }
+
+    async def _append(self, block_id, children, after=None):
+        self.calls.append(('append', block_id, len(children)))
+        if len(children) > 100:
+            raise api_error(400, 'body.children.length should be ≤ 100')
+
+        def apply():
+            siblings = self._live(block_id)['children']
+            if after is not None and after not in siblings:
+                raise api_error(400, f'Block {after} is not a child of {block_id}')
+            ids = [self._new_node(child, 0) for child in children]
+            index = siblings.index(after) + 1 if after is not None else len(siblings)
+            siblings[index:index] = ids
+            return {'results': [self._public(child_id) for child_id in ids]}
+        return self._write('append', apply)
+
+    async def _create_page(self, parent, properties, **kwargs):
+        self.calls.append(('create_page', parent['page_id']))
+
+        def apply():
+            title = ''.join(part['text']['content'] for part in properties['title']['title'])
+            page_id = f"p{next(self._ids)}"
+            self.nodes[page_id] = {'id': page_id, 'type': 'child_page', 'child_page': {'title': title},
+                                   'children': []}
+            self._live(parent['page_id'])['children'].append(page_id)
+            return {'object': 'page', 'id': page_id}
+        return self._write('create_page', apply)
+
+    async def aclose(self):
+        pass
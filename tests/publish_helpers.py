@@ -0,0 +1,67 @@
+"""Notion 게시 테스트 공용 함수 (가짜 Notion 페이지에 게시 / 결과 비교)"""
+
+import asyncio
+import json
+
+from fake_notion import FakeNotion
+from notion_executor import NotionExecutor
+
+
+def publish(publisher, fake: FakeNotion, data: dict, mode: str = 'diff', max_retries: int = 0) -> str:
+    executor = NotionExecutor(fake, rate=0, max_retries=max_retries)
+    return asyncio.run(publisher._publish(
+        executor, data['processed'], data['common'], data['assignments'], mode
+    ))
+
+
+def load_state(publisher) -> dict:
+    with open(publisher.NOTION_STATE_FILE, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def expected_render(publisher, data: dict) -> list:
+    """빈 페이지에 전체 재구성으로 한 번 게시한 결과"""
+    fake = FakeNotion().seed_page()
+
+    async def rebuild():
+        executor = NotionExecutor(fake, rate=0, max_retries=0)
+        scan = await publisher._scan_page(executor, collect_stale=True)
+        await publisher._update_last_updated_callout(
+            executor, scan['anchors']['callout'], data['processed']['last_updated']
+        )
+        await publisher._publish_full(
+            executor, scan, publisher._build_common_prayers_blocks(data['common']),
+            publisher._build_manager_entries(data['assignments'], data['processed']['prayers_by_requester']),
+            publisher._PublishJournal(None)
+        )
+
+    asyncio.run(rebuild())
+    return fake.render()
+
+
+def page_contents(publisher, rendered: list) -> list:
+    """
+    비교용 페이지 내용. 분할 게시는 새 담당자 페이지를 항상 맨 끝에 만들므로
+    담당자 페이지 순서는 보지 않습니다.
+    """
+    if publisher.NOTION_LAYOUT == 'sharded':
+        return rendered[:3] + sorted(rendered[3:])
+    return rendered
+
+
+def assert_state_matches_page(publisher, fake: FakeNotion):
+    """상태 파일의 블록 ID가 실제 페이지 구성과 같은지"""
+    state = load_state(publisher)
+    anchors = state['anchors']
+    page = fake.children()
+    assert page[:3] == [anchors['callout'], anchors['common_section'], anchors['prayer_section']]
+    manager_ids = [m['block_id'] for m in state['managers']]
+    if publisher.NOTION_LAYOUT == 'sharded':
+        assert sorted(manager_ids) == sorted(page[3:])
+    else:
+        assert manager_ids == page[3:]
+    assert state['common']['block_ids'] == fake.children(anchors['common_section'])
+    for manager in state['managers']:
+        assignee_ids = [a['block_id'] for a in manager['assignees']]
+        if all(assignee_ids):
+            assert assignee_ids == fake.children(manager['block_id'])
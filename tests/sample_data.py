@@ -0,0 +1,87 @@
+"""테스트용 기도제목 데이터 (처리 결과 / 공통 기도제목 / 담당자 배정)"""
+
+import copy
+
+from prayer_record import PrayerRecord
+
+
+def _prayer(name: str, target: str, content: str) -> PrayerRecord:
+    return PrayerRecord(name=name, target_name=target, gender='남', age='20대', relationship='친구',
+                        prayer_content=content, church='서울교회')
+
+
+def base_dataset() -> dict:
+    prayers_by_requester = {
+        '김하늘': [_prayer('김하늘', '구도자1', '건강을 위해'), _prayer('김하늘', '구도자2', '진로를 위해\n\n졸업')],
+        '박산': [_prayer('박산', '구도자3', '가족 구원')],
+        '이바다': [_prayer('이바다', '구도자4', '마음의 평안')],
+        '정별': [_prayer('정별', '구도자5', '취업'), _prayer('정별', '구도자6', '신앙 회복')],
+        '최들': [_prayer('최들', '구도자7', '관계 회복')],
+        '한솔': [_prayer('한솔', '구도자8', '시험')],
+    }
+    return {
+        'processed': {'last_updated': '2026-01-01 09:00', 'prayers_by_requester': prayers_by_requester},
+        'common': ['1. 모임을 위해\n - 세부 제목 하나\n - 세부 제목 둘', '2. 전도를 위해'],
+        'assignments': {'담당A': ['김하늘', '이바다'], '담당B': ['박산'], '담당C': ['최들', '정별']},
+    }
+
+
+def _edit(data: dict, requester: str, index: int, content: str):
+    prayer = data['processed']['prayers_by_requester'][requester][index]
+    data['processed']['prayers_by_requester'][requester][index] = PrayerRecord(
+        **{**prayer.to_dict(), 'prayer_content': content}
+    )
+
+
+def _prayer_edited(data):
+    _edit(data, '이바다', 0, '마음의 평안과 쉼')
+
+
+def _first_assignee_edited(data):
+    _edit(data, '김하늘', 0, '건강 회복을 위해')
+
+
+def _assignee_added(data):
+    data['assignments']['담당B'].append('한솔')
+
+
+def _manager_removed(data):
+    del data['assignments']['담당B']
+
+
+def _manager_added(data):
+    data['assignments'] = {'새담당자': ['한솔'], **data['assignments'], '끝담당자': ['박산']}
+
+
+def _reordered(data):
+    data['assignments'] = dict(reversed(list(data['assignments'].items())))
+
+
+def _common_changed(data):
+    data['common'] = ['1. 모임을 위해\n - 세부 제목 하나', '2. 전도를 위해', '3. 새 공통 제목']
+
+
+def _everything(data):
+    for change in (_prayer_edited, _first_assignee_edited, _assignee_added, _manager_added, _common_changed):
+        change(data)
+    del data['assignments']['담당C']
+    data['processed']['last_updated'] = '2026-01-02 09:00'
+
+
+CHANGES = {
+    'unchanged': lambda data: None,
+    'prayer_edited': _prayer_edited,
+    'first_assignee_edited': _first_assignee_edited,
+    'assignee_added': _assignee_added,
+    'manager_removed': _manager_removed,
+    'manager_added': _manager_added,
+    'reordered': _reordered,
+    'common_changed': _common_changed,
+    'everything': _everything,
+}
+
+
+def changed_dataset(name: str) -> dict:
+    data = copy.deepcopy(base_dataset())
+    CHANGES[name](data)
+    return data
@@ -0,0 +1,83 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import api_server
+import storage
+from prayer_record import PrayerRecord
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """시작 이벤트(시트 로드) 없이 인증만 통과시키는 클라이언트"""
+    api_server.app.dependency_overrides[api_server.get_current_user] = lambda: {'role': api_server.ROLE_USER}
+    monkeypatch.setattr(api_server, 'prayers_cache', {**api_server.prayers_cache})
+    yield TestClient(api_server.app)
+    api_server.app.dependency_overrides.clear()
+
+
+def _fill_cache(monkeypatch):
+    monkeypatch.setattr(api_server, 'prayers_cache', {
+        **api_server.prayers_cache,
+        'source': 'google_sheets',
+        'prayers_by_requester': {'김하늘': [PrayerRecord('김하늘', '김하늘', prayer_content='건강')]},
+        'assignments': {'담당A': ['김하늘', '박산']},
+    })
+
+
+def _database(monkeypatch, fail: bool = False):
+    """DB 조회 호출을 기록 (fail이면 연결 오류)"""
+    calls = []
+
+    def query(name, result):
+        def run(*args):
+            calls.append(name)
+            if fail:
+                raise ConnectionError('DB 연결 실패')
+            return result
+        return run
+
+    monkeypatch.setenv('DATABASE_URL', 'postgresql://test')
+    monkeypatch.setattr(storage, 'fetch_requester_prayers',
+                        query('requester', [PrayerRecord('김하늘', '김하늘', prayer_content='DB 기도제목')]))
+    monkeypatch.setattr(storage, 'fetch_assignments', query('assignments', {'담당A': ['김하늘']}))
+    monkeypatch.setattr(storage, 'fetch_prayers_for_requesters', query('requesters', {
+        '김하늘': [PrayerRecord('김하늘', '김하늘', prayer_content='DB 기도제목')]
+    }))
+    return calls
+
+
+def test_warm_cache_is_served_without_database(client, monkeypatch):
+    _fill_cache(monkeypatch)
+    calls = _database(monkeypatch)
+
+    requester = client.get('/api/prayers/requester/김하늘').json()
+    manager = client.get('/api/prayers/manager/담당A').json()
+
+    assert calls == []
+    assert requester['source'] == manager['source'] == 'google_sheets'
+    assert requester['prayers'][0]['prayer_content'] == '건강'
+    assert list(manager['prayers_by_requester']) == ['김하늘', '박산']
+    assert manager['prayers_by_requester']['박산'] == []
+
+
+def test_cold_cache_reads_database(client, monkeypatch):
+    calls = _database(monkeypatch)
+
+    requester = client.get('/api/prayers/requester/김하늘').json()
+    manager = client.get('/api/prayers/manager/담당A').json()
+
+    assert calls == ['requester', 'assignments', 'requesters']
+    assert requester['source'] == manager['source'] == 'database'
+    assert manager['prayers_by_requester']['김하늘'][0]['prayer_content'] == 'DB 기도제목'
+    assert client.get('/api/prayers/manager/담당Z').status_code == 404
+
+
+def test_database_error_falls_back_to_cache(client, monkeypatch):
+    _database(monkeypatch, fail=True)
+
+    requester = client.get('/api/prayers/requester/김하늘')
+    manager = client.get('/api/prayers/manager/담당A')
+
+    assert requester.status_code == 200
+    assert requester.json() == {'requester': '김하늘', 'source': 'empty', 'prayers': []}
+    assert manager.status_code == 404
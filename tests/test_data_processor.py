@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+
+import data_processor
+from data_processor import IncrementalPrayerProcessor, process_prayer_requests, process_prayer_values
+from utils import sanitize_many, sanitize_name, sanitize_prayer_content, sanitize_text
+
+HEADERS = ['타임스탬프', '이름', '이름(구도자)', '성별', '나이', '관계', '기도제목', '출석 교회']
+
+VALUES = [
+    HEADERS,
+    ['2026. 1. 4 오후 12:05:00', '박산', '박가족', '남', '40', '가족', '직장을 위해\n\n\n\n기도', '새빛교회'],
+    ['2026. 1. 3 오전 12:30:00', ' 김하늘 ', '이웃​', '여', '', '이웃', '건강  회복', ''],
+    ['2026. 1. 5 오후 3:00:00', '박산', '박친구', '', '', '친구', '믿음'],
+    ['잘못된 시각', '이바다', '', '', '', '', '평안', '바다교회'],
+    ['2026. 1. 4 오후 12:05:00', '박산', '박가족', '남', '40', '가족', '직장을 위해\n\n\n\n기도', '새빛교회'],
+]
+
+
+def _frame(values):
+    """google_sheets.get_prayer_requests와 같은 방식 (짧은 행은 빈 문자열로 채움)"""
+    headers = values[0]
+    return pd.DataFrame([row + [''] * (len(headers) - len(row)) for row in values[1:]], columns=headers)
+
+
+def _shape(processed):
+    return {requester: [record.to_dict() for record in records]
+            for requester, records in processed['prayers_by_requester'].items()}
+
+
+@pytest.fixture
+def fresh_processor(monkeypatch):
+    monkeypatch.setattr(data_processor, '_incremental_processor', IncrementalPrayerProcessor())
+    return data_processor._incremental_processor
+
+
+def test_dataframe_and_values_paths_match():
+    full = process_prayer_values(VALUES, incremental=False)
+
+    assert _shape(process_prayer_requests(_frame(VALUES), incremental=False)) == _shape(full)
+    assert list(full['prayers_by_requester']) == ['김하늘', '박산', '이바다']
+
+
+@pytest.mark.parametrize('path', ['dataframe', 'values'])
+def test_incremental_matches_full_processing(fresh_processor, path):
+    edited = [row[:] for row in VALUES]
+    edited[2][6] = '건강 회복과 평안'
+    removed = edited[:3] + edited[4:]
+    snapshots = [VALUES, VALUES, edited, removed, removed + [['', '최들', '', '', '', '', '감사']]]
+
+    for values in snapshots:
+        expected = _shape(process_prayer_values(values, incremental=False))
+        if path == 'dataframe':
+            result = process_prayer_requests(_frame(values), incremental=True)
+        else:
+            result = process_prayer_values(values, incremental=True)
+        assert _shape(result) == expected
+
+    assert fresh_processor.last_stats == {
+        'total_rows': 5, 'processed_rows': 1, 'removed_rows': 0, 'rebuilt_requesters': 1
+    }
+
+
+def test_dataframe_path_uses_incremental_processor_from_setting(fresh_processor, monkeypatch):
+    monkeypatch.setattr(data_processor, 'INCREMENTAL_PROCESSING', True)
+
+    process_prayer_requests(_frame(VALUES))
+    process_prayer_requests(_frame(VALUES))
+
+    assert fresh_processor.last_stats['processed_rows'] == 0
+
+
+def test_dataframe_path_still_parses_timestamps(fresh_processor):
+    df = _frame(VALUES)
+
+    process_prayer_requests(df, incremental=True)
+
+    assert df['타임스탬프'].tolist()[:3] == [
+        pd.Timestamp('2026-01-04 12:05:00'), pd.Timestamp('2026-01-03 00:30:00'), pd.Timestamp('2026-01-05 15:00:00')
+    ]
+    assert pd.isna(df['타임스탬프'][3])
+
+
+@pytest.mark.parametrize('mode, sanitize', [
+    ('name', sanitize_name), ('text', sanitize_text), ('prayer', sanitize_prayer_content)
+])
+def test_sanitize_many_matches_single_value_sanitizers(mode, sanitize):
+    values = ['', None, '  김하늘  ', '이웃​﻿', '줄\r\n바꿈\n\n\n\n여러 줄', '탭\t공백   여러개',
+              '"따옴표" & <꺾쇠>', '가' * 100, '  가' * 40, '김하늘', '  김하늘  ']
+
+    assert sanitize_many(values, mode) == [sanitize(value or '') for value in values]
@@ -0,0 +1,209 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import google_sheets
+from sheets_backend import LocalSheetsBackend, set_sheets_backend
+
+SHEET = '설문지 응답 시트1'
+HEADERS = ['타임스탬프', '이름', '이름(구도자)', '기도제목']
+
+
+def _row(day: int, name: str, content: str = '건강') -> list:
+    return [f'2026. 1. {day} 오전 9:00:00', name, f'{name}가족', content]
+
+
+class RecordingBackend(LocalSheetsBackend):
+    """읽기 요청(전체 범위 / 일괄 읽기)을 기록하는 로컬 백엔드"""
+
+    def __init__(self, sheets):
+        super().__init__(sheets)
+        self.requests = []
+
+    def read_range(self, spreadsheet_id, range_name):
+        self.requests.append('full')
+        return super().read_range(spreadsheet_id, range_name)
+
+    def batch_read(self, spreadsheet_id, ranges):
+        self.requests.append('batch')
+        return [LocalSheetsBackend.read_range(self, spreadsheet_id, range_name) for range_name in ranges]
+
+
+@pytest.fixture
+def sheet(tmp_path, monkeypatch):
+    """행 저장소를 임시 디렉터리에 두고, 첫 전체 수집까지 마친 로컬 응답 시트"""
+    monkeypatch.setattr(google_sheets, 'ROW_STORE_FILE', str(tmp_path / 'row_store.json'))
+    monkeypatch.setattr(google_sheets, 'RANGE_NAME', f"'{SHEET}'!A:Z")
+    monkeypatch.setattr(google_sheets, 'SHEETS_FULL_REFETCH_HOURS', 24)
+    backend = RecordingBackend({SHEET: [HEADERS, _row(1, '김하늘'), _row(2, '박산'), _row(3, '이바다')]})
+    set_sheets_backend(backend)
+    google_sheets.fetch_response_values(incremental=True)
+    backend.requests.clear()
+    yield backend
+    set_sheets_backend(None)
+
+
+def _fetch(backend) -> tuple:
+    values = google_sheets.fetch_response_values(incremental=True)
+    return values, backend.requests[:]
+
+
+def test_appended_rows_are_fetched_from_the_tail(sheet):
+    sheet.sheets[SHEET] += [_row(4, '정별'), _row(5, '최들')]
+
+    values, requests = _fetch(sheet)
+
+    assert requests == ['batch']
+    assert values == sheet.sheets[SHEET]
+    assert google_sheets._load_row_store()['row_count'] == 6
+
+
+def test_unchanged_sheet_is_fetched_from_the_tail(sheet):
+    values, requests = _fetch(sheet)
+
+    assert requests == ['batch']
+    assert values == sheet.sheets[SHEET]
+
+
+@pytest.mark.parametrize('change', ['header', 'last_row', 'middle_row_deleted', 'middle_row_edited'])
+def test_changed_existing_rows_trigger_full_fetch(sheet, change):
+    rows = sheet.sheets[SHEET]
+    if change == 'header':
+        rows[0] = HEADERS + ['출석 교회']
+    elif change == 'last_row':
+        rows[-1] = _row(3, '이바다', '평안')
+    elif change == 'middle_row_deleted':
+        del rows[1]
+        rows.append(_row(4, '정별'))
+    else:
+        # 폼에서 응답을 고치면 타임스탬프도 갱신됨
+        rows[1] = _row(9, '김하늘', '건강 회복')
+
+    values, requests = _fetch(sheet)
+
+    assert requests == ['batch', 'full']
+    assert values == rows
+    assert google_sheets._load_row_store()['values'] == rows
+
+
+def test_full_fetch_is_forced_after_refetch_interval(sheet):
+    store = google_sheets._load_row_store()
+    store['full_fetched_at'] = (datetime.now() - timedelta(hours=25)).isoformat()
+    with open(google_sheets.ROW_STORE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(store, f, ensure_ascii=False)
+    # 첫 열(타임스탬프)이 그대로인 수정은 주기적 전체 수집으로 반영
+    sheet.sheets[SHEET][1] = _row(1, '김하늘', '직접 고친 기도제목')
+
+    values, requests = _fetch(sheet)
+
+    assert requests == ['full']
+    assert values == sheet.sheets[SHEET]
+    assert google_sheets._full_refetch_due(google_sheets._load_row_store()) is False
+
+
+def test_tail_merge_keeps_last_full_fetch_time(sheet):
+    full_fetched_at = google_sheets._load_row_store()['full_fetched_at']
+    sheet.sheets[SHEET].append(_row(4, '정별'))
+
+    _fetch(sheet)
+
+    assert google_sheets._load_row_store()['full_fetched_at'] == full_fetched_at
+
+
+def test_merge_tail_rejects_unexpected_range_count(sheet):
+    store = google_sheets._load_row_store()
+
+    assert google_sheets._merge_tail(store, [[HEADERS], [store['values'][-1]]]) is None
+
+
+def test_batched_fetch_checks_earlier_rows_and_refetch_interval(sheet, monkeypatch):
+    monkeypatch.setattr(google_sheets, 'RESPONSES_SPREADSHEET_ID', google_sheets.SPREADSHEET_ID)
+    sheet.sheets[google_sheets.COMMON_PRAYERS_SHEET] = [['순번', '기도제목', '활성화여부'], ['1', '모임', 'Y']]
+    sheet.sheets[google_sheets.ASSIGNMENTS_SHEET] = [['담당자', '제출자이름'], ['담당A', '김하늘, 박산']]
+    rows = sheet.sheets[SHEET]
+
+    rows.append(_row(4, '정별'))
+    assert google_sheets.get_all_sheet_data(incremental=True, as_dataframe=False)[0] == rows
+    del rows[2]
+    assert google_sheets.get_all_sheet_data(incremental=True, as_dataframe=False)[0] == rows
+    monkeypatch.setattr(google_sheets, 'SHEETS_FULL_REFETCH_HOURS', 1e-9)
+    rows[1] = _row(1, '김하늘', '직접 고친 기도제목')
+    assert google_sheets.get_all_sheet_data(incremental=True, as_dataframe=False)[0] == rows
+
+    assert sheet.requests == ['batch', 'batch', 'full', 'batch']
+
+
+# ── 수집 단계 동시 실행 ──
+
+def test_fetch_stage_falls_back_when_a_source_times_out():
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return 'late'
+
+    started = time.monotonic()
+    results = google_sheets._run_fetch_stage(
+        {'slow': slow, 'fast': lambda: 'fast'}, fallbacks={'slow': lambda: 'fallback'}, timeout=0.1
+    )
+    release.set()
+
+    assert results == {'slow': 'fallback', 'fast': 'fast'}
+    assert time.monotonic() - started < 2
+
+
+def test_fetch_stage_raises_timeout_without_fallback():
+    release = threading.Event()
+
+    with pytest.raises(TimeoutError):
+        google_sheets._run_fetch_stage({'slow': lambda: release.wait(5)}, timeout=0.1)
+    release.set()
+
+
+def test_fetch_stage_does_not_count_queue_time():
+    # 순서대로 실행하면 단계 전체(0.6초)는 제한 시간(0.5초)을 넘지만 소스마다는 넘지 않음
+    def fetch():
+        time.sleep(0.3)
+        return threading.get_ident()
+
+    results = google_sheets._run_fetch_stage({'a': fetch, 'b': fetch}, concurrency=1, timeout=0.5)
+
+    assert set(results) == {'a', 'b'}
+
+
+def test_sequential_fetch_stage_keeps_submission_order():
+    order = []
+    fetches = {name: (lambda name=name: order.append(name)) for name in 'abcdef'}
+
+    for _ in range(10):
+        google_sheets._run_fetch_stage(fetches, concurrency=1)
+
+    assert order == list('abcdef') * 10
+
+
+def test_failed_fetch_stage_releases_queued_sources():
+    def fail():
+        raise ValueError('400')
+
+    with pytest.raises(ValueError):
+        google_sheets._run_fetch_stage({'fail': fail, 'b': lambda: None, 'c': lambda: None}, concurrency=1)
+
+    # 실패한 단계가 작업 스레드를 붙잡고 있지 않아야 다음 단계의 수집이 모두 동시에 실행됨
+    workers = google_sheets.SHEETS_FETCH_CONCURRENCY
+    barrier = threading.Barrier(workers, timeout=2)
+    results = google_sheets._run_fetch_stage({f'w{i}': barrier.wait for i in range(workers)}, concurrency=workers)
+    assert sorted(results.values()) == list(range(workers))
+
+
+def test_fetch_stages_reuse_worker_threads():
+    # 작업 스레드마다 인증된 HTTP 연결을 재사용하므로 단계가 바뀌어도 같은 스레드에서 실행되어야 함
+    threads = set()
+    for _ in range(5):
+        results = google_sheets._run_fetch_stage({'batch': threading.current_thread})
+        threads.add(results['batch'])
+
+    assert len(threads) <= google_sheets.SHEETS_FETCH_CONCURRENCY
+    assert threading.current_thread() not in threads
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from notion_client.errors import APIResponseError
+
+import notion_executor
+from fake_notion import FakeNotion, api_error
+from notion_executor import NotionExecutor
+from publish_helpers import expected_render, page_contents, publish
+from sample_data import base_dataset, changed_dataset
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr(notion_executor.asyncio, 'sleep', lambda seconds: real_sleep(0))
+
+
+def _flaky(*statuses):
+    """호출마다 statuses의 상태로 실패하다가 모두 쓰면 성공하는 API 함수"""
+    calls = []
+
+    async def func(**kwargs):
+        calls.append(kwargs)
+        if len(calls) <= len(statuses):
+            raise api_error(statuses[len(calls) - 1], 'temporary')
+        return {'ok': True}
+    return func, calls
+
+
+@pytest.mark.parametrize('status', [500, 503])
+def test_idempotent_call_retries_server_errors(status):
+    func, calls = _flaky(status, status)
+    executor = NotionExecutor(None, rate=0, max_retries=3)
+
+    assert asyncio.run(executor.call(func, block_id='b1')) == {'ok': True}
+    assert len(calls) == 3 and executor.retries == 2
+
+
+@pytest.mark.parametrize('status', [500, 502, 503, 504])
+def test_non_idempotent_call_does_not_retry_server_errors(status):
+    func, calls = _flaky(status)
+    executor = NotionExecutor(None, rate=0, max_retries=3)
+
+    with pytest.raises(APIResponseError):
+        asyncio.run(executor.call(func, idempotent=False, block_id='b1'))
+    assert len(calls) == 1 and executor.retries == 0
+
+
+def test_non_idempotent_call_retries_rate_limit():
+    func, calls = _flaky(429, 429)
+    executor = NotionExecutor(None, rate=0, max_retries=3)
+
+    assert asyncio.run(executor.call(func, idempotent=False, block_id='b1')) == {'ok': True}
+    assert len(calls) == 3 and executor.rate_limited == 2
+    assert 'idempotent' not in calls[0]
+
+
+def _published_page(publisher) -> FakeNotion:
+    fake = FakeNotion().seed_page()
+    publish(publisher, fake, base_dataset())
+    fake.writes = 0
+    return fake
+
+
+@pytest.mark.parametrize('layout', ['single', 'sharded'])
+def test_write_failing_after_apply_is_not_duplicated(publisher, monkeypatch, layout):
+    """반영된 뒤 503으로 응답한 요청은 재시도하지 않고, 다음 게시가 저널로 이어서 중복 없이 게시"""
+    monkeypatch.setattr(publisher, 'NOTION_LAYOUT', layout)
+    data = changed_dataset('everything')
+    expected = page_contents(publisher, expected_render(publisher, data))
+    fake = _published_page(publisher)
+    publish(publisher, fake, data)
+
+    for fail_at in range(1, fake.writes + 1):
+        fake = _published_page(publisher)
+        fake.fail_at = fail_at
+        try:
+            publish(publisher, fake, data, max_retries=3)
+        except APIResponseError:
+            pass
+        fake.restart()
+        publish(publisher, fake, data, max_retries=3)
+
+        assert page_contents(publisher, fake.render()) == expected, f"쓰기 요청 {fail_at}번째가 반영 후 503"
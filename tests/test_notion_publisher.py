@@ -0,0 +1,240 @@
+import asyncio
+import os
+
+import pytest
+
+from fake_notion import FakeNotion, text_block
+from notion_executor import NotionExecutor
+from publish_helpers import assert_state_matches_page, expected_render, load_state, publish
+from sample_data import CHANGES, base_dataset, changed_dataset
+
+
+# ── 전체 재구성 / diff 게시 결과 ──
+
+@pytest.mark.parametrize('change', sorted(CHANGES))
+def test_diff_publish_matches_full_rebuild(publisher, change):
+    fake = FakeNotion().seed_page()
+    assert publish(publisher, fake, base_dataset()) == 'full'
+    changed = changed_dataset(change)
+
+    assert publish(publisher, fake, changed) == 'diff'
+
+    assert fake.render() == expected_render(publisher, changed)
+    assert_state_matches_page(publisher, fake)
+    assert not os.path.exists(publisher.NOTION_JOURNAL_FILE)
+
+
+def test_unchanged_diff_publish_only_updates_callout(publisher):
+    fake = FakeNotion().seed_page()
+    publish(publisher, fake, base_dataset())
+    fake.calls.clear()
+
+    publish(publisher, fake, base_dataset())
+
+    assert [call[0] for call in fake.calls if call[0] not in ('retrieve', 'list')] == ['update']
+
+
+@pytest.mark.parametrize('changes', [
+    ('manager_added', 'manager_added'),
+    ('prayer_edited', 'everything'),
+    ('assignee_added', 'manager_removed', 'common_changed', 'reordered'),
+])
+def test_alternating_writers_with_separate_state_files(publisher, monkeypatch, tmp_path, changes):
+    """GitHub Actions와 API 서버처럼 상태 파일을 따로 가진 두 곳이 번갈아 diff 게시"""
+    fake = FakeNotion().seed_page()
+    publish(publisher, fake, base_dataset())
+    writers = []
+    for name in ('actions', 'server'):
+        state_file = tmp_path / f'{name}_state.json'
+        state_file.write_text(open(publisher.NOTION_STATE_FILE, encoding='utf-8').read(), encoding='utf-8')
+        writers.append((str(state_file), str(tmp_path / f'{name}_journal.jsonl')))
+
+    for index, change in enumerate(changes):
+        state_file, journal_file = writers[index % 2]
+        monkeypatch.setattr(publisher, 'NOTION_STATE_FILE', state_file)
+        monkeypatch.setattr(publisher, 'NOTION_JOURNAL_FILE', journal_file)
+
+        publish(publisher, fake, changed_dataset(change))
+
+        assert fake.render() == expected_render(publisher, changed_dataset(change))
+        assert_state_matches_page(publisher, fake)
+
+
+def test_diff_publish_removes_blocks_added_outside_the_state(publisher):
+    fake = FakeNotion().seed_page()
+    publish(publisher, fake, base_dataset())
+    state = load_state(publisher)
+    fake.add('page', text_block('toggle', '📌 새담당자'))
+    fake.add(state['anchors']['common_section'], text_block('bulleted_list_item', '1. 모임을 위해'))
+    fake.add(state['managers'][0]['block_id'], text_block('toggle', '🙏 다른 제출자님의 기도제목'))
+
+    publish(publisher, fake, changed_dataset('prayer_edited'))
+
+    assert fake.render() == expected_render(publisher, changed_dataset('prayer_edited'))
+    assert_state_matches_page(publisher, fake)
+
+
+def test_full_rebuild_without_state_file_clears_common_section(publisher):
+    fake = FakeNotion().seed_page()
+    publish(publisher, fake, base_dataset())
+    os.remove(publisher.NOTION_STATE_FILE)
+
+    assert publish(publisher, fake, changed_dataset('common_changed')) == 'full'
+
+    assert fake.render() == expected_render(publisher, changed_dataset('common_changed'))
+    assert_state_matches_page(publisher, fake)
+
+
+def test_full_rebuild_removes_blocks_left_under_common_heading(publisher):
+    fake = FakeNotion().seed_page()
+    common_section = fake.children()[1]
+    fake.add(common_section, text_block('paragraph', '예전 공통 기도제목'))
+
+    publish(publisher, fake, base_dataset(), mode='full')
+
+    assert fake.render() == expected_render(publisher, base_dataset())
+
+
+# ── rich_text 인코딩 ──
+
+def _contents(rich_text: list) -> list:
+    return [element['text']['content'] for element in rich_text]
+
+
+def test_split_text_counts_utf16_units(publisher):
+    emoji = '🙏'  # UTF-16 2유닛
+
+    assert publisher._split_text('가' * 2000) == ['가' * 2000]
+    assert publisher._split_text('가' * 4001) == ['가' * 2000, '가' * 2000, '가']
+    assert publisher._split_text('가' * 1999 + emoji) == ['가' * 1999, emoji]
+    assert publisher._split_text(emoji * 1000) == [emoji * 1000]
+    assert publisher._split_text(emoji * 1001 + '가') == [emoji * 1000, emoji + '가']
+
+
+def test_compact_rich_text_merges_adjacent_segments_and_splits_long_text(publisher):
+    bold = {'bold': True}
+
+    rich_text = publisher._compact_rich_text([
+        ('앞', None), ('', bold), ('뒤', None), ('굵게', bold), ('가' * 1500, bold), ('가' * 600, bold), ('끝', None)
+    ])
+
+    assert _contents(rich_text) == ['앞뒤', '굵게' + '가' * 1998, '가' * 102, '끝']
+    assert [element.get('annotations') for element in rich_text] == [None, bold, bold, None]
+
+
+def test_compact_rich_text_truncates_to_element_limit(publisher):
+    segments = [(f'{i}', {'bold': True} if i % 2 else None) for i in range(150)]
+
+    rich_text = publisher._compact_rich_text(segments)
+
+    assert len(rich_text) == publisher.RICH_TEXT_MAX_ELEMENTS
+    assert _contents(rich_text) == [f'{i}' for i in range(100)]
+
+
+def test_prayer_rich_text_cache_returns_independent_payloads(publisher):
+    prayer = {'name': '김하늘', 'target_name': '김가족', 'gender': '여', 'age': '30',
+              'relationship': '가족', 'prayer_content': '건강\n  \n회복'}
+
+    first = publisher.create_prayer_content_rich_text(prayer)
+    first[1]['annotations']['color'] = 'red'
+    first[0]['text']['content'] = '바뀐 내용'
+    first.append({'type': 'text', 'text': {'content': '추가'}})
+    second = publisher.create_prayer_content_rich_text(dict(prayer))
+
+    assert second == [
+        {'type': 'text', 'text': {'content': '👤 제출자: 김하늘\n🙏 구도자: 김가족 (여, 30)\n👥 관계: 가족\n'}},
+        {'type': 'text', 'text': {'content': '📝 기도제목:\n'}, 'annotations': {'bold': True}},
+        {'type': 'text', 'text': {'content': '건강\n\n회복'}},
+    ]
+    assert publisher.create_prayer_content_rich_text({**prayer, 'age': '31'})[0] != second[0]
+
+
+# ── 요청 분할 ──
+
+def _toggle(text: str, children=None) -> dict:
+    block = text_block('toggle', text)
+    if children:
+        block['toggle']['children'] = children
+    return block
+
+
+def test_append_block_tree_splits_requests_within_notion_limits(publisher):
+    # 최상위 250개 + 자식 120개(100개 한도 초과) + 3단계 중첩(2단계 한도 초과)
+    deep = _toggle('깊은 토글', [_toggle('1단계', [_toggle('2단계', [_toggle('3단계')])])])
+    wide = _toggle('넓은 토글', [_toggle(f'자식 {i}') for i in range(120)])
+    blocks = [_toggle(f'토글 {i}') for i in range(248)] + [deep, wide]
+    fake = FakeNotion()
+    executor = NotionExecutor(fake, rate=0, max_retries=0)
+
+    created = asyncio.run(publisher.append_block_tree(executor, 'page', blocks))
+
+    assert created == fake.children()
+    assert all(call[2] <= publisher.APPEND_MAX_CHILDREN for call in fake.calls if call[0] == 'append')
+    rendered = fake.render()
+    assert [text for _, text, _ in rendered] == [f'토글 {i}' for i in range(248)] + ['깊은 토글', '넓은 토글']
+    assert rendered[-2][2] == [('toggle', '1단계', [('toggle', '2단계', [('toggle', '3단계', [])])])]
+    assert [text for _, text, _ in rendered[-1][2]] == [f'자식 {i}' for i in range(120)]
+
+
+def test_iter_append_requests_respects_block_budget(publisher):
+    callouts = [text_block('callout', f'기도제목 {i}') for i in range(90)]
+    blocks = [_toggle(f'제출자 {i}', callouts) for i in range(30)]
+
+    requests = list(publisher._iter_append_requests(blocks))
+
+    for payload, deferred in requests:
+        assert len(payload) <= publisher.APPEND_MAX_CHILDREN
+        assert sum(publisher._count_blocks(block) for block in payload) <= publisher.APPEND_MAX_BLOCKS
+        assert not deferred
+    assert sum(len(payload) for payload, _ in requests) == 30
+
+
+# ── 순서 유지 짝짓기 ──
+
+def _names(*names):
+    return [{'manager': name} for name in names]
+
+
+@pytest.mark.parametrize('previous, desired, expected', [
+    (('A', 'B', 'C'), ('A', 'B', 'C'), {0: 0, 1: 1, 2: 2}),
+    (('A', 'B', 'C'), ('A', 'C'), {0: 0, 1: 2}),
+    (('A', 'C'), ('A', 'B', 'C'), {0: 0, 2: 1}),
+    (('A', 'B', 'C'), ('C', 'B', 'A'), {0: 2}),
+    (('A', 'A', 'B'), ('A', 'B', 'A'), {0: 0, 1: 2}),
+    ((), ('A',), {}),
+])
+def test_match_in_order(publisher, previous, desired, expected):
+    assert publisher._match_in_order(_names(*previous), _names(*desired), 'manager') == expected
+
+
+# ── dry-run 게시 계획 ──
+
+def _plan(publisher, data: dict) -> dict:
+    return asyncio.run(publisher.plan_publish_async(data['processed'], data['common'], data['assignments']))
+
+
+def test_plan_without_snapshot_reports_unknown_deletes(publisher):
+    plan = _plan(publisher, base_dataset())
+
+    assert plan['mode'] == 'full'
+    assert plan['blocks_to_delete'] is None
+    assert plan['requests']['delete'] is None
+    assert plan['snapshot'] is None
+    assert any('스냅샷' in warning for warning in plan['warnings'])
+
+
+@pytest.mark.parametrize('change', ['unchanged', 'prayer_edited', 'manager_removed', 'everything'])
+def test_plan_matches_actual_publish_requests(publisher, change):
+    fake = FakeNotion().seed_page()
+    publish(publisher, fake, base_dataset())
+    fake.calls.clear()
+    data = changed_dataset(change)
+
+    plan = _plan(publisher, data)
+    publish(publisher, fake, data)
+
+    actual = [call[0] for call in fake.calls]
+    assert plan['mode'] == 'diff'
+    for kind in ('retrieve', 'list', 'update', 'delete', 'append'):
+        assert plan['requests'][kind] == actual.count(kind), kind
+    assert plan['blocks_to_delete'] == actual.count('delete')
@@ -0,0 +1,92 @@
+"""게시 도중 중단(프로세스 종료/응답 유실) 후 다음 게시가 저널로 이어서 같은 결과를 만드는지"""
+
+import os
+
+import pytest
+
+from fake_notion import Crash, FakeNotion
+from publish_helpers import assert_state_matches_page, expected_render, page_contents, publish
+from sample_data import base_dataset, changed_dataset
+
+
+def _reset_files(publisher):
+    for path in (publisher.NOTION_STATE_FILE, publisher.NOTION_JOURNAL_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _prepared_page(publisher, baseline: bool) -> FakeNotion:
+    _reset_files(publisher)
+    fake = FakeNotion().seed_page()
+    if baseline:
+        publish(publisher, fake, base_dataset())
+    fake.writes = 0
+    return fake
+
+
+def _write_count(publisher, data: dict, baseline: bool, reject_at: int = None) -> int:
+    """중단 없이 게시했을 때의 쓰기 요청 수"""
+    fake = _prepared_page(publisher, baseline)
+    fake.reject_at = reject_at
+    publish(publisher, fake, data)
+    return fake.writes
+
+
+def _assert_resumes_at_every_write(publisher, data: dict, baseline: bool, crash_after_apply: bool,
+                                   reject_at: int = None):
+    expected = page_contents(publisher, expected_render(publisher, data))
+    total = _write_count(publisher, data, baseline, reject_at)
+    first_crash = (reject_at or 0) + 1
+    assert total >= first_crash
+
+    for crash_at in range(first_crash, total + 1):
+        fake = _prepared_page(publisher, baseline)
+        fake.crash_at, fake.crash_after_apply, fake.reject_at = crash_at, crash_after_apply, reject_at
+        with pytest.raises(Crash):
+            publish(publisher, fake, data)
+
+        fake.restart()
+        publish(publisher, fake, data)
+
+        assert page_contents(publisher, fake.render()) == expected, f"쓰기 요청 {crash_at}번째에서 중단 후 재개"
+        assert_state_matches_page(publisher, fake)
+        assert not os.path.exists(publisher.NOTION_JOURNAL_FILE)
+
+
+@pytest.fixture(params=['single', 'sharded'])
+def layout_publisher(publisher, monkeypatch, request):
+    monkeypatch.setattr(publisher, 'NOTION_LAYOUT', request.param)
+    return publisher
+
+
+@pytest.mark.parametrize('crash_after_apply', [False, True], ids=['before-apply', 'response-lost'])
+def test_first_publish_resumes_after_crash(layout_publisher, crash_after_apply):
+    _assert_resumes_at_every_write(layout_publisher, base_dataset(), False, crash_after_apply)
+
+
+@pytest.mark.parametrize('change', ['everything', 'manager_added', 'first_assignee_edited', 'common_changed'])
+@pytest.mark.parametrize('crash_after_apply', [False, True], ids=['before-apply', 'response-lost'])
+def test_diff_publish_resumes_after_crash(layout_publisher, change, crash_after_apply):
+    _assert_resumes_at_every_write(layout_publisher, changed_dataset(change), True, crash_after_apply)
+
+
+@pytest.mark.parametrize('crash_after_apply', [False, True], ids=['before-apply', 'response-lost'])
+def test_full_fallback_after_failed_diff_resumes_after_crash(layout_publisher, crash_after_apply):
+    # diff 게시의 두 번째 쓰기 요청이 400으로 실패 → 전체 재구성으로 전환한 뒤 매 요청에서 중단
+    _assert_resumes_at_every_write(
+        layout_publisher, changed_dataset('everything'), True, crash_after_apply, reject_at=2
+    )
+
+
+def test_full_fallback_keeps_state_until_rebuild_is_journaled(publisher):
+    fake = _prepared_page(publisher, baseline=True)
+    with open(publisher.NOTION_STATE_FILE, encoding='utf-8') as f:
+        saved_state = f.read()
+    # 2번째 쓰기(diff)가 400으로 실패 → 전체 재구성의 첫 쓰기에서 중단
+    fake.reject_at, fake.crash_at = 2, 3
+
+    with pytest.raises(Crash):
+        publish(publisher, fake, changed_dataset('everything'))
+
+    with open(publisher.NOTION_STATE_FILE, encoding='utf-8') as f:
+        assert f.read() == saved_state
@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+import google_sheets
+import sheets_backend
+from data_processor import process_prayer_values
+from sheets_backend import (
+    RESPONSE_HEADERS, LocalSheetsBackend, SheetsBackend, generate_synthetic_responses, set_sheets_backend
+)
+
+PLAYLIST_CSV = os.path.join(os.path.dirname(__file__), '..', 'examples', 'playlist.csv')
+
+
+def test_incomplete_backend_fails_at_construction():
+    class ReadOnlyBackend(SheetsBackend):
+        def read_range(self, spreadsheet_id, range_name):
+            return []
+
+    with pytest.raises(TypeError):
+        ReadOnlyBackend()
+
+
+# ── LocalSheetsBackend ──
+
+@pytest.fixture
+def local():
+    return LocalSheetsBackend({
+        '응답': [['타임스탬프', '이름', '기도제목'], ['t1', '김하늘', '건강', '', ''], ['t2', '', ''], [], ['t3', '박산']],
+        "담당자's": [['담당자', '제출자이름'], ['담당A', '김하늘']],
+    })
+
+
+def test_read_range_trims_like_google_api(local):
+    assert local.read_range('id', "'응답'!A:Z") == [
+        ['타임스탬프', '이름', '기도제목'], ['t1', '김하늘', '건강'], ['t2'], [], ['t3', '박산']
+    ]
+    assert local.read_range('id', "'응답'!B2:C3") == [['김하늘', '건강']]
+    assert local.read_range('id', "'응답'!A1") == [['타임스탬프']]
+    assert local.read_range('id', "'응답'!C4:C") == []
+    assert local.read_range('id', "'담당자''s'!A2:B") == [['담당A', '김하늘']]
+
+
+def test_read_range_of_missing_sheet_fails(local):
+    with pytest.raises(KeyError):
+        local.read_range('id', "'없는 시트'!A:Z")
+
+
+def test_batch_read_returns_ranges_in_request_order(local):
+    assert local.batch_read('id', ["'응답'!A1:A1", "'담당자''s'!A:B"]) == [
+        [['타임스탬프']], [['담당자', '제출자이름'], ['담당A', '김하늘']]
+    ]
+
+
+def test_write_range_and_clear(local):
+    local.write_range('id', "'새 시트'!B2", [['담당A', None], [1]])
+    assert local.read_range('id', "'새 시트'!A:Z") == [[], ['', '담당A'], ['', '1']]
+
+    local.clear('id', "'새 시트'!B2:B")
+    assert local.read_range('id', "'새 시트'!A:Z") == []
+
+
+def test_load_csv_reads_form_export():
+    backend = LocalSheetsBackend()
+
+    count = backend.load_csv('응답', PLAYLIST_CSV)
+
+    rows = backend.read_range('id', "'응답'!A:Z")
+    assert count == len(rows) - 1 > 0
+    assert rows[0][:2] == ['타임스탬프', '이름']
+
+
+# ── 합성 데이터 ──
+
+def test_synthetic_responses_are_reproducible():
+    rows = generate_synthetic_responses(200, n_requesters=10, seed=7)
+
+    assert rows == generate_synthetic_responses(200, n_requesters=10, seed=7)
+    assert rows != generate_synthetic_responses(200, n_requesters=10, seed=8)
+    assert rows[0] == RESPONSE_HEADERS and len(rows) == 201
+    assert all(len(row) == len(RESPONSE_HEADERS) and row[-1] for row in rows[1:])
+
+
+def test_synthetic_responses_go_through_sanitizing():
+    rows = generate_synthetic_responses(200, n_requesters=10, seed=7)
+
+    processed = process_prayer_values(rows, incremental=False)['prayers_by_requester']
+
+    assert any(row[1] != row[1].strip() for row in rows[1:])
+    assert len(processed) == 10
+    assert sum(len(prayers) for prayers in processed.values()) == 200
+    assert all('\r' not in prayer.prayer_content for prayers in processed.values() for prayer in prayers)
+
+
+def test_default_local_backend_serves_all_sheet_data(monkeypatch):
+    monkeypatch.setattr(sheets_backend, 'LOCAL_SYNTHETIC_ROWS', 50)
+    monkeypatch.setattr(google_sheets, 'RESPONSES_SPREADSHEET_ID', google_sheets.SPREADSHEET_ID)
+    set_sheets_backend(LocalSheetsBackend.default())
+    try:
+        responses, common_prayers, assignments = google_sheets.get_all_sheet_data(
+            incremental=False, as_dataframe=False
+        )
+    finally:
+        set_sheets_backend(None)
+
+    assert len(responses) == 51
+    assert common_prayers['source'] == assignments['source'] == 'google_sheets'
+    assert common_prayers['data'] and assignments['data']
@@ -0,0 +1,115 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+import main
+from main import Sink, failed_required_sinks, run_sinks
+
+
+@pytest.fixture
+def sinks(monkeypatch):
+    """등록된 기본 싱크 대신 테스트 싱크만 실행"""
+    registered = {}
+    monkeypatch.setattr(main, 'SINKS', registered)
+    monkeypatch.setattr(main, 'pipeline_state', {**main.pipeline_state, 'sinks': {}})
+
+    def register(name, write, **options):
+        registered[name] = Sink(name=name, write=write, retry_delay=0.01, **options)
+        return registered[name]
+    return register
+
+
+def test_run_sinks_waits_for_every_sink(sinks):
+    finished = []
+
+    def slow_write(processed_data, common_prayers, assignments, timeout):
+        time.sleep(0.2)
+        finished.append('slow')
+
+    sinks('fast', lambda *args, timeout: finished.append('fast'))
+    sinks('slow', slow_write, timeout=5)
+
+    results = run_sinks({})
+
+    assert results == {'fast': 'SUCCESS', 'slow': 'SUCCESS'}
+    assert sorted(finished) == ['fast', 'slow']
+
+
+def test_sink_receives_remaining_time_and_times_out_without_retry(sinks):
+    attempts = []
+
+    def async_write(processed_data, common_prayers, assignments, timeout):
+        attempts.append(timeout)
+        # Notion 싱크와 같은 방식: 이벤트 루프에서 제한 시간 안에 끝나지 않으면 취소
+        asyncio.run(asyncio.wait_for(asyncio.sleep(10), timeout))
+
+    sinks('notion', async_write, timeout=0.2, max_retries=2)
+    started = time.monotonic()
+
+    results = run_sinks({})
+
+    assert results == {'notion': 'TIMEOUT'}
+    assert time.monotonic() - started < 2
+    assert len(attempts) == 1 and 0 < attempts[0] <= 0.2
+    assert main.get_sink_statuses()['notion']['status'] == 'TIMEOUT'
+
+
+def test_sink_without_timeout_gets_none(sinks):
+    received = []
+    sinks('json', lambda *args, timeout: received.append(timeout), timeout=0)
+
+    run_sinks({})
+
+    assert received == [None]
+
+
+def test_sink_retries_then_reports_error(sinks):
+    calls = []
+
+    def failing_write(*args, timeout):
+        calls.append(timeout)
+        raise RuntimeError('쓰기 실패')
+
+    sinks('postgres', failing_write, timeout=5, max_retries=2)
+
+    assert run_sinks({}) == {'postgres': 'ERROR'}
+    assert len(calls) == 3
+    assert main.get_sink_statuses()['postgres']['error'] == '쓰기 실패'
+
+
+def test_failed_required_sinks(sinks):
+    sinks('json', lambda *args, timeout: None, required=True)
+    sinks('postgres', lambda *args, timeout: None)
+    sinks('notion', lambda *args, timeout: None, required=True)
+
+    results = {'json': 'SUCCESS', 'postgres': 'ERROR', 'notion': 'TIMEOUT'}
+
+    assert failed_required_sinks(results) == ['notion']
+    assert failed_required_sinks({**results, 'notion': 'DEFERRED'}) == []
+
+
+@pytest.mark.parametrize('required, expected', [(True, False), (False, True)])
+def test_run_pipeline_fails_when_required_sink_fails(sinks, monkeypatch, required, expected):
+    values = [['타임스탬프', '이름', '기도제목'], ['2026. 1. 1 오전 9:00:00', '김하늘', '건강']]
+    monkeypatch.setattr(main, 'get_all_sheet_data', lambda as_dataframe: (
+        values, {'data': [], 'source': 'test'}, {'data': {'담당A': ['김하늘']}, 'source': 'test'}
+    ))
+    monkeypatch.setattr(main.config, 'validate', lambda require_notion=False: None)
+    monkeypatch.setattr(main.config.google_sheets, 'spreadsheet_id', 'sheet')
+
+    def failing_publish(*args, timeout):
+        raise RuntimeError('게시 실패')
+
+    sinks('json', lambda *args, timeout: None, required=True)
+    sinks('notion', failing_publish, required=required)
+
+    assert main.run_pipeline(pandas_free=True) is expected
+    assert main.pipeline_state['status'] == ('SUCCESS' if expected else 'ERROR')
+
+
+@pytest.mark.skipif('SINKS_REQUIRED' in os.environ, reason='SINKS_REQUIRED가 설정된 환경')
+def test_only_json_sink_is_required_by_default():
+    # Notion/DB 실패는 상태에만 기록하고 파이프라인(GitHub Actions 캐시 커밋)은 계속 진행
+    assert {name for name, sink in main.SINKS.items() if sink.required} == {'json'}
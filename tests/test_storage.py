@@ -0,0 +1,119 @@
+import os
+
+import pytest
+
+import storage
+from prayer_record import PrayerRecord
+
+
+def _prayers(*rows):
+    """(제출자, 대상자, 기도제목) 목록 → {제출자: [PrayerRecord]}"""
+    prayers_by_requester = {}
+    for name, target_name, content in rows:
+        prayers_by_requester.setdefault(name, []).append(
+            PrayerRecord(name, target_name, relationship='가족', prayer_content=content)
+        )
+    return prayers_by_requester
+
+
+def _rows_by_key(prayers_by_requester) -> dict:
+    return {row[0]: row for row in storage._prayer_sync_rows(prayers_by_requester)}
+
+
+# ── 동기화 행 / COPY 버퍼 ──
+
+def test_record_key_is_stable_when_content_changes():
+    before = _rows_by_key(_prayers(('김하늘', '김가족', '건강'), ('박산', '박가족', '직장')))
+    after = _rows_by_key(_prayers(('김하늘', '김가족', '건강 회복'), ('박산', '박가족', '직장')))
+
+    assert before.keys() == after.keys()
+    changed = [key for key in before if before[key][1] != after[key][1]]
+    assert [before[key][2:] for key in changed] == [['김하늘', '김가족', '', '', '가족', '건강', '']]
+
+
+def test_record_key_numbers_repeated_targets_in_order():
+    rows = list(storage._prayer_sync_rows(_prayers(
+        ('김하늘', '김가족', '첫째'), ('김하늘', '김가족', '둘째'), ('김하늘', '', '셋째'), ('박산', '김가족', '넷째')
+    )))
+
+    keys = [row[0] for row in rows]
+    assert len(set(keys)) == 4
+    assert keys[0].split(':')[0] == keys[1].split(':')[0] and [keys[0][-2:], keys[1][-2:]] == [':1', ':2']
+    assert keys[3].split(':')[0] != keys[0].split(':')[0]
+
+
+def test_copy_buffer_escapes_copy_text_format():
+    prayers = _prayers(('김하늘', '김\t가족', '첫 줄\n둘째 줄\r\\끝\x00'))
+
+    buffer, count = storage._prayers_copy_buffer(prayers)
+
+    lines = buffer.getvalue().split('\n')
+    assert count == 1 and lines[1:] == ['']
+    assert lines[0].split('\t')[2:] == ['김하늘', '김\\t가족', '', '', '가족', '첫 줄\\n둘째 줄\\r\\\\끝', '']
+
+
+def test_copy_buffer_without_prayers_is_empty():
+    buffer, count = storage._prayers_copy_buffer({})
+
+    assert (buffer.getvalue(), count) == ('', 0)
+
+
+def test_group_records_sorts_requesters_like_processor():
+    from data_processor import _group_by_requester
+
+    rows = [('박산', '박산', '', '', '', '첫째', ''), ('김하늘', '김하늘', '', '', '', '건강', ''),
+            ('박산', '가족', '', '', '', '둘째', '')]
+    records = [PrayerRecord(*row) for row in rows]
+
+    grouped = storage._group_records(rows)
+
+    assert list(grouped) == list(_group_by_requester(records)['prayers_by_requester']) == ['김하늘', '박산']
+    assert [record.prayer_content for record in grouped['박산']] == ['첫째', '둘째']
+
+
+# ── PostgreSQL 통합 테스트 (TEST_DATABASE_URL이 있을 때만) ──
+
+@pytest.fixture
+def database(monkeypatch):
+    """비어 있는 테스트 DB에 연결 (테이블 내용을 지우므로 운영 DB를 지정하지 마세요)"""
+    url = os.getenv('TEST_DATABASE_URL')
+    if not url:
+        pytest.skip('TEST_DATABASE_URL이 없어 PostgreSQL 통합 테스트를 건너뜁니다.')
+    monkeypatch.setenv('DATABASE_URL', url)
+    storage.close_pool()
+    with storage.connection() as conn, conn.cursor() as cur:
+        cur.execute("TRUNCATE prayers, prayer_metadata RESTART IDENTITY")
+    yield
+    storage.close_pool()
+
+
+def _sync(prayers_by_requester, assignments=None) -> dict:
+    stats = storage.sync_prayers({'last_updated': '2026-01-01 09:00', 'prayers_by_requester': prayers_by_requester},
+                                 [], assignments or {})
+    return {key: stats[key] for key in ('rows', 'inserted', 'updated', 'deleted', 'unchanged')}
+
+
+def test_sync_prayers_counts_inserted_updated_deleted(database):
+    first = _prayers(('김하늘', '김가족', '건강'), ('박산', '박가족', '직장'), ('박산', '박친구', '믿음'))
+    second = _prayers(('김하늘', '김가족', '건강 회복'), ('박산', '박가족', '직장'), ('이바다', '이가족', '평안'))
+
+    assert _sync(first) == {'rows': 3, 'inserted': 3, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+    assert _sync(first) == {'rows': 3, 'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 3}
+    assert _sync(second, {'담당A': ['박산', '김하늘']}) == {
+        'rows': 3, 'inserted': 1, 'updated': 1, 'deleted': 1, 'unchanged': 1
+    }
+
+    snapshot = storage.load_snapshot()
+    assert snapshot['prayers_by_requester'] == second
+    assert snapshot['assignments'] == storage.fetch_assignments() == {'담당A': ['박산', '김하늘']}
+    assert storage.fetch_prayers_for_requesters(['박산', '김하늘']) == {
+        '박산': second['박산'], '김하늘': second['김하늘']
+    }
+
+
+def test_sync_prayers_round_trips_copy_escapes(database):
+    prayers = _prayers(('김하늘', '김\t가족', '첫 줄\n둘째 줄\r\\끝'))
+
+    _sync(prayers)
+
+    assert storage.fetch_requester_prayers('김하늘') == prayers['김하늘']
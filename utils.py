@@ -1,7 +1,8 @@
+import re
 import time
 import logging
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +127,69 @@ def sanitize_name(name: str) -> str:
     """이름 전용 정제 함수 (줄바꿈 제거)"""
     return sanitize_text(name, preserve_line_breaks=False)
 
+# ── 일괄 정제용 헬퍼 (sanitize_text와 결과 동일) ──
+# str.translate는 한글 등 비ASCII 문자열에서 문자마다 매핑을 조회하여 오히려 느리므로,
+# 해당 문자가 있을 때만 str.replace를 적용하는 방식으로 처리합니다.
+_INVISIBLE_CHARS = ('\u200b', '\ufeff')  # Zero-width space, Byte order mark
+_BLANK_LINE_RUN_PATTERN = re.compile(r'\n{3,}')
+
+# 이 길이 이하의 값(이름, 교회, 성별 등)은 배치 내에서 결과를 재사용
+_MEMO_MAX_LENGTH = 64
+
+def _remove_invisible_chars(text: str) -> str:
+    for ch in _INVISIBLE_CHARS:
+        if ch in text:
+            text = text.replace(ch, '')
+    return text
+
+def _sanitize_single_line(text: str) -> str:
+    # 줄바꿈 통일은 split()이 모든 공백을 구분자로 쓰므로 생략 가능
+    return ' '.join(_remove_invisible_chars(text).split())
+
+def _sanitize_multiline(text: str) -> str:
+    cleaned = _remove_invisible_chars(text)
+    if '\r' in cleaned:
+        cleaned = cleaned.replace('\r\n', '\n').replace('\r', '\n')
+    # 각 줄 앞뒤 공백 제거 후 맨 앞뒤 빈 줄 제거
+    cleaned = '\n'.join([line.strip() for line in cleaned.split('\n')]).strip()
+    # 연속된 빈 줄을 하나로 축소
+    if '\n\n\n' in cleaned:
+        cleaned = _BLANK_LINE_RUN_PATTERN.sub('\n\n', cleaned)
+    return cleaned
+
+def sanitize_many(values: Iterable[str], mode: str = 'text') -> List[str]:
+    """
+    값 목록(컬럼)을 한 번에 정제합니다. 결과는 값별로 기존 정제 함수를 호출한 것과 같습니다.
+
+    Args:
+        values: 정제할 문자열 목록 (None은 빈 문자열로 처리)
+        mode: 'name'   → sanitize_name과 동일
+              'text'   → sanitize_text와 동일 (줄바꿈 제거)
+              'prayer' → sanitize_prayer_content와 동일 (줄바꿈 보존)
+    """
+    if mode in ('name', 'text'):
+        sanitize = _sanitize_single_line
+    elif mode == 'prayer':
+        sanitize = _sanitize_multiline
+    else:
+        raise ValueError(f"알 수 없는 정제 모드입니다: {mode}")
+
+    memo = {}
+    result = []
+    append = result.append
+    for value in values:
+        if not value:
+            append("")
+            continue
+        if len(value) > _MEMO_MAX_LENGTH:
+            append(sanitize(value))
+            continue
+        cleaned = memo.get(value)
+        if cleaned is None:
+            cleaned = memo[value] = sanitize(value)
+        append(cleaned)
+    return result
+
 class PipelineError(Exception):
     """파이프라인 전용 예외 클래스"""
     pass